@@ -4,21 +4,68 @@ Workato SDK documentation fetcher with HTML to Markdown conversion.
 Adapted from claude-code-docs for Workato Connector SDK documentation.
 """
 
+from __future__ import annotations
+
+import argparse
+import bisect
+import difflib
+import gzip
 import hashlib
+import heapq
+import importlib
+import importlib.util
+import io
+import itertools
 import json
 import logging
 import os
+import random
 import re
 import sys
+import threading
 import time
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
+from xml.etree import ElementTree
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from workato_sdk_docs.documents import DOCUMENT_TITLE, PERMALINK_RE, document_body
+except ImportError:
+    # Run from a checkout that is not installed
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from workato_sdk_docs.documents import DOCUMENT_TITLE, PERMALINK_RE, document_body
+
+
+class _LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    ``requests``, ``bs4`` and ``html2text`` make up most of this module's
+    import time; deferring them keeps helpers such as ``url_to_filename``,
+    ``load_manifest`` and ``ChangeDetector`` cheap to import for tools that
+    never fetch or convert a page.
+    """
+
+    def __init__(self, name: str):
+        self.__name__ = name
+
+    def __getattr__(self, attr: str):
+        return getattr(importlib.import_module(self.__name__), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
 
-import html2text
-import requests
-from bs4 import BeautifulSoup
+bs4 = _LazyModule("bs4")
+html2text = _LazyModule("html2text")
+requests = _LazyModule("requests")
 
 
 # Custom exceptions for better error handling
@@ -37,7 +84,12 @@ class NetworkError(WorkatoSDKError):
 class HTTPError(WorkatoSDKError):
     """HTTP errors (4xx, 5xx responses)."""
 
-    pass
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after  # seconds the server asked us to wait
 
 
 class ParsingError(WorkatoSDKError):
@@ -58,6 +110,185 @@ class ContentError(WorkatoSDKError):
     pass
 
 
+# Line-diff tuning: edit distance at which a region is treated as rewritten,
+# the total edit distance explored per document, and the largest changed
+# region refined to character level
+MAX_DIFF_EDITS = 500
+MAX_DIFF_BUDGET = 2000
+MAX_CHAR_DIFF_SIZE = 2000
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#+)?\s*$")
+
+
+def _unique_anchors(
+    a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int
+) -> List[Tuple[int, int]]:
+    """Pair lines that occur exactly once on each side, keeping the longest in-order run.
+
+    This is the patience-diff anchoring step: the anchors split a region into
+    smaller regions that can be diffed independently.
+    """
+    a_counts = Counter(a[alo:ahi])
+    b_counts = Counter(b[blo:bhi])
+    b_index = {b[j]: j for j in range(blo, bhi) if b_counts[b[j]] == 1}
+    pairs = [(i, b_index[a[i]]) for i in range(alo, ahi) if a_counts[a[i]] == 1 and a[i] in b_index]
+
+    # Longest increasing subsequence of the b positions (patience sorting)
+    tails: List[int] = []
+    tail_pairs: List[int] = []
+    previous = [-1] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        pile = bisect.bisect_left(tails, j)
+        if pile:
+            previous[index] = tail_pairs[pile - 1]
+        if pile == len(tails):
+            tails.append(j)
+            tail_pairs.append(index)
+        else:
+            tails[pile] = j
+            tail_pairs[pile] = index
+
+    anchors = []
+    index = tail_pairs[-1] if tail_pairs else -1
+    while index != -1:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _myers_blocks(
+    a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int, max_edits: int
+) -> Tuple[List[Tuple[int, int, int]], int]:
+    """Return the matching blocks of a shortest edit script between two regions.
+
+    Also returns the edit distance explored. Gives up with no matches when the
+    regions differ by more than *max_edits* lines, so a rewritten region costs
+    a bounded amount of work.
+    """
+    n = ahi - alo
+    m = bhi - blo
+    v = {1: 0}
+    trace = []
+    for d in range(min(n + m, max_edits) + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                break
+        else:
+            continue
+        break
+    else:
+        return [], max_edits
+
+    # Walk the trace backwards, collecting the diagonal (matching) moves
+    blocks = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if d == 0:
+            prev_x = prev_y = 0
+        else:
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                prev_k = k + 1
+            else:
+                prev_k = k - 1
+            prev_x = v[prev_k]
+            prev_y = prev_x - prev_k
+        # The snake starts after the single edit that left (prev_x, prev_y)
+        start_x = prev_x if d == 0 else (prev_x if prev_k == k + 1 else prev_x + 1)
+        if x > start_x:
+            blocks.append((alo + start_x, blo + start_x - k, x - start_x))
+        x, y = prev_x, prev_y
+    return blocks, len(trace) - 1
+
+
+def diff_line_ids(a: List[int], b: List[int]) -> List[Tuple[str, int, int, int, int]]:
+    """Diff two sequences of line ids, returning the non-equal opcodes.
+
+    Opcodes follow ``difflib.SequenceMatcher.get_opcodes`` conventions:
+    ``(tag, i1, i2, j1, j2)`` with tag ``replace``, ``delete`` or ``insert``.
+    Common prefixes and suffixes are trimmed, unique lines anchor the regions
+    in between and only the remaining differing regions get an LCS pass.
+    Regions beyond the MAX_DIFF_EDITS / MAX_DIFF_BUDGET limits are reported
+    as replaced wholesale.
+    """
+    budget = MAX_DIFF_BUDGET
+    blocks = []
+    regions = [(0, len(a), 0, len(b))]
+    while regions:
+        alo, ahi, blo, bhi = regions.pop()
+        prefix = 0
+        while alo + prefix < ahi and blo + prefix < bhi and a[alo + prefix] == b[blo + prefix]:
+            prefix += 1
+        if prefix:
+            blocks.append((alo, blo, prefix))
+            alo += prefix
+            blo += prefix
+        suffix = 0
+        while (
+            alo < ahi - suffix and blo < bhi - suffix and a[ahi - 1 - suffix] == b[bhi - 1 - suffix]
+        ):
+            suffix += 1
+        if suffix:
+            blocks.append((ahi - suffix, bhi - suffix, suffix))
+            ahi -= suffix
+            bhi -= suffix
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+        if anchors:
+            for i, j in anchors:
+                blocks.append((i, j, 1))
+                regions.append((alo, i, blo, j))
+                alo, blo = i + 1, j + 1
+            regions.append((alo, ahi, blo, bhi))
+        elif budget > 0:
+            region_blocks, edits = _myers_blocks(
+                a, b, alo, ahi, blo, bhi, min(budget, MAX_DIFF_EDITS)
+            )
+            blocks.extend(region_blocks)
+            budget -= edits
+
+    opcodes = []
+    i = j = 0
+    for block_i, block_j, size in sorted(blocks) + [(len(a), len(b), 0)]:
+        if i < block_i and j < block_j:
+            opcodes.append(("replace", i, block_i, j, block_j))
+        elif i < block_i:
+            opcodes.append(("delete", i, block_i, j, block_j))
+        elif j < block_j:
+            opcodes.append(("insert", i, block_i, j, block_j))
+        i, j = block_i + size, block_j + size
+    return opcodes
+
+
+def section_headings(lines: List[str]) -> List[Tuple[int, str]]:
+    """Return ``(line_index, title)`` for each markdown heading outside code fences."""
+    headings = []
+    in_code_block = False
+    for index, line in enumerate(lines):
+        if line.lstrip().startswith("```"):
+            in_code_block = not in_code_block
+        elif not in_code_block and line.startswith("#"):
+            match = _HEADING_RE.match(line)
+            title = PERMALINK_RE.sub("", match.group(2)).strip(" #") if match else ""
+            if title:
+                headings.append((index, title))
+    return headings
+
+
 class ChangeDetector:
     """Detects meaningful changes in documentation content."""
 
@@ -69,43 +300,100 @@ class ChangeDetector:
         """
         Detect if content has meaningfully changed.
 
+        Lines are diffed first; changed regions small enough are then compared
+        character by character, so the ratio reflects how much text changed
+        rather than how much the length moved.
+
         Returns:
-            Dict with keys: 'changed', 'change_ratio', 'details'
+            Dict with keys: 'changed', 'change_ratio', 'details',
+            'changed_ranges' (non-equal line opcodes, see diff_line_ids) and
+            'changed_headings' (headings of the sections the changes fall in)
         """
         # Handle empty content cases
         old_empty = not old_content or old_content.strip() == ""
         new_empty = not new_content or new_content.strip() == ""
 
         if old_empty and new_empty:
-            return {"changed": False, "change_ratio": 0.0, "details": "Both empty"}
-        elif old_empty or new_empty:
-            return {"changed": True, "change_ratio": 1.0, "details": "One side empty"}
-
-        # Calculate differences
-        old_len = len(old_content)
-        new_len = len(new_content)
+            return {
+                "changed": False,
+                "change_ratio": 0.0,
+                "details": "Both empty",
+                "changed_ranges": [],
+                "changed_headings": [],
+            }
 
-        # Simple length-based change detection
-        length_diff = abs(new_len - old_len)
-        max_len = max(old_len, new_len)
+        old_lines = (old_content or "").split("\n")
+        new_lines = (new_content or "").split("\n")
+        line_ids: Dict[str, int] = {}
+        opcodes = diff_line_ids(
+            [line_ids.setdefault(line, len(line_ids)) for line in old_lines],
+            [line_ids.setdefault(line, len(line_ids)) for line in new_lines],
+        )
+        changed_headings = self._changed_headings(old_lines, new_lines, opcodes)
 
-        if max_len == 0:
-            return {"changed": False, "change_ratio": 0.0, "details": "Empty content"}
+        if old_empty or new_empty:
+            return {
+                "changed": True,
+                "change_ratio": 1.0,
+                "details": "One side empty",
+                "changed_ranges": opcodes,
+                "changed_headings": changed_headings,
+            }
 
-        change_ratio = length_diff / max_len
+        changed_chars = sum(
+            self._changed_chars("\n".join(old_lines[i1:i2]), "\n".join(new_lines[j1:j2]))
+            for _, i1, i2, j1, j2 in opcodes
+        )
+        change_ratio = min(changed_chars / max(len(old_content), len(new_content)), 1.0)
 
         # Check if change is significant enough
         significant = (
             change_ratio >= self.min_significant_change_ratio
-            or length_diff >= self.min_content_change_threshold
+            or changed_chars >= self.min_content_change_threshold
         )
 
         return {
             "changed": significant,
             "change_ratio": change_ratio,
-            "details": f"Length diff: {length_diff}, ratio: {change_ratio:.3f}",
+            "details": (
+                f"Changed chars: {changed_chars}, ratio: {change_ratio:.3f}, "
+                f"regions: {len(opcodes)}"
+            ),
+            "changed_ranges": opcodes,
+            "changed_headings": changed_headings,
         }
 
+    @staticmethod
+    def _changed_chars(old_text: str, new_text: str) -> int:
+        """Count the characters that differ between two changed regions."""
+        if not old_text or not new_text or len(old_text) + len(new_text) > MAX_CHAR_DIFF_SIZE:
+            return max(len(old_text), len(new_text)) or 1
+        matcher = difflib.SequenceMatcher(None, old_text, new_text, autojunk=False)
+        return sum(
+            max(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"
+        )
+
+    @staticmethod
+    def _changed_headings(
+        old_lines: List[str], new_lines: List[str], opcodes: List[Tuple[str, int, int, int, int]]
+    ) -> List[str]:
+        """Return the headings of every section touched by *opcodes*, in order."""
+        old_headings = section_headings(old_lines)
+        new_headings = section_headings(new_lines)
+        new_positions = [index for index, _ in new_headings]
+        titles: Dict[str, None] = {}
+        for _, i1, i2, j1, j2 in opcodes:
+            # The section the change starts in, then any heading inside the change
+            first = max(bisect.bisect_right(new_positions, j1) - 1, 0)
+            for index, title in new_headings[first:]:
+                if index >= max(j2, j1 + 1):
+                    break
+                titles.setdefault(title)
+            for index, title in old_headings:
+                if i1 <= index < i2:
+                    titles.setdefault(title)
+        return list(titles)
+
     def should_update_file(
         self,
         filename: str,
@@ -132,70 +420,121 @@ class ChangeDetector:
 
 # Retry configuration
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_INLINE_RETRIES = 1  # retries before a page is deferred to the end of the run
 DEFAULT_BASE_DELAY = 2.0  # seconds
 DEFAULT_MAX_DELAY = 30.0  # seconds
+DEFAULT_RETRY_BUDGET = 120.0  # total seconds a run may spend waiting to retry
 
+# Client errors worth retrying; every other 4xx (404 above all) is final
+RETRYABLE_CLIENT_STATUS_CODES = frozenset({408, 425, 429})
 
-def retry_with_backoff(
-    max_retries: int = DEFAULT_MAX_RETRIES,
-    base_delay: float = DEFAULT_BASE_DELAY,
-    max_delay: float = DEFAULT_MAX_DELAY,
-    backoff_factor: float = 2.0,
-):
-    """
-    Decorator for retrying functions with exponential backoff.
-
-    Args:
-        max_retries: Maximum number of retry attempts
-        base_delay: Initial delay in seconds
-        max_delay: Maximum delay between retries
-        backoff_factor: Multiplier for delay on each retry
-    """
-    # Skip retries entirely in test environment for speed
-    if os.environ.get("PYTEST_CURRENT_TEST"):
-        return lambda func: func
-
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            last_exception = None
-            delay = base_delay
-
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except (NetworkError, HTTPError) as e:
-                    last_exception = e
-                    if attempt == max_retries:
-                        logger.warning(f"Max retries ({max_retries}) exceeded for {func.__name__}")
-                        break
 
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
-                    time.sleep(delay)
-                    delay = min(delay * backoff_factor, max_delay)
-                except Exception as e:
-                    # Don't retry for non-network errors
-                    logger.error(f"Non-retryable error in {func.__name__}: {e}")
-                    raise
+class RetryPolicy:
+    """
+    Retry rules shared by every request of a run.
+
+    Connection errors, 5xx responses and 408/425/429 are retried; other client
+    errors fail immediately. Delays use decorrelated jitter (each delay is drawn
+    between ``base_delay`` and three times the previous one, capped at
+    ``max_delay``) and never undercut a Retry-After. All waits come out of one
+    ``budget`` of seconds, which bounds how long a flaky upstream can stretch
+    a run.
+    """
 
-            if last_exception:
-                raise last_exception
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        budget: float = DEFAULT_RETRY_BUDGET,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retries = 0
+        self.retry_seconds = 0.0
+        self.budget_exhausted = 0
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Return True if another attempt could plausibly succeed."""
+        if isinstance(error, NetworkError):
+            return True
+        if isinstance(error, HTTPError):
+            status = error.status_code
+            return status is None or status >= 500 or status in RETRYABLE_CLIENT_STATUS_CODES
+        return False
+
+    def next_delay(self, previous: float, retry_after: Optional[float] = None) -> float:
+        """Draw the next decorrelated-jitter delay after one of ``previous`` seconds."""
+        delay = min(
+            self.max_delay, self._rng.uniform(self.base_delay, max(self.base_delay, previous * 3))
+        )
+        return max(delay, retry_after or 0.0)
+
+    def _reserve(self, delay: float) -> bool:
+        with self._lock:
+            if self.retry_seconds + delay > self.budget:
+                self.budget_exhausted += 1
+                return False
+            self.retry_seconds += delay
+            self.retries += 1
+            return True
 
-        return wrapper
+    def call(self, func: Callable, *args, max_retries: Optional[int] = None, **kwargs):
+        """
+        Call ``func`` until it succeeds, retrying retryable errors.
 
-    return decorator
+        Args:
+            max_retries: Overrides the policy's retry count for this call
+
+        Raises:
+            The last error once retries or the run's retry budget are used up
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        delay = self.base_delay
+        for attempt in range(max_retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except WorkatoSDKError as e:
+                if not self.is_retryable(e) or attempt == max_retries:
+                    raise
+                delay = self.next_delay(delay, getattr(e, "retry_after", None))
+                if not self._reserve(delay):
+                    logger.warning(f"Retry budget of {self.budget:g}s used up, not retrying: {e}")
+                    raise
+                logger.warning(
+                    f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                time.sleep(delay)
+
+    def state(self) -> Dict:
+        """Retry counters, for fetch_metadata."""
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retry_seconds": round(self.retry_seconds, 1),
+                "budget_seconds": self.budget,
+                "budget_exhausted": self.budget_exhausted,
+            }
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
+
+def configure_logging() -> None:
+    """Set up console logging; called by ``main`` rather than at import time."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
 # Base URL for Workato documentation
 BASE_URL = "https://docs.workato.com"
 SDK_BASE_PATH = "/en/developing-connectors/sdk"
@@ -419,27 +758,554 @@ SDK_ENTRY_POINTS = [
     "https://docs.workato.com/en/developing-connectors/sdk/platform-quickstart.html",
 ]
 
+# Sitemap listing every docs page with its <lastmod> date (used by --sitemap)
+SITEMAP_URL = f"{BASE_URL}/sitemap.xml"
+
+
+def accept_encoding() -> str:
+    """Return the content codings the HTTP client can decode (brotli when installed)."""
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi")):
+        encodings.insert(0, "br")
+    return ", ".join(encodings)
+
+
 # Headers to identify the script
 HEADERS = {
     "User-Agent": "Workato-SDK-Docs-Fetcher/1.0",
     "Accept": "text/html,application/xhtml+xml",
     "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": accept_encoding(),
 }
 
-# Retry configuration
-MAX_RETRIES = 3
-RETRY_DELAY = 2  # initial delay in seconds
-MAX_RETRY_DELAY = 30  # maximum delay in seconds
-RATE_LIMIT_DELAY = 1.0  # seconds between requests
-
-# Manifest file
+# Concurrency configuration
+DEFAULT_WORKERS = 4  # concurrent fetch workers
+DEFAULT_REQUESTS_PER_SECOND = 4.0  # starting request rate shared by all workers
+
+# Adaptive rate limiting: the rate grows additively while responses are fast
+# and is cut multiplicatively when the server throttles or fails
+MIN_REQUESTS_PER_SECOND = 0.5
+DEFAULT_MAX_REQUESTS_PER_SECOND = 16.0
+RATE_INCREASE_STEP = 0.5  # requests/s added per fast response
+RATE_DECREASE_FACTOR = 0.5  # rate multiplier on throttling
+LATENCY_TARGET = 1.0  # seconds; slower responses stop the ramp-up
+MAX_RETRY_AFTER = 120.0  # longest Retry-After pause honoured, in seconds
+THROTTLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Manifest file, its append-only update journal and how many journal
+# records accumulate before they are folded back into the manifest
 MANIFEST_FILE = "docs_manifest.json"
+MANIFEST_JOURNAL_FILE = "docs_manifest.journal.jsonl"
+DEFAULT_MANIFEST_COMPACT_EVERY = 1000
+
+# Progress of an unfinished run, saved every N completed pages for --resume
+CHECKPOINT_FILE = "docs_manifest.checkpoint.json"
+DEFAULT_CHECKPOINT_EVERY = 10
+DEFAULT_RESUME_WINDOW_HOURS = 24.0
+
+# Default output directory
+DOCS_DIR = Path(__file__).parent.parent / "docs"
+
+# Raw HTML response cache
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "html"
+DEFAULT_CACHE_MAX_MB = 200
+
+
+class _HttpxResponse:
+    """The subset of ``requests.Response`` the fetcher uses, backed by httpx."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self._raw = None
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+
+    @property
+    def raw(self) -> io.BytesIO:
+        if self._raw is None:
+            self._raw = io.BytesIO(self._response.content)
+        return self._raw
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error for {self.url}", response=self)
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class HttpxSession:
+    """
+    HTTP/2 client exposing the ``requests.Session.get`` interface the fetcher uses.
+
+    One multiplexed connection per host replaces the pool of HTTP/1.1
+    connections. httpx errors are re-raised as their ``requests`` equivalents
+    so callers handle both transports the same way.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        import httpx
+
+        self._httpx = httpx
+        self.client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            headers={"Accept-Encoding": HEADERS["Accept-Encoding"]},
+            limits=httpx.Limits(max_connections=workers, max_keepalive_connections=workers),
+        )
+
+    def get(self, url: str, headers=None, timeout=None, stream: bool = False) -> _HttpxResponse:
+        try:
+            return _HttpxResponse(self.client.get(url, headers=headers, timeout=timeout))
+        except self._httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self) -> "HttpxSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def create_session(workers: int = DEFAULT_WORKERS, http2: bool = False):
+    """
+    Create the HTTP session shared by all fetch workers.
+
+    The requests session gets a connection pool sized to the worker count, so
+    every worker reuses a kept-alive connection instead of reconnecting (the
+    default pool holds 10). With ``http2`` an httpx client is used when httpx
+    and h2 are installed, falling back to requests otherwise.
+    """
+    if http2:
+        try:
+            return HttpxSession(workers)
+        except ImportError as e:
+            logger.warning(f"HTTP/2 unavailable ({e}), install httpx[http2]; using HTTP/1.1")
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=max(workers, 1), pool_block=True
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {"Accept-Encoding": HEADERS["Accept-Encoding"], "Connection": "keep-alive"}
+    )
+    return session
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the request rate across all fetch workers."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Tokens are reserved under the lock and the wait happens outside it, so
+        callers are served in arrival order without busy-waiting.
+
+        Returns:
+            Seconds the caller had to wait
+        """
+        with self._lock:
+            now = self._refill()
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._pause_until(now))
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def _refill(self) -> float:
+        # Callers hold the lock
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        return now
+
+    def _pause_until(self, now: float) -> float:
+        return 0.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        # email.utils pulls in socket and calendar; only HTTP dates need it
+        from email.utils import parsedate_to_datetime
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            return None
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket whose rate follows server feedback (AIMD).
+
+    Every fast, successful response adds ``increase`` requests/s up to
+    ``max_rate``; a throttling response (429/5xx) or a connection failure
+    multiplies the rate by ``decrease`` down to ``min_rate``. A Retry-After
+    header pauses all callers until it has passed.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: float = MIN_REQUESTS_PER_SECOND,
+        max_rate: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+        increase: float = RATE_INCREASE_STEP,
+        decrease: float = RATE_DECREASE_FACTOR,
+        latency_target: float = LATENCY_TARGET,
+    ):
+        super().__init__(rate, capacity)
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max(max_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.initial_rate = rate
+        self.peak_rate = rate
+        self.backoffs = 0
+        self.retry_after_pauses = 0
+        self._paused_until = 0.0
+
+    def _pause_until(self, now: float) -> float:
+        return max(0.0, self._paused_until - now)
+
+    def record_success(self, latency: float) -> None:
+        """Ramp the rate up after a response that arrived within the latency target."""
+        if latency > self.latency_target:
+            return
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self.peak_rate = max(self.peak_rate, self.rate)
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """Back off after throttling or a failed connection, honouring Retry-After."""
+        with self._lock:
+            now = self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+            self.backoffs += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+                self.retry_after_pauses += 1
+            rate = self.rate
+        logger.warning(
+            f"Server pushback, slowing to {rate:.2f} requests/s"
+            f"{f' and pausing {retry_after:.0f}s' if retry_after else ''}"
+        )
+
+    def observe(self, status_code: int, latency: float, retry_after: Optional[float] = None):
+        """Feed one response back into the limiter."""
+        if status_code in THROTTLE_STATUS_CODES:
+            self.record_failure(retry_after)
+        elif status_code < 400:
+            self.record_success(latency)
+
+    def state(self) -> Dict:
+        """Current rate and backoff counters, for fetch_metadata."""
+        with self._lock:
+            return {
+                "initial_rate": self.initial_rate,
+                "final_rate": round(self.rate, 3),
+                "peak_rate": round(self.peak_rate, 3),
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "backoffs": self.backoffs,
+                "retry_after_pauses": self.retry_after_pauses,
+            }
+
+
+class HTMLCache:
+    """
+    Content-addressed, gzip-compressed store of raw HTML responses.
+
+    Bodies are stored once per sha256 under ``objects/``; ``index.json`` maps
+    each URL to the sha256 of its latest body (plus its HTTP validators), so
+    converter changes can be replayed offline with ``--from-cache``.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.objects_dir = cache_dir / "objects"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        index_path = self.cache_dir / self.INDEX_FILE
+        if index_path.exists():
+            try:
+                return json.loads(index_path.read_text())
+            except Exception as e:
+                logger.warning(f"Failed to load HTML cache index: {e}")
+        return {}
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def put(self, url: str, html: str, validators: Optional[Dict] = None) -> str:
+        """Store a response body for ``url`` and return its sha256."""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = object_path.with_name(f"{digest}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(gzip.compress(data))
+            temp_path.replace(object_path)
+
+        with self._lock:
+            self.index[url] = {
+                "sha256": digest,
+                "size": object_path.stat().st_size,
+                "stored_at": datetime.now().isoformat(),
+                **(validators or {}),
+            }
+        return digest
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached body for ``url``, or None if missing or corrupt."""
+        entry = self.index.get(url)
+        if not entry:
+            return None
+        try:
+            data = gzip.decompress(self._object_path(entry["sha256"]).read_bytes())
+        except (OSError, EOFError) as e:
+            logger.warning(f"Unreadable cache object for {url}: {e}")
+            return None
+        if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+            logger.warning(f"Cache object checksum mismatch for {url}")
+            return None
+        return data.decode("utf-8")
+
+    def load_page(self, url: str, validators: Optional[Dict] = None) -> Dict:
+        """Return a cached page in the same shape as download_page()."""
+        html = self.get(url)
+        if html is None:
+            raise ContentError(f"No cached HTML for {url}")
+        entry = self.index[url]
+        cached_validators = {key: entry[key] for key in ("etag", "last_modified") if entry.get(key)}
+        return {"url": url, "html": html, "validators": cached_validators}
+
+    def evict(self) -> int:
+        """
+        Delete objects until the cache fits in ``max_bytes``.
+
+        Objects no URL points to any more go first (oldest first), then the
+        least recently stored URLs. Returns the number of objects removed.
+        """
+        if not self.objects_dir.exists():
+            return 0
+
+        last_used: Dict[str, str] = {}
+        for entry in self.index.values():
+            last_used[entry["sha256"]] = max(entry["stored_at"], last_used.get(entry["sha256"], ""))
+
+        objects = []
+        total = 0
+        for path in self.objects_dir.glob("*/*.html.gz"):
+            stat = path.stat()
+            digest = path.name.split(".", 1)[0]
+            total += stat.st_size
+            # Unreferenced objects sort before referenced ones
+            objects.append((digest in last_used, last_used.get(digest, ""), stat.st_mtime, path))
+
+        removed = 0
+        for referenced, _, _, path in sorted(objects):
+            if total <= self.max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink()
+            removed += 1
+            if referenced:
+                digest = path.name.split(".", 1)[0]
+                self.index = {u: e for u, e in self.index.items() if e["sha256"] != digest}
+
+        if removed:
+            logger.info(f"Evicted {removed} objects from HTML cache")
+        return removed
+
+    def flush(self) -> None:
+        """Apply size-based eviction and persist the index."""
+        self.evict()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        index_path = self.cache_dir / self.INDEX_FILE
+        temp_path = index_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(self.index, indent=2, sort_keys=True))
+        temp_path.replace(index_path)
+
+
+def default_html_parser() -> str:
+    """Return the fastest BeautifulSoup parser backend that is installed."""
+    try:
+        import lxml  # noqa: F401
+
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+# Characters BeautifulSoup escapes when serialising text, mapped to entity names
+_TEXT_ENTITIES = {"&": "amp", "<": "lt", ">": "gt"}
+_TEXT_ENTITY_RE = re.compile(r"[&<>]")
+
+# Elements whose text html.parser passes through as raw CDATA
+_CDATA_ELEMENTS = frozenset(["script", "style"])
+
+# html2text's mark_code delimiters around <pre> blocks
+_CODE_OPEN = "[code]"
+_CODE_CLOSE = "[/code]"
+
+# Matches lines made only of whitespace, using the same definition as ``\s``
+_BLANK_LINE_RE = re.compile(r"\s*")
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Yield the ``\\n``-separated lines of *text* without building a list."""
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _fence_code(content: str) -> str:
+    """Wrap a ``[code]`` block body in a fenced block with a language hint."""
+    stripped = content.strip()
+    # Shell snippets start with a prompt or comment; everything else is connector Ruby
+    language = "bash" if stripped.startswith(("$", "#")) else "ruby"
+    return f"```{language}\n{content}\n```"
+
+
+def stream_markdown(lines: Iterator[str], strip_leading_blank_lines: bool = False) -> Iterator[str]:
+    """Clean up converted markdown lines in one pass, yielding output chunks.
+
+    Every run of whitespace-only lines collapses to a single empty line. This
+    applies inside fenced blocks too, exactly as the document-wide newline and
+    whitespace substitutions this replaces did, so fences need no state of
+    their own. ``[code]``/``[/code]`` pairs become fenced blocks; only the body
+    of an open pair is buffered, because a pair that is never closed stays
+    literal. Unpaired ``[/code]`` markers are dropped.
+    """
+    in_blank_run = strip_leading_blank_lines
+    code_body: Optional[List[str]] = None
+    separator = ""
+
+    for line in lines:
+        if _BLANK_LINE_RE.fullmatch(line):
+            if in_blank_run:
+                continue
+            in_blank_run = True
+            line = ""
+        else:
+            in_blank_run = False
+
+        text = separator + line
+        separator = "\n"
+        pos = 0
+        while True:
+            if code_body is None:
+                open_at = text.find(_CODE_OPEN, pos)
+                close_at = text.find(_CODE_CLOSE, pos)
+                if close_at != -1 and (open_at == -1 or close_at < open_at):
+                    yield text[pos:close_at]
+                    pos = close_at + len(_CODE_CLOSE)
+                elif open_at != -1:
+                    yield text[pos:open_at]
+                    code_body = []
+                    pos = open_at + len(_CODE_OPEN)
+                else:
+                    yield text[pos:]
+                    break
+            else:
+                close_at = text.find(_CODE_CLOSE, pos)
+                if close_at == -1:
+                    code_body.append(text[pos:])
+                    break
+                code_body.append(text[pos:close_at])
+                yield _fence_code("".join(code_body))
+                code_body = None
+                pos = close_at + len(_CODE_CLOSE)
+
+    if code_body is not None:
+        yield _CODE_OPEN
+        yield from code_body
+
+
+def document_header_lines(source_url: str, fetched: str) -> List[str]:
+    """Return the header lines written above every document body."""
+    return [
+        DOCUMENT_TITLE,
+        "",
+        f"> **Source**: {source_url}",
+        f"> **Fetched**: {fetched}",
+        "",
+        "---",
+        "",
+    ]
+
+
+def render_document(body: str, source_url: str, fetched: Optional[str] = None) -> str:
+    """Prepend the source/fetch-time header to a body from ``include_header=False``."""
+    header = "\n".join(document_header_lines(source_url, fetched or datetime.now().isoformat()))
+    return f"{header}\n{body}" if body else header
+
+
+def body_hash(body: str) -> str:
+    """Return the content hash of a document body."""
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
 
 
 class WorkatoDocsConverter:
     """Converts Workato HTML documentation to Markdown."""
 
-    def __init__(self):
+    def __init__(self, parser: Optional[str] = None):
+        # BeautifulSoup backend: lxml when installed, html.parser otherwise
+        self.parser = parser or default_html_parser()
+
         # Configure html2text
         self.h2t = html2text.HTML2Text()
         self.h2t.body_width = 0  # No line wrapping
@@ -451,10 +1317,17 @@ class WorkatoDocsConverter:
         self.h2t.images_to_alt = False
         self.h2t.mark_code = True
 
-    def extract_main_content(self, html: str) -> str:
-        """Extract the main content area from Workato documentation HTML."""
-        soup = BeautifulSoup(html, "html.parser")
+    def parse_html(self, html: str) -> bs4.BeautifulSoup:
+        """Parse a page once; the tree can be shared by link and content extraction."""
+        return bs4.BeautifulSoup(html, self.parser)
+
+    def select_main_content(self, soup: bs4.BeautifulSoup) -> bs4.element.Tag:
+        """
+        Locate the main content node in a parsed page.
 
+        When no known content container exists, navigation, scripts and
+        sidebars are removed from ``soup`` in place.
+        """
         # Try to find the main content area (adjust selectors based on actual structure)
         main_content = None
 
@@ -492,93 +1365,133 @@ class WorkatoDocsConverter:
             # Try to find any remaining content
             main_content = soup.find("body") or soup
 
-        return str(main_content)
+        return main_content
 
-    def html_to_markdown(self, html: str, url: str) -> str:
-        """Convert HTML content to Markdown format."""
-        # Extract main content
-        main_html = self.extract_main_content(html)
+    def extract_main_content(self, html: str) -> str:
+        """Extract the main content area from Workato documentation HTML."""
+        return str(self.select_main_content(self.parse_html(html)))
 
-        # Convert to markdown
-        markdown = self.h2t.handle(main_html)
+    def tree_to_markdown(self, node: bs4.element.Tag) -> str:
+        """
+        Run html2text directly over a parsed tree.
 
-        # Post-process markdown
-        markdown = self.post_process_markdown(markdown, url)
+        Instead of serialising ``node`` and letting html2text re-tokenise the
+        string, the tree is walked and the same start tag / end tag / data /
+        entity events the tokeniser would produce are fed to html2text's
+        handlers, so the output matches ``self.h2t.handle(str(node))``.
+        """
+        h2t = self.h2t
+        h2t.start = True
+        pending_text: List[str] = []
+        Tag, PreformattedString = bs4.element.Tag, bs4.element.PreformattedString
+
+        def flush_text() -> None:
+            # Adjacent strings serialise as one run of text, so emit them together
+            if not pending_text:
+                return
+            text = "".join(pending_text)
+            pending_text.clear()
+            position = 0
+            for match in _TEXT_ENTITY_RE.finditer(text):
+                if match.start() > position:
+                    h2t.handle_data(text[position : match.start()])
+                h2t.handle_entityref(_TEXT_ENTITIES[match.group()])
+                position = match.end()
+            if position < len(text):
+                h2t.handle_data(text[position:])
+
+        # Iterative walk: (node, closing) pairs; closing=True emits the end tag
+        if isinstance(node, bs4.BeautifulSoup):
+            stack = [(child, False) for child in reversed(node.contents)]
+        else:
+            stack = [(node, False)]
+        while stack:
+            current, closing = stack.pop()
+            if closing:
+                flush_text()
+                h2t.handle_endtag(current.name)
+            elif isinstance(current, Tag):
+                flush_text()
+                attrs = [
+                    (name, " ".join(value) if isinstance(value, list) else value)
+                    for name, value in current.attrs.items()
+                ]
+                h2t.handle_starttag(current.name, attrs)
+                if current.is_empty_element:
+                    h2t.handle_endtag(current.name)
+                else:
+                    stack.append((current, True))
+                    stack.extend((child, False) for child in reversed(current.contents))
+            elif isinstance(current, PreformattedString):
+                # Comments, doctypes, CDATA and processing instructions produce no text
+                flush_text()
+            elif current.parent is not None and current.parent.name in _CDATA_ELEMENTS:
+                flush_text()
+                h2t.handle_data(str(current))
+            else:
+                pending_text.append(str(current))
+        flush_text()
 
+        markdown = h2t.optwrap(h2t.finish())
+        if h2t.pad_tables:
+            markdown = html2text.utils.pad_tables_in_text(markdown)
         return markdown
 
-    def post_process_markdown(self, markdown: str, source_url: str) -> str:
-        """Clean up and enhance the converted markdown."""
-        lines = markdown.split("\n")
-        processed_lines = []
-
-        # Add header with source URL
-        processed_lines.append("# Workato SDK Documentation")
-        processed_lines.append("")
-        processed_lines.append(f"> **Source**: {source_url}")
-        processed_lines.append(f"> **Fetched**: {datetime.now().isoformat()}")
-        processed_lines.append("")
-        processed_lines.append("---")
-        processed_lines.append("")
-
-        # Process the content
-        in_code_block = False
-        for line in lines:
-            # Track code blocks
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-
-            # Skip empty lines at the beginning
-            if not processed_lines and not line.strip():
-                continue
-
-            # Clean up excessive whitespace (but preserve in code blocks)
-            if not in_code_block:
-                # Remove multiple consecutive empty lines
-                if line.strip() == "" and processed_lines and processed_lines[-1] == "":
-                    continue
-
-            processed_lines.append(line)
-
-        # Join and clean up
-        markdown = "\n".join(processed_lines)
+    def soup_to_markdown(
+        self, soup: bs4.BeautifulSoup, url: str, include_header: bool = True
+    ) -> str:
+        """Convert an already parsed page to Markdown format."""
+        markdown = self.tree_to_markdown(self.select_main_content(soup))
+        return self.post_process_markdown(markdown, url, include_header)
 
-        # Fix common conversion issues
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)  # Max 2 consecutive newlines
-        markdown = re.sub(
-            r"^\s+$", "", markdown, flags=re.MULTILINE
-        )  # Clean empty lines with spaces
-
-        # Replace [code] markers with proper markdown code blocks
-        def replace_code_block(match):
-            content = match.group(1)
-            # Check if this looks like a shell/bash command (starts with $ or #)
-            if content.strip().startswith("$") or content.strip().startswith("#"):
-                return f"```bash\n{content}\n```"
-            # Default to ruby for Workato SDK docs
-            return f"```ruby\n{content}\n```"
-
-        # Match [code] blocks that span multiple lines - fixed regex pattern
-        # The original pattern had issues with content containing brackets
-        markdown = re.sub(r"\[code\](.*?)\[/code\]", replace_code_block, markdown, flags=re.DOTALL)
-
-        # Clean up any remaining [/code] tags that might be orphaned
-        markdown = re.sub(r"\[/code\]", "", markdown)
+    def html_to_markdown(self, html: str, url: str, include_header: bool = True) -> str:
+        """Convert HTML content to Markdown format."""
+        return self.soup_to_markdown(self.parse_html(html), url, include_header)
 
-        # Handle inline code (single line between [code] tags)
-        markdown = re.sub(r"\[code\]\s*([^\n\[]+?)\s*\[/code\]", r"`\1`", markdown)
+    def post_process_markdown(
+        self, markdown: str, source_url: str, include_header: bool = True
+    ) -> str:
+        """Clean up and enhance the converted markdown.
 
-        return markdown
+        The document is cleaned in a single scan by :func:`stream_markdown`, so
+        only the chunks of the final result are ever materialised. Without the
+        header only the body is returned; see :func:`render_document`.
+        """
+        if not include_header:
+            return "".join(stream_markdown(iter_lines(markdown), strip_leading_blank_lines=True))
+        header = document_header_lines(source_url, datetime.now().isoformat())
+        return "".join(stream_markdown(itertools.chain(header, iter_lines(markdown))))
 
 
 class WorkatoSDKCrawler:
-    """Crawls Workato SDK documentation pages."""
+    """
+    Crawls Workato SDK documentation pages.
+
+    ``crawl_sdk_docs`` runs a concurrent frontier: URLs wait in a priority
+    queue ordered by link depth, ``workers`` threads fetch them, and every
+    host gets its own token bucket so concurrency never exceeds the polite
+    request rate for that host. A ``rate_limiter`` passed in is shared by
+    every host instead, so crawling and page downloads draw on one budget.
+    """
 
-    def __init__(self, session: requests.Session, converter: WorkatoDocsConverter):
+    def __init__(
+        self,
+        session: requests.Session,
+        converter: WorkatoDocsConverter,
+        workers: int = DEFAULT_WORKERS,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
         self.session = session
         self.converter = converter
+        self.workers = workers
+        self.requests_per_second = requests_per_second  # per host
         self.visited_urls = set()
         self.sdk_pages = []
+        self._lock = threading.Lock()
+        self._host_limiters: Dict[str, TokenBucket] = {}
+        self._rate_limiter = rate_limiter
+        self._local = threading.local()
 
     def is_sdk_url(self, url: str) -> bool:
         """Check if a URL is part of the SDK documentation."""
@@ -594,9 +1507,9 @@ class WorkatoSDKCrawler:
 
         return any(pattern in path for pattern in sdk_patterns)
 
-    def extract_links(self, html: str, base_url: str) -> List[str]:
-        """Extract all links from an HTML page."""
-        soup = BeautifulSoup(html, "html.parser")
+    def extract_links(self, html, base_url: str) -> List[str]:
+        """Extract all links from an HTML page (markup or an already parsed tree)."""
+        soup = html if isinstance(html, bs4.BeautifulSoup) else self.converter.parse_html(html)
         links = []
 
         for link in soup.find_all("a", href=True):
@@ -611,82 +1524,250 @@ class WorkatoSDKCrawler:
                 normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
                 links.append(normalized)
 
-        return list(set(links))  # Remove duplicates
+        return list(dict.fromkeys(links))  # Remove duplicates, keeping page order
 
-    def crawl_page(self, url: str) -> Optional[Dict]:
+    def crawl_page(
+        self, url: str, converter: Optional[WorkatoDocsConverter] = None
+    ) -> Optional[Dict]:
         """Crawl a single page and extract its content and links."""
-        if url in self.visited_urls:
-            return None
-
-        self.visited_urls.add(url)
+        with self._lock:
+            if url in self.visited_urls:
+                return None
+            self.visited_urls.add(url)
+        converter = converter or self.converter
         logger.info(f"Crawling: {url}")
 
+        limiter = self.host_limiter(url)
         try:
-            response = self.session.get(url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-
-            # Extract links for further crawling
-            links = self.extract_links(response.text, url)
+            started = time.monotonic()
+            try:
+                response = self.session.get(url, headers=HEADERS, timeout=30)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                # Throttling and dropped connections slow this host down; a 404 does not
+                failed = getattr(e, "response", None)
+                if failed is None:
+                    limiter.record_failure()
+                elif failed.status_code in THROTTLE_STATUS_CODES:
+                    limiter.record_failure(parse_retry_after(failed.headers.get("Retry-After")))
+                raise
+            limiter.record_success(time.monotonic() - started)
+
+            # Parse once; links are read before conversion prunes the tree
+            soup = converter.parse_html(response.text)
+            links = self.extract_links(soup, url)
 
             # Convert to markdown
-            markdown_content = self.converter.html_to_markdown(response.text, url)
+            markdown_content = converter.soup_to_markdown(soup, url)
 
             return {
                 "url": url,
                 "content": markdown_content,
                 "links": links,
-                "content_hash": hashlib.sha256(markdown_content.encode()).hexdigest(),
+                "content_hash": body_hash(document_body(markdown_content)),
             }
 
         except Exception as e:
             logger.error(f"Failed to crawl {url}: {e}")
             return None
 
-    def crawl_sdk_docs(self, max_depth: int = 3) -> List[Dict]:
-        """Crawl SDK documentation starting from entry points."""
-        pages_to_crawl = SDK_ENTRY_POINTS.copy()
-        crawled_pages = []
-        depth = 0
+    def host_limiter(self, url: str) -> AdaptiveRateLimiter:
+        """Return the token bucket that paces requests to *url*'s host."""
+        if self._rate_limiter is not None:
+            return self._rate_limiter
+        host = urlparse(url).netloc
+        with self._lock:
+            limiter = self._host_limiters.get(host)
+            if limiter is None:
+                limiter = AdaptiveRateLimiter(self.requests_per_second, capacity=1)
+                self._host_limiters[host] = limiter
+            return limiter
+
+    def _crawl_in_worker(self, url: str) -> Optional[Dict]:
+        # html2text keeps per-document state, so each worker thread converts with its own
+        converter = getattr(self._local, "converter", None)
+        if converter is None:
+            converter = WorkatoDocsConverter(parser=self.converter.parser)
+            self._local.converter = converter
+        self.host_limiter(url).acquire()
+        return self.crawl_page(url, converter)
+
+    def discover_from_sitemap(self, sitemap_url: str = SITEMAP_URL) -> Dict[str, Optional[str]]:
+        """
+        Discover SDK pages from the docs sitemap instead of crawling.
 
-        while pages_to_crawl and depth < max_depth:
-            next_batch = []
+        Returns:
+            Mapping of normalized SDK page URL to its ``<lastmod>`` value (or None)
+        """
+        pages: Dict[str, Optional[str]] = {}
+        for loc, lastmod in iter_sitemap(self.session, sitemap_url, self.host_limiter(sitemap_url)):
+            if not loc.startswith(BASE_URL) or not self.is_sdk_url(loc):
+                continue
+            parsed = urlparse(loc)
+            pages.setdefault(f"{parsed.scheme}://{parsed.netloc}{parsed.path}", lastmod)
+        logger.info(f"Sitemap lists {len(pages)} SDK pages")
+        return pages
+
+    def crawl_sdk_docs(self, max_depth: int = 3) -> List[Dict]:
+        """
+        Crawl SDK documentation starting from entry points.
 
-            for url in pages_to_crawl:
-                if url not in self.visited_urls:
-                    # Rate limiting
-                    time.sleep(RATE_LIMIT_DELAY)
+        Entry points are depth 0 and pages are crawled up to depth
+        ``max_depth - 1``. Links are queued as soon as their page has been
+        fetched, so workers never wait for a whole depth level to finish.
 
-                    page_data = self.crawl_page(url)
+        Returns:
+            Crawled pages ordered by depth, then discovery order
+        """
+        frontier: List[Tuple[int, int, str]] = []
+        queued = set()
+        order = itertools.count()
+
+        def enqueue(url: str, depth: int) -> None:
+            if depth < max_depth and url not in queued and url not in self.visited_urls:
+                queued.add(url)
+                heapq.heappush(frontier, (depth, next(order), url))
+
+        for url in SDK_ENTRY_POINTS:
+            enqueue(url, 0)
+
+        crawled = []
+        in_flight: Dict[Future, Tuple[int, int]] = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawl") as executor:
+            while frontier or in_flight:
+                while frontier and len(in_flight) < self.workers:
+                    depth, seq, url = heapq.heappop(frontier)
+                    in_flight[executor.submit(self._crawl_in_worker, url)] = (depth, seq)
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth, seq = in_flight.pop(future)
+                    page_data = future.result()
                     if page_data:
-                        crawled_pages.append(page_data)
-                        # Add discovered links to next batch
-                        next_batch.extend(page_data["links"])
+                        crawled.append((depth, seq, page_data))
+                        for link in page_data["links"]:
+                            enqueue(link, depth + 1)
+
+        crawled.sort(key=lambda item: item[:2])
+        deepest = crawled[-1][0] if crawled else 0
+        logger.info(f"Crawled {len(crawled)} pages (max depth reached: {deepest})")
+        return [page_data for _, _, page_data in crawled]
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def iter_sitemap(
+    session: requests.Session,
+    sitemap_url: str,
+    rate_limiter: Optional[TokenBucket] = None,
+    _depth: int = 0,
+) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Stream ``(loc, lastmod)`` pairs from a sitemap or sitemap index.
+
+    The response is parsed incrementally, so large sitemaps never sit in memory
+    whole. Gzipped sitemaps are detected by their magic bytes, and child
+    sitemaps of an index are followed (one level deep). Every request waits
+    for a ``rate_limiter`` token, like page downloads do.
+
+    Raises:
+        requests.RequestException: If a sitemap cannot be downloaded
+        ElementTree.ParseError: If a sitemap is not well-formed XML
+    """
+    logger.info(f"Reading sitemap: {sitemap_url}")
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+    adaptive = isinstance(rate_limiter, AdaptiveRateLimiter)
+    started = time.monotonic()
+    try:
+        response = session.get(sitemap_url, headers=HEADERS, timeout=30, stream=True)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        # Throttling and dropped connections slow the shared limiter down; a 404 does not
+        failed = getattr(e, "response", None)
+        if adaptive and failed is None:
+            rate_limiter.record_failure()
+        elif adaptive and failed.status_code in THROTTLE_STATUS_CODES:
+            rate_limiter.record_failure(parse_retry_after(failed.headers.get("Retry-After")))
+        if failed is not None:
+            failed.close()
+        raise
+    if adaptive:
+        rate_limiter.record_success(time.monotonic() - started)
+    try:
+        response.raw.decode_content = True
+        stream = io.BufferedReader(response.raw)
+        if stream.peek(2)[:2] == b"\x1f\x8b":
+            stream = gzip.GzipFile(fileobj=stream)
+
+        child_sitemaps = []
+        loc = lastmod = None
+        for _, element in ElementTree.iterparse(stream, events=("end",)):
+            name = _local_name(element.tag)
+            if name == "loc":
+                loc = (element.text or "").strip()
+            elif name == "lastmod":
+                lastmod = (element.text or "").strip() or None
+            elif name in ("url", "sitemap"):
+                if loc and name == "url":
+                    yield loc, lastmod
+                elif loc:
+                    child_sitemaps.append(loc)
+                loc = lastmod = None
+                element.clear()
+    finally:
+        response.close()
+
+    for child in child_sitemaps:
+        if _depth > 0:
+            logger.warning(f"Ignoring nested sitemap index entry: {child}")
+            continue
+        yield from iter_sitemap(session, child, rate_limiter, _depth + 1)
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse a W3C datetime (or plain date) as a naive local timestamp."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
 
-            # Move to next depth level
-            pages_to_crawl = list(set(next_batch) - self.visited_urls)
-            depth += 1
 
-            logger.info(f"Completed depth {depth}, found {len(pages_to_crawl)} new pages to crawl")
+def page_changed_since(entry: Optional[dict], lastmod: Optional[str]) -> bool:
+    """
+    Decide from a sitemap ``<lastmod>`` whether a page needs fetching.
 
-        return crawled_pages
+    Pages without a manifest entry or a usable ``lastmod`` are always fetched.
+    Entries remember the ``lastmod`` they were fetched at; older entries fall
+    back to comparing it with their ``last_updated`` time.
+    """
+    if not entry or not lastmod:
+        return True
+    if "lastmod" in entry:
+        return entry["lastmod"] != lastmod
+    modified = _parse_timestamp(lastmod)
+    updated = _parse_timestamp(entry.get("last_updated", ""))
+    if modified is None or updated is None:
+        return True
+    return modified > updated
 
 
 def load_manifest(docs_dir: Path) -> dict:
-    """Load the manifest of previously fetched files."""
-    manifest_path = docs_dir / MANIFEST_FILE
-    if manifest_path.exists():
-        try:
-            manifest = json.loads(manifest_path.read_text())
-            if "files" not in manifest:
-                manifest["files"] = {}
-            return manifest
-        except Exception as e:
-            logger.warning(f"Failed to load manifest: {e}")
-    return {"files": {}, "last_updated": None}
+    """Load the manifest of previously fetched files, including journaled updates."""
+    return ManifestStore(docs_dir).load()
 
 
 def save_manifest(docs_dir: Path, manifest: dict) -> None:
-    """Save the manifest of fetched files."""
+    """Save the manifest of fetched files.
+
+    The saved manifest is the complete state, so any pending journal is
+    discarded once the new manifest is in place.
+    """
     manifest_path = docs_dir / MANIFEST_FILE
     manifest["last_updated"] = datetime.now().isoformat()
 
@@ -700,7 +1781,179 @@ def save_manifest(docs_dir: Path, manifest: dict) -> None:
     manifest["description"] = "Workato SDK documentation manifest"
     manifest["source"] = "https://docs.workato.com"
 
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    # Write atomically so a crash never leaves a truncated manifest behind
+    temp_path = manifest_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(manifest, indent=2))
+    temp_path.replace(manifest_path)
+    (docs_dir / MANIFEST_JOURNAL_FILE).unlink(missing_ok=True)
+
+
+class ManifestStore:
+    """The manifest plus an append-only journal of per-file updates.
+
+    ``docs_manifest.json`` remains the published snapshot read by the helper
+    script. Entry updates are appended to a JSON Lines journal next to it as
+    they happen and folded into the snapshot by :meth:`compact`, either every
+    ``compact_every`` records or when the caller is done. Loading replays the
+    journal over the snapshot, so the updates of an interrupted run survive.
+    """
+
+    def __init__(self, docs_dir: Path, compact_every: int = DEFAULT_MANIFEST_COMPACT_EVERY):
+        self.docs_dir = docs_dir
+        self.manifest_path = docs_dir / MANIFEST_FILE
+        self.journal_path = docs_dir / MANIFEST_JOURNAL_FILE
+        self.compact_every = compact_every
+        self.manifest: dict = {"files": {}, "last_updated": None}
+        self.journal_records = 0
+        self._journal = None
+
+    def load(self) -> dict:
+        """Read the snapshot and replay the journal over it."""
+        manifest = {"files": {}, "last_updated": None}
+        if self.manifest_path.exists():
+            try:
+                manifest = json.loads(self.manifest_path.read_text())
+                if "files" not in manifest:
+                    manifest["files"] = {}
+            except Exception as e:
+                logger.warning(f"Failed to load manifest: {e}")
+                manifest = {"files": {}, "last_updated": None}
+
+        self.journal_records = 0
+        if self.journal_path.exists():
+            valid_bytes = 0
+            with self.journal_path.open("rb") as journal:
+                for line in journal:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("record has no line terminator")
+                        record = json.loads(line)
+                        op, filename = record["op"], record["file"]
+                        if op == "put":
+                            manifest["files"][filename] = record["entry"]
+                        elif op == "delete":
+                            manifest["files"].pop(filename, None)
+                    except (ValueError, KeyError, TypeError):
+                        # A torn final record from a crash mid-write
+                        logger.warning(f"Ignoring incomplete record in {self.journal_path.name}")
+                        break
+                    valid_bytes += len(line)
+                    self.journal_records += 1
+            if valid_bytes < self.journal_path.stat().st_size:
+                # Cut the torn tail so the next append starts on a fresh line
+                # instead of extending it, which would hide every later record
+                with self.journal_path.open("r+b") as journal:
+                    journal.truncate(valid_bytes)
+            if self.journal_records:
+                logger.info(f"Replayed {self.journal_records} journaled manifest updates")
+
+        self.manifest = manifest
+        return manifest
+
+    @property
+    def files(self) -> Dict[str, dict]:
+        """The current per-file entries."""
+        return self.manifest["files"]
+
+    def put(self, filename: str, entry: dict) -> None:
+        """Record the entry for *filename*; unchanged entries are not journaled."""
+        if self.files.get(filename) == entry:
+            return
+        self.files[filename] = entry
+        self._append({"op": "put", "file": filename, "entry": entry})
+
+    def delete(self, filename: str) -> None:
+        """Remove the entry for *filename*."""
+        if self.files.pop(filename, None) is not None:
+            self._append({"op": "delete", "file": filename})
+
+    def _append(self, record: dict) -> None:
+        if self._journal is None:
+            self._journal = self.journal_path.open("a", encoding="utf-8")
+        self._journal.write(json.dumps(record, separators=(",", ":")) + "\n")
+        # Flushed per record so a killed process keeps everything written so far
+        self._journal.flush()
+        self.journal_records += 1
+        if self.journal_records >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """Write the full manifest as the new snapshot and drop the journal."""
+        self.close()
+        save_manifest(self.docs_dir, self.manifest)
+        self.journal_records = 0
+
+    def sync(self) -> None:
+        """Force journaled updates to disk."""
+        if self._journal is not None:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+    def close(self) -> None:
+        """Close the journal without compacting it."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+class FetchCheckpoint:
+    """URLs completed by the current run, checkpointed so ``--resume`` can skip them.
+
+    Manifest entries are already journaled by the :class:`ManifestStore`; the
+    checkpoint syncs that journal and then records which URLs it covers and
+    how each one turned out, so a resumed run can report complete statistics.
+    """
+
+    def __init__(self, store: ManifestStore, every: int = DEFAULT_CHECKPOINT_EVERY):
+        self.store = store
+        self.path = store.docs_dir / CHECKPOINT_FILE
+        self.every = every
+        self.completed: Dict[str, dict] = {}
+        self._unsaved = 0
+
+    def load(self, window_hours: float) -> Dict[str, dict]:
+        """Return completed URLs recorded within the last *window_hours*."""
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path.name}: {e}")
+            return {}
+
+        cutoff = datetime.now() - timedelta(hours=window_hours)
+        self.completed = {
+            url: state
+            for url, state in data.get("completed", {}).items()
+            if datetime.fromisoformat(state["at"]) >= cutoff
+        }
+        return dict(self.completed)
+
+    def mark(self, url: str, status: str, changes: Optional[Dict] = None) -> None:
+        """Record *url* as done, saving a checkpoint every ``every`` URLs.
+
+        ``changes`` summarises an update for the changelog of a resumed run.
+        """
+        self.completed[url] = {"at": datetime.now().isoformat(), "status": status}
+        if changes is not None:
+            self.completed[url]["changes"] = changes
+        self._unsaved += 1
+        if self._unsaved >= self.every:
+            self.save()
+
+    def save(self) -> None:
+        """Sync the manifest journal, then atomically write the completed URLs."""
+        self.store.sync()
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"completed": self.completed}))
+        temp_path.replace(self.path)
+        self._unsaved = 0
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the run has finished."""
+        self.path.unlink(missing_ok=True)
+        self.completed = {}
+        self._unsaved = 0
 
 
 def url_to_filename(url: str) -> str:
@@ -769,25 +2022,79 @@ def save_markdown_file(docs_dir: Path, filename: str, content: str) -> str:
         raise ContentError(f"Failed to save {filename}: {e}")
 
 
-@retry_with_backoff()
-def fetch_page_content(
-    session: requests.Session, converter: WorkatoDocsConverter, url: str
-) -> Optional[Dict]:
-    """Fetch and convert a single page."""
+def conditional_headers(validators: Optional[Dict]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from stored validators."""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def response_validators(response) -> Dict[str, str]:
+    """Extract the ETag / Last-Modified validators from a response."""
+    validators = {}
+    etag = response.headers.get("ETag") or response.headers.get("etag")
+    last_modified = response.headers.get("Last-Modified") or response.headers.get("last-modified")
+    if etag:
+        validators["etag"] = etag
+    if last_modified:
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def download_page(
+    session: requests.Session,
+    url: str,
+    validators: Optional[Dict] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+) -> Dict:
+    """
+    Download a page's raw HTML without converting it, in a single attempt.
+
+    When ``validators`` (a manifest entry's ``etag``/``last_modified``) are given,
+    the request is conditional and a 304 response returns
+    ``{"url": url, "not_modified": True}``.
+
+    Every attempt, retries included, waits for a ``rate_limiter`` token; an
+    ``AdaptiveRateLimiter`` also gets each response's status and latency.
+    Retrying is left to a RetryPolicy.
+    """
     try:
         logger.info(f"Fetching: {url}")
-        response = session.get(url, headers=HEADERS, timeout=30)
+        request_headers = {**HEADERS, **conditional_headers(validators)}
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        adaptive = isinstance(rate_limiter, AdaptiveRateLimiter)
+        started = time.monotonic()
+        try:
+            response = session.get(url, headers=request_headers, timeout=30)
+        except requests.RequestException:
+            if adaptive:
+                rate_limiter.record_failure()
+            raise
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if adaptive:
+            rate_limiter.observe(response.status_code, time.monotonic() - started, retry_after)
+
+        # Unchanged since the last fetch, nothing to convert
+        if validators and response.status_code == 304:
+            logger.debug(f"Not modified: {url}")
+            return {"url": url, "not_modified": True}
 
         # Check HTTP status
         try:
             response.raise_for_status()
         except requests.HTTPError:
-            if response.status_code >= 500:
-                raise HTTPError(f"Server error {response.status_code} for {url}")
-            elif response.status_code >= 400:
-                raise HTTPError(f"Client error {response.status_code} for {url}")
+            status = response.status_code
+            if status >= 500:
+                raise HTTPError(f"Server error {status} for {url}", status, retry_after)
+            elif status >= 400:
+                raise HTTPError(f"Client error {status} for {url}", status, retry_after)
             else:
-                raise HTTPError(f"HTTP error {response.status_code} for {url}")
+                raise HTTPError(f"HTTP error {status} for {url}", status, retry_after)
 
         # Check if response is HTML
         content_type = response.headers.get("content-type", "").lower()
@@ -799,17 +2106,10 @@ def fetch_page_content(
         if len(response.text) < 100:
             raise ContentError(f"Content too short for {url} (possibly empty page)")
 
-        # Convert to markdown
-        markdown_content = converter.html_to_markdown(response.text, url)
-
-        # Validate converted content
-        if len(markdown_content.strip()) < 50:
-            raise ContentError(f"Converted content too short for {url}")
-
         return {
             "url": url,
-            "content": markdown_content,
-            "content_hash": hashlib.sha256(markdown_content.encode()).hexdigest(),
+            "html": response.text,
+            "validators": response_validators(response),
         }
 
     except requests.ConnectionError as e:
@@ -824,18 +2124,464 @@ def fetch_page_content(
         raise ParsingError(f"Unexpected error for {url}: {e}")
 
 
-def main():
+def convert_page(converter: WorkatoDocsConverter, page: Dict) -> Dict:
+    """Convert a page returned by download_page to a Markdown body.
+
+    The header is left off so ``content_hash`` only changes with the page
+    itself; :func:`render_document` adds it when the file is written.
+    """
+    url = page["url"]
+    try:
+        markdown_content = converter.html_to_markdown(page["html"], url, include_header=False)
+    except Exception as e:
+        logger.error(f"Unexpected error converting {url}: {e}")
+        raise ParsingError(f"Unexpected error for {url}: {e}")
+
+    # Validate converted content
+    if len(markdown_content.strip()) < 50:
+        raise ContentError(f"Converted content too short for {url}")
+
+    return {
+        "url": url,
+        "content": markdown_content,
+        "content_hash": body_hash(markdown_content),
+        "validators": page.get("validators", {}),
+    }
+
+
+def fetch_page_content(
+    session: requests.Session,
+    converter: WorkatoDocsConverter,
+    url: str,
+    validators: Optional[Dict] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> Optional[Dict]:
+    """
+    Fetch and convert a single page.
+
+    A 304 response to a conditional request skips conversion entirely and
+    returns ``{"url": url, "not_modified": True}``. Pass the run's
+    ``retry_policy`` to share its retry budget and statistics; without one
+    the page gets a fresh policy of its own.
+    """
+    page = (retry_policy or RetryPolicy()).call(download_page, session, url, validators)
+    if page.get("not_modified"):
+        return page
+    return convert_page(converter, page)
+
+
+_thread_state = threading.local()
+
+
+def _thread_converter() -> WorkatoDocsConverter:
+    """Return the calling thread's converter (html2text instances are not thread-safe)."""
+    converter = getattr(_thread_state, "converter", None)
+    if converter is None:
+        converter = _thread_state.converter = WorkatoDocsConverter()
+    return converter
+
+
+# Converter owned by a conversion worker process, built once by its initializer
+_process_converter: Optional[WorkatoDocsConverter] = None
+
+
+def _init_converter_process() -> None:
+    """ProcessPoolExecutor initializer: build the worker's converter once."""
+    global _process_converter
+    configure_logging()
+    _process_converter = WorkatoDocsConverter()
+
+
+def _convert_in_process(page: Dict) -> Dict:
+    """Convert a downloaded page inside a conversion worker process."""
+    if _process_converter is None:
+        _init_converter_process()
+    return convert_page(_process_converter, page)
+
+
+def make_downloader(
+    session: requests.Session,
+    rate_limiter: TokenBucket,
+    cache: Optional[HTMLCache] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    max_retries: Optional[int] = None,
+) -> Callable[[str, Optional[Dict]], Dict]:
+    """
+    Build the download function used by the fetch workers.
+
+    Every request waits for a rate-limit token, downloads the page (retrying
+    under ``retry_policy``, at most ``max_retries`` times) and, when a
+    ``cache`` is given, stores the raw HTML body in it.
+    """
+    retry_policy = retry_policy or RetryPolicy()
+
+    def download(url: str, validators: Optional[Dict] = None) -> Dict:
+        page = retry_policy.call(
+            download_page,
+            session,
+            url,
+            validators,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
+        )
+        if cache is not None and "html" in page:
+            cache.put(url, page["html"], page.get("validators"))
+        return page
+
+    return download
+
+
+def _download_and_convert(
+    download: Callable[[str, Optional[Dict]], Dict],
+    url: str,
+    validators: Optional[Dict],
+) -> Dict:
+    """Download a page and convert it on the calling worker thread."""
+    page = download(url, validators)
+    if page.get("not_modified"):
+        return page
+    return convert_page(_thread_converter(), page)
+
+
+def _chain_conversion(download: Future, convert_pool: ProcessPoolExecutor) -> Future:
+    """
+    Return a future for the converted page that follows a download future.
+
+    Conversion is handed to ``convert_pool`` as soon as the download finishes,
+    so network threads never wait on CPU-bound work.
+    """
+    result: Future = Future()
+
+    def on_converted(future: Future) -> None:
+        if future.exception() is not None:
+            result.set_exception(future.exception())
+        else:
+            result.set_result(future.result())
+
+    def on_downloaded(future: Future) -> None:
+        if future.exception() is not None:
+            result.set_exception(future.exception())
+            return
+        page = future.result()
+        if page.get("not_modified"):
+            result.set_result(page)
+            return
+        try:
+            convert_pool.submit(_convert_in_process, page).add_done_callback(on_converted)
+        except RuntimeError as e:  # pool already shut down
+            result.set_exception(e)
+
+    download.add_done_callback(on_downloaded)
+    return result
+
+
+def fetch_pages_concurrently(
+    urls: List[str],
+    executor: ThreadPoolExecutor,
+    download: Callable[[str, Optional[Dict]], Dict],
+    validators: Optional[Dict[str, Dict]] = None,
+    convert_pool: Optional[ProcessPoolExecutor] = None,
+) -> Iterator[Tuple[str, Future]]:
+    """
+    Submit every URL to the executor and yield (url, future) pairs in input order.
+
+    Fetching runs concurrently, but consumers see results in the same order as
+    ``urls``, so manifest and statistics updates stay deterministic.
+    ``download`` is called as ``download(url, validators)`` and returns a page
+    shaped like download_page(); ``validators`` maps URLs to their stored
+    ETag / Last-Modified values. With a ``convert_pool``, threads only download
+    and HTML-to-Markdown conversion runs in the pool's worker processes.
+    """
+    validators = validators or {}
+    if convert_pool is None:
+        futures = [
+            executor.submit(_download_and_convert, download, url, validators.get(url))
+            for url in urls
+        ]
+    else:
+        futures = [
+            _chain_conversion(executor.submit(download, url, validators.get(url)), convert_pool)
+            for url in urls
+        ]
+    yield from zip(urls, futures)
+
+
+def stored_validators(manifest: dict, docs_dir: Path) -> Dict[str, Dict]:
+    """
+    Map each URL in the manifest to its stored HTTP validators.
+
+    Entries whose Markdown file is missing on disk are skipped, so a 304 can
+    never leave a deleted document unrestored.
+    """
+    validators = {}
+    for filename, entry in manifest.get("files", {}).items():
+        if not (entry.get("etag") or entry.get("last_modified")):
+            continue
+        if entry.get("original_url") and (docs_dir / filename).exists():
+            validators[entry["original_url"]] = {
+                "etag": entry.get("etag"),
+                "last_modified": entry.get("last_modified"),
+            }
+    return validators
+
+
+def _docs_module(name: str):
+    """Import a workato_sdk_docs module, also from a checkout that is not installed."""
+    try:
+        return importlib.import_module(f"workato_sdk_docs.{name}")
+    except ImportError:
+        sys.path.append(str(Path(__file__).resolve().parent.parent))
+        return importlib.import_module(f"workato_sdk_docs.{name}")
+
+
+def write_search_index(docs_dir: Path, files: Dict[str, dict]) -> Optional[Path]:
+    """
+    Update the full-text index the /workato-sdk helper searches.
+
+    Only files whose manifest hash changed since they were indexed are
+    re-tokenised; a missing or incompatible index is rebuilt from scratch.
+    """
+    try:
+        search = _docs_module("search")
+        index = search.load_index(docs_dir) or search.empty_index()
+        stats = search.update_index(
+            index, docs_dir, {name: entry.get("hash") for name, entry in files.items()}
+        )
+        index_path = search.write_index(docs_dir, index)
+    except Exception as e:
+        # The docs themselves are fine; the helper falls back to topic names
+        logger.warning(f"Could not update search index: {e}")
+        return None
+    logger.info(
+        f"Search index: {stats['added']} added, {stats['updated']} updated, "
+        f"{stats['removed']} removed, {stats['unchanged']} unchanged"
+        f"{' (compacted)' if stats['compacted'] else ''}"
+    )
+    return index_path
+
+
+def write_chunk_store(docs_dir: Path, files: Dict[str, dict]) -> Optional[Path]:
+    """Update the section-level chunk store, re-chunking only files whose hash changed."""
+    try:
+        chunks = _docs_module("chunks")
+        store = chunks.load_store(docs_dir) or chunks.empty_store()
+        stats = chunks.update_store(
+            store, docs_dir, {name: entry.get("hash") for name, entry in files.items()}
+        )
+        store_path = chunks.write_store(docs_dir, store)
+    except Exception as e:
+        # Without a store the helper chunks documents on demand
+        logger.warning(f"Could not update chunk store: {e}")
+        return None
+    logger.info(
+        f"Chunk store: {stats['chunked']} chunked, {stats['removed']} removed, "
+        f"{stats['unchanged']} unchanged"
+    )
+    return store_path
+
+
+def write_vector_index(docs_dir: Path) -> Optional[Path]:
+    """
+    Update the optional semantic-search vectors from the chunk store.
+
+    Skipped when NumPy is not installed; only sections whose text changed are
+    embedded again.
+    """
+    if importlib.util.find_spec("numpy") is None:
+        logger.debug("NumPy not installed; skipping semantic vectors")
+        return None
+    try:
+        chunks = _docs_module("chunks")
+        semantic = _docs_module("semantic")
+        store = chunks.load_store(docs_dir)
+        if store is None:
+            return None
+        stats = semantic.update_vectors(docs_dir, store)
+    except Exception as e:
+        # Keyword search still works without vectors
+        logger.warning(f"Could not update semantic vectors: {e}")
+        return None
+    logger.info(
+        f"Semantic vectors: {stats['embedded']} embedded, {stats['reused']} reused, "
+        f"{stats['removed']} removed"
+    )
+    return Path(docs_dir) / semantic.VECTORS_FILE
+
+
+def write_docs_bundle(docs_dir: Path, files: Dict[str, dict]) -> Optional[Path]:
+    """Pack the documents into the single-file bundle the helper reads with one seek."""
+    try:
+        bundle = _docs_module("bundle")
+        bundle_path = bundle.write_bundle(
+            docs_dir, {name: entry.get("hash") for name, entry in files.items()}
+        )
+    except Exception as e:
+        # The helper falls back to reading docs/*.md
+        logger.warning(f"Could not write docs bundle: {e}")
+        return None
+    logger.info(f"Docs bundle: {len(files)} documents in {bundle_path.name}")
+    return bundle_path
+
+
+def write_changelog(
+    docs_dir: Path,
+    added: List[str],
+    updated: Dict[str, Dict],
+    removed: List[str],
+    completed: Optional[str] = None,
+) -> Optional[Path]:
+    """Append this run's added, updated and removed files to the changelog."""
+    try:
+        changelog = _docs_module("changelog")
+        changelog_path = changelog.record_run(
+            docs_dir, changelog.make_run(added, updated, removed, completed)
+        )
+    except Exception as e:
+        # The helper falls back to the git history
+        logger.warning(f"Could not update changelog: {e}")
+        return None
+    if changelog_path is not None:
+        logger.info(
+            f"Changelog: {len(added)} added, {len(updated)} updated, {len(removed)} removed"
+        )
+    return changelog_path
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="fetch_workato_docs.py",
+        description="Fetch Workato SDK documentation and convert it to Markdown",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of concurrent fetch workers (default: {DEFAULT_WORKERS})",
+    )
+    p.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help="Starting requests per second; the rate then adapts to server feedback "
+        f"(default: {DEFAULT_REQUESTS_PER_SECOND})",
+    )
+    p.add_argument(
+        "--max-rate",
+        type=float,
+        default=DEFAULT_MAX_REQUESTS_PER_SECOND,
+        help=f"Ceiling for the adaptive request rate (default: {DEFAULT_MAX_REQUESTS_PER_SECOND})",
+    )
+    p.add_argument(
+        "--convert-processes",
+        type=int,
+        default=0,
+        help="Convert HTML to Markdown in N worker processes (default: 0, convert on "
+        "the fetch threads)",
+    )
+    p.add_argument("--docs-dir", type=Path, default=DOCS_DIR, help="Output directory")
+    p.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=CACHE_DIR,
+        help="Raw HTML response cache directory",
+    )
+    p.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_CACHE_MAX_MB,
+        help=f"Evict cached HTML beyond this size (default: {DEFAULT_CACHE_MAX_MB} MB)",
+    )
+    p.add_argument("--no-cache", action="store_true", help="Do not store fetched HTML")
+    p.add_argument(
+        "--from-cache",
+        action="store_true",
+        help="Re-convert cached HTML without network access",
+    )
+    p.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore stored ETag/Last-Modified validators and re-convert every page",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip pages an interrupted run already completed",
+    )
+    p.add_argument(
+        "--resume-window",
+        type=float,
+        default=DEFAULT_RESUME_WINDOW_HOURS,
+        metavar="HOURS",
+        help="Only skip pages completed within this many hours "
+        f"(default: {DEFAULT_RESUME_WINDOW_HOURS:g})",
+    )
+    p.add_argument(
+        "--max-retries",
+        type=int,
+        default=DEFAULT_MAX_RETRIES,
+        help="Retries per page for connection errors, 5xx and 429 responses; pages still "
+        f"failing after {DEFAULT_INLINE_RETRIES} are retried at the end of the run "
+        f"(default: {DEFAULT_MAX_RETRIES})",
+    )
+    p.add_argument(
+        "--retry-budget",
+        type=float,
+        default=DEFAULT_RETRY_BUDGET,
+        metavar="SECONDS",
+        help="Total time a run may spend waiting between retries "
+        f"(default: {DEFAULT_RETRY_BUDGET:g})",
+    )
+    p.add_argument(
+        "--http2",
+        action="store_true",
+        help="Fetch over HTTP/2 with httpx (pip install 'httpx[http2]')",
+    )
+    p.add_argument(
+        "--sitemap",
+        nargs="?",
+        const=SITEMAP_URL,
+        default=None,
+        metavar="URL",
+        help="Discover pages from the docs sitemap and only fetch pages whose "
+        f"<lastmod> changed (default URL: {SITEMAP_URL})",
+    )
+    args = p.parse_args(argv)
+    if args.workers < 1:
+        p.error("--workers must be at least 1")
+    if args.rate <= 0:
+        p.error("--rate must be positive")
+    if args.max_rate <= 0:
+        p.error("--max-rate must be positive")
+    if args.max_retries < 0:
+        p.error("--max-retries cannot be negative")
+    if args.retry_budget < 0:
+        p.error("--retry-budget cannot be negative")
+    if args.convert_processes < 0:
+        p.error("--convert-processes cannot be negative")
+    if args.from_cache and args.no_cache:
+        p.error("--from-cache cannot be combined with --no-cache")
+    if args.resume_window <= 0:
+        p.error("--resume-window must be positive")
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
     """Main function to fetch Workato SDK documentation."""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    configure_logging()
     start_time = datetime.now()
     logger.info("Starting Workato SDK documentation fetch")
 
     # Create docs directory
-    docs_dir = Path(__file__).parent.parent / "docs"
-    docs_dir.mkdir(exist_ok=True)
+    docs_dir = args.docs_dir
+    docs_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Output directory: {docs_dir}")
 
-    # Load existing manifest
-    manifest = load_manifest(docs_dir)
+    # Load existing manifest; entries are journaled as each page completes
+    store = ManifestStore(docs_dir)
+    manifest = store.load()
+    checkpoint = FetchCheckpoint(store)
+    resumed = checkpoint.load(args.resume_window) if args.resume else {}
 
     # Statistics
     successful = 0
@@ -843,80 +2589,232 @@ def main():
     new_files = 0
     updated_files = 0
     unchanged_files = 0
-    new_manifest = {"files": {}}
+    not_modified_files = 0
+    resumed_files = 0
+    lastmod_skipped_files = 0
+    seen_files = set()
+    # For the changelog: filenames added, and updated ones with their change summary
+    added_files: List[str] = []
+    updated_changes: Dict[str, Dict] = {}
 
     # Create session and tools
-    with requests.Session() as session:
+    with create_session(args.workers, http2=args.http2) as session:
+        transport = "http2" if isinstance(session, HttpxSession) else "http1.1"
         converter = WorkatoDocsConverter()
         change_detector = ChangeDetector()
 
+        # One adaptive limiter paces discovery and downloads alike
+        rate_limiter = None
+        if not args.from_cache:
+            rate_limiter = AdaptiveRateLimiter(
+                args.rate, capacity=args.workers, max_rate=args.max_rate
+            )
+
         # Use the hardcoded list of SDK URLs
         sdk_urls = SDK_URLS.copy()
 
         # Optional: Fallback to crawling if needed (unlikely)
         if not sdk_urls:
             logger.warning("No SDK URLs defined, falling back to crawling approach")
-            crawler = WorkatoSDKCrawler(session, converter)
+            crawler = WorkatoSDKCrawler(
+                session,
+                converter,
+                workers=args.workers,
+                requests_per_second=args.rate,
+                rate_limiter=rate_limiter,
+            )
             crawled_pages = crawler.crawl_sdk_docs(max_depth=3)
             sdk_urls = [page["url"] for page in crawled_pages]
 
-        logger.info(f"Processing {len(sdk_urls)} SDK documentation pages")
-
-        # Process each URL
-        for i, url in enumerate(sdk_urls, 1):
-            # Rate limiting
-            if i > 1:
-                time.sleep(RATE_LIMIT_DELAY)
-
+        # The sitemap lists every page with its last modification date, so pages
+        # that have not changed since they were last fetched need no request at all
+        sitemap_lastmod: Dict[str, Optional[str]] = {}
+        if args.sitemap and not args.from_cache:
+            try:
+                sitemap_lastmod = WorkatoSDKCrawler(
+                    session, converter, rate_limiter=rate_limiter
+                ).discover_from_sitemap(args.sitemap)
+            except (requests.RequestException, ElementTree.ParseError) as e:
+                logger.warning(f"Sitemap discovery failed, using hardcoded URLs: {e}")
+            if sitemap_lastmod:
+                sdk_urls = list(sitemap_lastmod)
+
+        cache = None
+        if not args.no_cache:
+            cache = HTMLCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+        if args.from_cache:
+            # Eviction leaves the cache partial: replay the pages it still holds
+            # and keep every other manifest entry as it is
+            known_urls = sdk_urls + [
+                entry["original_url"] for entry in store.files.values() if entry.get("original_url")
+            ]
+            sdk_urls = [url for url in dict.fromkeys(known_urls) if url in cache.index]
+            seen_files.update(store.files)
+
+        # Pages an interrupted run already finished keep their journaled entries
+        pending_urls = []
+        for url in sdk_urls:
+            filename = url_to_filename(url)
+            if (
+                url in sitemap_lastmod
+                and not args.force
+                and (docs_dir / filename).exists()
+                and not page_changed_since(store.files.get(filename), sitemap_lastmod[url])
+            ):
+                seen_files.add(filename)
+                unchanged_files += 1
+                lastmod_skipped_files += 1
+                successful += 1
+                continue
+            if url not in resumed or filename not in store.files:
+                pending_urls.append(url)
+                continue
+            status = resumed[url]["status"]
+            checkpoint.completed[url] = resumed[url]
+            seen_files.add(filename)
+            if status == "new":
+                added_files.append(filename)
+            elif status == "updated":
+                updated_changes[filename] = resumed[url].get("changes", {})
+            new_files += status == "new"
+            updated_files += status == "updated"
+            unchanged_files += status in ("unchanged", "not_modified")
+            not_modified_files += status == "not_modified"
+            resumed_files += 1
+            successful += 1
+        if resumed_files:
+            logger.info(
+                f"Resuming: skipping {resumed_files} pages completed in the last "
+                f"{args.resume_window:g} hours"
+            )
+        if lastmod_skipped_files:
+            logger.info(
+                f"Sitemap: skipping {lastmod_skipped_files} pages unchanged since last fetch"
+            )
+
+        retry_policy = RetryPolicy(max_retries=args.max_retries, budget=args.retry_budget)
+        deferred: List[str] = []
+
+        if args.from_cache:
+            # Offline replay: re-run the converter over cached HTML
+            logger.info(f"Replaying {len(sdk_urls)} SDK documentation pages from {cache.cache_dir}")
+            download = retry_download = cache.load_page
+            validators = {}
+        else:
+            logger.info(
+                f"Processing {len(sdk_urls)} SDK documentation pages "
+                f"({args.workers} workers, {args.rate:g}-{args.max_rate:g} requests/s)"
+            )
+            # Pages still failing after a quick retry are deferred, not retried in line
+            download = make_downloader(
+                session,
+                rate_limiter,
+                cache,
+                retry_policy,
+                max_retries=min(DEFAULT_INLINE_RETRIES, args.max_retries),
+            )
+            retry_download = make_downloader(session, rate_limiter, cache, retry_policy)
+            validators = {} if args.force else stored_validators(manifest, docs_dir)
+
+        # Fetch concurrently, process results in URL order
+        executor = ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="fetch")
+        convert_pool = None
+        if args.convert_processes:
+            from concurrent.futures import ProcessPoolExecutor
+
+            convert_pool = ProcessPoolExecutor(
+                max_workers=args.convert_processes, initializer=_init_converter_process
+            )
+
+        def fetch_results():
+            yield from fetch_pages_concurrently(
+                pending_urls, executor, download, validators, convert_pool
+            )
+            # Filled in while the first pass was consumed
+            if deferred:
+                logger.info(f"Retrying {len(deferred)} deferred pages")
+                yield from fetch_pages_concurrently(
+                    list(deferred), executor, retry_download, validators, convert_pool
+                )
+
+        for i, (url, future) in enumerate(fetch_results(), 1):
             # Progress indicator
-            if i % 10 == 0 or i == len(sdk_urls):
-                logger.info(f"Progress: {i}/{len(sdk_urls)} pages ({i * 100 // len(sdk_urls)}%)")
+            if i <= len(pending_urls) and (i % 10 == 0 or i == len(pending_urls)):
+                logger.info(
+                    f"Progress: {i}/{len(pending_urls)} pages ({i * 100 // len(pending_urls)}%)"
+                )
 
             try:
-                page_data = fetch_page_content(session, converter, url)
+                page_data = future.result()
 
-                if page_data:
+                if page_data and page_data.get("not_modified"):
+                    # 304: keep the existing manifest entry as-is
+                    filename = url_to_filename(url)
+                    if sitemap_lastmod.get(url):
+                        store.put(
+                            filename, {**store.files[filename], "lastmod": sitemap_lastmod[url]}
+                        )
+                    seen_files.add(filename)
+                    logger.debug(f"Not modified: {filename}")
+                    not_modified_files += 1
+                    unchanged_files += 1
+                    successful += 1
+                    checkpoint.mark(url, "not_modified")
+                elif page_data:
                     filename = url_to_filename(url)
 
-                    # Get existing file content for change detection
-                    old_content = None
+                    # Hashes cover the body only, so a refresh that changes nothing but
+                    # the fetch time matches the manifest and skips the disk entirely
+                    old_hash = manifest.get("files", {}).get(filename, {}).get("hash", "")
+                    new_hash = page_data["content_hash"]
                     old_file_path = docs_dir / filename
-                    if old_file_path.exists():
+                    old_body = None
+                    if not old_file_path.exists():
+                        old_hash = ""
+                    elif old_hash != new_hash:
                         try:
-                            old_content = old_file_path.read_text(encoding="utf-8")
+                            old_body = document_body(old_file_path.read_text(encoding="utf-8"))
                         except Exception as e:
                             logger.warning(f"Could not read existing file {filename}: {e}")
-
-                    # Check if content has changed using smart detection
-                    old_hash = manifest.get("files", {}).get(filename, {}).get("hash", "")
+                        # Files written before body hashing carry a whole-document hash
+                        if old_body is not None and body_hash(old_body) == new_hash:
+                            old_hash = new_hash
 
                     try:
                         # Use change detector to determine if update is needed
                         should_update = change_detector.should_update_file(
-                            filename,
-                            old_hash,
-                            page_data["content_hash"],
-                            old_content,
-                            page_data["content"],
+                            filename, old_hash, new_hash
                         )
 
                         if should_update:
+                            document = render_document(page_data["content"], url)
                             if old_hash == "":
                                 # New file
-                                content_hash = save_markdown_file(
-                                    docs_dir, filename, page_data["content"]
-                                )
+                                save_markdown_file(docs_dir, filename, document)
                                 logger.info(f"NEW: {filename}")
                                 last_updated = datetime.now().isoformat()
                                 new_files += 1
+                                added_files.append(filename)
+                                status = "new"
                             else:
                                 # Updated file
-                                content_hash = save_markdown_file(
-                                    docs_dir, filename, page_data["content"]
+                                changes = change_detector.detect_content_changes(
+                                    old_body or "", page_data["content"]
+                                )
+                                save_markdown_file(docs_dir, filename, document)
+                                sections = ", ".join(changes["changed_headings"][:3])
+                                logger.info(
+                                    f"UPDATED: {filename} ({changes['change_ratio']:.1%} changed"
+                                    f"{' in ' + sections if sections else ''})"
                                 )
-                                logger.info(f"UPDATED: {filename} (meaningful changes detected)")
                                 last_updated = datetime.now().isoformat()
                                 updated_files += 1
+                                updated_changes[filename] = {
+                                    "change_ratio": changes["change_ratio"],
+                                    "changed_headings": changes["changed_headings"],
+                                }
+                                status = "updated"
+                            content_hash = new_hash
                         else:
                             # Unchanged file (or only minor changes)
                             content_hash = old_hash
@@ -927,13 +2825,25 @@ def main():
                                 .get("last_updated", datetime.now().isoformat())
                             )
                             unchanged_files += 1
+                            status = "unchanged"
 
                         # Update manifest entry
-                        new_manifest["files"][filename] = {
-                            "original_url": url,
-                            "hash": content_hash,
-                            "last_updated": last_updated,
-                        }
+                        store.put(
+                            filename,
+                            {
+                                "original_url": url,
+                                "hash": content_hash,
+                                "last_updated": last_updated,
+                                **page_data.get("validators", {}),
+                                **(
+                                    {"lastmod": sitemap_lastmod[url]}
+                                    if sitemap_lastmod.get(url)
+                                    else {}
+                                ),
+                            },
+                        )
+                        seen_files.add(filename)
+                        checkpoint.mark(url, status, updated_changes.get(filename))
 
                         successful += 1
 
@@ -947,6 +2857,10 @@ def main():
                     failed += 1
 
             except (NetworkError, HTTPError) as e:
+                if url not in deferred and retry_policy.is_retryable(e) and not args.from_cache:
+                    deferred.append(url)
+                    logger.info(f"Deferring {url} to the end of the run: {e}")
+                    continue
                 failed += 1
                 logger.warning(f"Network/HTTP error for {url}: {e}")
             except ContentError as e:
@@ -962,11 +2876,29 @@ def main():
                 failed += 1
                 logger.error(f"Unexpected error processing {url}: {e}")
 
+        executor.shutdown(wait=True)
+        if convert_pool is not None:
+            convert_pool.shutdown(wait=True)
+        if cache is not None and not args.from_cache:
+            cache.flush()
+
+    # Pages dropped from the URL set or deleted from disk are gone, and only they
+    # are logged as removed. Pages that failed this run keep their entries, so
+    # the index, chunk store and bundle still cover them
+    url_files = {url_to_filename(url) for url in sdk_urls}
+    removed_files = [
+        name
+        for name in store.files
+        if name not in seen_files and (name not in url_files or not (docs_dir / name).exists())
+    ]
+    for filename in removed_files:
+        store.delete(filename)
+
     # Determine if there were meaningful changes
     has_meaningful_changes = new_files > 0 or updated_files > 0
 
     # Add metadata to manifest
-    new_manifest["fetch_metadata"] = {
+    store.manifest["fetch_metadata"] = {
         "last_fetch_completed": datetime.now().isoformat(),
         "fetch_duration_seconds": (datetime.now() - start_time).total_seconds(),
         "pages_processed": len(sdk_urls),
@@ -975,14 +2907,39 @@ def main():
         "new_files": new_files,
         "updated_files": updated_files,
         "unchanged_files": unchanged_files,
-        "total_files": len(new_manifest["files"]),
+        "not_modified_files": not_modified_files,
+        "resumed_files": resumed_files,
+        "lastmod_skipped_files": lastmod_skipped_files,
+        "total_files": len(store.files),
         "has_meaningful_changes": has_meaningful_changes,
         "fetch_tool_version": "3.0",
-        "fetch_method": "hardcoded_urls",
+        "fetch_method": (
+            "cache_replay"
+            if args.from_cache
+            else "sitemap" if sitemap_lastmod else "hardcoded_urls"
+        ),
+        "fetch_workers": args.workers,
+        "convert_processes": args.convert_processes,
+        "requests_per_second": args.rate,
+        "rate_limiter": rate_limiter.state() if rate_limiter is not None else None,
+        "retry_policy": {**retry_policy.state(), "deferred_pages": len(deferred)},
+        "transport": transport,
     }
 
-    # Save manifest
-    save_manifest(docs_dir, new_manifest)
+    # Fold the journal into the published manifest; the run no longer needs resuming
+    store.compact()
+    checkpoint.clear()
+    write_search_index(docs_dir, store.files)
+    write_chunk_store(docs_dir, store.files)
+    write_vector_index(docs_dir)
+    write_docs_bundle(docs_dir, store.files)
+    write_changelog(
+        docs_dir,
+        added_files,
+        updated_changes,
+        removed_files,
+        store.manifest["fetch_metadata"]["last_fetch_completed"],
+    )
 
     # Summary
     duration = datetime.now() - start_time
@@ -993,15 +2950,19 @@ def main():
     logger.info(f"Failed: {failed}")
     logger.info(f"New files: {new_files}")
     logger.info(f"Updated files: {updated_files}")
-    logger.info(f"Unchanged files: {unchanged_files}")
+    logger.info(f"Unchanged files: {unchanged_files} ({not_modified_files} not modified)")
+    if resumed_files:
+        logger.info(f"Resumed from checkpoint: {resumed_files}")
+    if lastmod_skipped_files:
+        logger.info(f"Skipped by sitemap lastmod: {lastmod_skipped_files}")
+    if deferred:
+        logger.info(f"Deferred and retried at the end: {len(deferred)}")
 
     if failed > 0 and successful == 0:
         logger.error("No pages were fetched successfully!")
         sys.exit(1)
     else:
-        logger.info(
-            f"\nWorkato SDK documentation fetch complete! Total files: {len(new_manifest['files'])}"
-        )
+        logger.info(f"\nWorkato SDK documentation fetch complete! Total files: {len(store.files)}")
 
 
 if __name__ == "__main__":
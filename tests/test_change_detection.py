@@ -77,16 +77,85 @@ class TestChangeDetector:
         assert result["change_ratio"] >= detector.min_significant_change_ratio
 
     def test_detect_content_changes_length_threshold(self):
-        """Test change detection with length-based threshold."""
+        """Test change detection when every character is replaced."""
         detector = ChangeDetector()
 
         old_content = "A" * 100  # 100 characters
-        new_content = "B" * 200  # 200 characters (100 char diff, 50% ratio)
+        new_content = "B" * 200  # 200 characters, none shared with the old content
 
         result = detector.detect_content_changes(old_content, new_content)
 
         assert result["changed"] is True
-        assert result["change_ratio"] == 0.5
+        assert result["change_ratio"] == 1.0
+
+    def test_detect_content_changes_same_length_edit(self):
+        """Test that an edit which keeps the length still scores a change."""
+        detector = ChangeDetector()
+
+        old_content = "Use the execute lambda.\n" * 10 + "Returns a hash of outputs."
+        new_content = "Use the execute lambda.\n" * 10 + "Returns a list of outputs."
+
+        result = detector.detect_content_changes(old_content, new_content)
+
+        assert len(old_content) == len(new_content)
+        assert 0 < result["change_ratio"] < 1
+        assert result["changed_ranges"] == [("replace", 10, 11, 10, 11)]
+
+    def test_detect_content_changes_timestamp_only(self):
+        """Test that a refreshed fetch timestamp is not a meaningful change."""
+        detector = ChangeDetector()
+        body = "\n".join(f"Paragraph {i} of the SDK reference." for i in range(40))
+
+        result = detector.detect_content_changes(
+            "> **Fetched**: 2024-01-01T00:00:00.000000\n\n" + body,
+            "> **Fetched**: 2024-01-02T03:04:05.678901\n\n" + body,
+        )
+
+        assert result["changed"] is False
+        assert result["changed_ranges"] == [("replace", 0, 1, 0, 1)]
+
+    def test_detect_content_changes_reports_ranges_and_headings(self):
+        """Test changed line ranges and the headings of the sections they touch."""
+        detector = ChangeDetector()
+        old_content = "\n".join(
+            [
+                "# Actions",
+                "Intro",
+                "## Input fields",
+                "Field list",
+                "```ruby",
+                "# not a heading",
+                "```",
+                "## Output fields",
+                "Output list",
+            ]
+        )
+        new_content = (
+            old_content.replace("Field list", "Updated field list").replace(
+                "# not a heading", "# still not a heading"
+            )
+            + "\n## Examples\nNew example"
+        )
+
+        result = detector.detect_content_changes(old_content, new_content)
+
+        assert result["changed_ranges"] == [
+            ("replace", 3, 4, 3, 4),
+            ("replace", 5, 6, 5, 6),
+            ("insert", 9, 9, 9, 11),
+        ]
+        assert result["changed_headings"] == ["Input fields", "Examples"]
+
+    def test_changed_headings_drop_permalinks(self):
+        """Test that docs.workato.com heading permalinks are not part of the title."""
+        detector = ChangeDetector()
+        old_content = "# SDK - CLI [​](<#sdk-cli>)\nIntro\n## Login [​](<#login>)\nOld step"
+
+        result = detector.detect_content_changes(
+            old_content, old_content.replace("Old step", "New step")
+        )
+
+        assert result["changed_headings"] == ["Login"]
 
     def test_should_update_file_new_file(self):
         """Test should_update_file for new files."""
@@ -179,9 +248,12 @@ class TestChangeDetectionIntegration:
         detector.min_significant_change_ratio = 0.5
 
         old_content = "A" * 20  # 20 characters
-        new_content = "B" * 35  # 35 characters (15 char diff, 75% ratio)
+        new_content = "A" * 20 + "B" * 15  # 15 characters appended (15 of 35 changed)
 
         result = detector.detect_content_changes(old_content, new_content)
 
         assert result["changed"] is True
-        assert result["change_ratio"] == 15 / 35  # 15 char diff / 35 char max
+        assert result["change_ratio"] == 15 / 35  # 15 changed chars / 35 char max
+
+        detector.min_content_change_threshold = 20
+        assert detector.detect_content_changes(old_content, new_content)["changed"] is False
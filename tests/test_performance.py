@@ -4,6 +4,7 @@ These tests measure execution time and resource usage for critical operations.
 They help ensure the system maintains acceptable performance characteristics.
 """
 
+import gc
 import hashlib
 import tempfile
 import time
@@ -12,11 +13,14 @@ from pathlib import Path
 import pytest
 
 from scripts.fetch_workato_docs import (
+    ChangeDetector,
+    ManifestStore,
     WorkatoDocsConverter,
     load_manifest,
     save_manifest,
     url_to_filename,
 )
+from workato_sdk_docs.search import build_index, empty_index, search, update_index
 
 
 class TestPerformanceMetrics:
@@ -70,6 +74,32 @@ class TestPerformanceMetrics:
             file_entries = {k: v for k, v in loaded.items() if k.endswith(".md")}
             assert len(file_entries) == 1000
 
+    def test_manifest_journal_performance(self):
+        """Test that per-file updates append to the journal instead of rewriting."""
+        manifest = {
+            "files": {
+                f"file_{i}.md": {"original_url": f"https://example.com/page{i}.html", "hash": "h"}
+                for i in range(20000)
+            }
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            save_manifest(temp_path, manifest)
+            store = ManifestStore(temp_path)
+            store.load()
+
+            start_time = time.time()
+            for i in range(0, 20000, 25):
+                store.put(f"file_{i}.md", {**store.files[f"file_{i}.md"], "hash": "h2"})
+            elapsed = time.time() - start_time
+            store.close()
+
+            # 800 updates to a 20000-entry manifest without a single full rewrite
+            assert elapsed < 0.5, f"Journaled updates too slow: {elapsed:.3f}s"
+            assert store.journal_records == 800
+            assert load_manifest(temp_path)["files"]["file_25.md"]["hash"] == "h2"
+
     def test_content_hashing_performance(self):
         """Test content hashing performance for large documents."""
         # Create a large document (1MB of text)
@@ -132,6 +162,112 @@ class TestPerformanceMetrics:
         # Should check 100 files in under 0.5 seconds
         assert elapsed < 0.5, f"Change detection too slow: {elapsed:.3f}s for 100 files"
 
+    def test_line_diff_performance_large_document(self):
+        """Test diff-based change detection on a 1 MB document."""
+        sections = []
+        for i in range(200):
+            sections.append(f"## Section {i}")
+            sections.extend(f"Line {i}.{j}: connector docs {i * j} " * 3 for j in range(52))
+        old_content = "\n".join(sections)
+        assert len(old_content) > 1_000_000
+
+        edited = list(sections)
+        for index in range(7, len(edited), 997):
+            edited[index] += " (edited)"
+        detector = ChangeDetector()
+
+        cases = {
+            "scattered edits": "\n".join(edited),
+            "rewritten": "\n".join(line + "!" for line in sections),
+            "reordered": "\n".join(sections[len(sections) // 2 :] + sections[: len(sections) // 2]),
+        }
+        for label, new_content in cases.items():
+            start_time = time.time()
+            result = detector.detect_content_changes(old_content, new_content)
+            elapsed = time.time() - start_time
+
+            # Should diff a 1 MB document in under a second whatever the edit pattern
+            assert elapsed < 1.0, f"Diff too slow for {label}: {elapsed:.3f}s"
+            assert result["changed_ranges"]
+
+        result = detector.detect_content_changes(old_content, cases["scattered edits"])
+        assert result["change_ratio"] < 0.001
+        assert len(result["changed_ranges"]) == len(range(7, len(edited), 997))
+
+    def test_search_query_performance(self):
+        """Test that indexed queries over the mirrored docs take milliseconds."""
+        docs_dir = Path(__file__).parent.parent / "docs"
+        index = build_index(docs_dir)
+        assert len(index["docs"]) > 50
+        queries = [
+            "how do I create a custom connector",
+            "oauth authorization code refresh token",
+            "webhook triggers",
+            "rspec vcr",
+            "pick lists",
+        ]
+
+        start_time = time.time()
+        for _ in range(20):
+            for query in queries:
+                assert search(index, query)
+        elapsed = time.time() - start_time
+
+        # 100 queries against the full docs set should average well under 10 ms
+        assert elapsed < 1.0, f"Search too slow: {elapsed:.3f}s for 100 queries"
+
+    def test_incremental_index_update_performance(self):
+        """Test that index upkeep scales with the number of changed documents."""
+        docs_dir = Path(__file__).parent.parent / "docs"
+        files = {path.name: f"hash-{path.name}" for path in sorted(docs_dir.glob("*.md"))}
+
+        index = empty_index()
+        start_time = time.time()
+        update_index(index, docs_dir, files)
+        full_elapsed = time.time() - start_time
+
+        changed = dict(files, **{next(iter(files)): "changed"})
+        start_time = time.time()
+        stats = update_index(index, docs_dir, changed)
+        incremental_elapsed = time.time() - start_time
+
+        assert stats["updated"] == 1 and stats["unchanged"] == len(files) - 1
+        assert incremental_elapsed < full_elapsed / 5, (
+            f"Incremental update too slow: {incremental_elapsed:.3f}s "
+            f"vs {full_elapsed:.3f}s for a full build"
+        )
+
+    def test_semantic_query_performance(self):
+        """Test that vector queries over every section answer in under 50 ms."""
+        np = pytest.importorskip("numpy")
+        from workato_sdk_docs.chunks import empty_store, update_store
+        from workato_sdk_docs.semantic import load_vectors, search_vectors, update_vectors
+
+        docs_dir = Path(__file__).parent.parent / "docs"
+        files = {path.name: None for path in sorted(docs_dir.glob("*.md"))}
+        with tempfile.TemporaryDirectory() as temp:
+            store = empty_store()
+            update_store(store, docs_dir, files)
+            for name in files:
+                (Path(temp) / name).write_bytes((docs_dir / name).read_bytes())
+            update_vectors(temp, store)
+            index = load_vectors(temp)
+            assert isinstance(index["matrix"], np.memmap) and len(index["meta"]["rows"]) > 500
+
+            queries = [
+                "explain connection configuration",
+                "how do I refresh an expired token",
+                "download a large file in chunks",
+                "test my connector locally",
+                "dependent pick list dropdown",
+            ]
+            start_time = time.time()
+            for query in queries:
+                assert search_vectors(index, query)
+            elapsed = time.time() - start_time
+
+        assert elapsed / len(queries) < 0.05, f"Semantic search too slow: {elapsed:.3f}s"
+
     def test_memory_usage_large_document(self):
         """Test memory usage when processing large documents."""
         # This test ensures we don't load entire large documents into memory
@@ -176,13 +312,127 @@ class TestPerformanceRegression:
         import importlib
         import sys
 
-        # Remove from cache if already imported
-        if "scripts.fetch_workato_docs" in sys.modules:
-            del sys.modules["scripts.fetch_workato_docs"]
+        # Remove from cache if already imported (restored afterwards so other
+        # tests keep patching and pickling the same module object)
+        original = sys.modules.pop("scripts.fetch_workato_docs", None)
 
-        start_time = time.time()
-        importlib.import_module("scripts.fetch_workato_docs")
-        elapsed = time.time() - start_time
+        try:
+            start_time = time.time()
+            importlib.import_module("scripts.fetch_workato_docs")
+            elapsed = time.time() - start_time
+        finally:
+            if original is not None:
+                sys.modules["scripts.fetch_workato_docs"] = original
+                sys.modules["scripts"].fetch_workato_docs = original
 
         # Module import should be fast
         assert elapsed < 1.0, f"Module import too slow: {elapsed:.3f}s"
+
+    def test_fetcher_import_time_budget(self):
+        """Ensure importing the fetcher defers requests, bs4 and html2text."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import scripts.fetch_workato_docs\n"
+            "print(','.join(m for m in ('requests', 'bs4', 'html2text') if m in sys.modules))\n"
+        )
+        # Let the first run cache bytecode so later runs measure the import itself
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+        timings = []
+        for _ in range(3):
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", code],
+                cwd=Path(__file__).parent.parent,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            heavy = result.stdout.strip()
+            assert heavy == "", f"Fetcher imported {heavy} eagerly"
+            # Lines read "import time: <self us> | <cumulative us> | <indented module>"
+            modules = {}
+            for line in result.stderr.splitlines():
+                fields = line.split("|")
+                if len(fields) == 3 and fields[1].strip().isdigit():
+                    modules[fields[2].strip()] = int(fields[1])
+            timings.append(modules["scripts.fetch_workato_docs"] / 1e6)
+
+        # Generous for slow CI machines; the import takes about 30 ms here and
+        # over 100 ms when the HTTP and HTML stack is imported eagerly
+        assert min(timings) < 0.15, f"Fetcher import too slow: {min(timings) * 1000:.1f} ms"
+
+    def test_cli_startup_time(self, temp_dir):
+        """Ensure read-only workato-sdk commands start without the fetcher's stack."""
+        import subprocess
+        import sys
+
+        (temp_dir / "docs_manifest.json").write_text('{"files": {"quickstart.md": {}}}')
+        code = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "from workato_sdk_docs.cli import main\n"
+            f"main(['--docs-dir', {str(temp_dir)!r}, 'list'])\n"
+            "elapsed = time.perf_counter() - start\n"
+            "heavy = [m for m in ('requests', 'bs4', 'html2text') if m in sys.modules]\n"
+            "print(elapsed, ','.join(heavy))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        topics, timing = result.stdout.rsplit("\n", 2)[:2]
+        elapsed, heavy = timing.split(" ")
+
+        assert topics == "quickstart"
+        assert heavy == "", f"CLI imported {heavy}"
+        # A loose bound: the check that matters is the one on heavy imports above
+        assert float(elapsed) < 0.5, f"CLI startup too slow: {float(elapsed) * 1000:.1f} ms"
+
+
+class TestSingleParseBenchmark:
+    """Benchmark the single-parse converter against the serialise / re-parse path."""
+
+    def test_single_parse_reduces_cpu_per_page(self, test_fixtures_dir):
+        """Tree-based conversion should use less CPU per page than re-parsing a string."""
+        html = (test_fixtures_dir / "sample_html" / "workato_authentication_page.html").read_text()
+        paragraphs = "".join(
+            f'<p>Paragraph {i} with <code>x &amp; y</code> and <a href="/a{i}">a link</a>.</p>'
+            for i in range(500)
+        )
+        page = html.replace("</main>", paragraphs + "</main>")
+
+        def legacy():
+            converter = WorkatoDocsConverter(parser="html.parser")
+            converter.h2t.handle(converter.extract_main_content(page))
+
+        def single_parse():
+            converter = WorkatoDocsConverter(parser="html.parser")
+            soup = converter.parse_html(page)
+            converter.tree_to_markdown(converter.select_main_content(soup))
+
+        # Interleave runs and keep the best of each to reduce scheduling noise
+        legacy_cpu = single_parse_cpu = float("inf")
+        for _ in range(5):
+            for fn in (legacy, single_parse):
+                gc.collect()
+                start = time.process_time()
+                fn()
+                elapsed = time.process_time() - start
+                if fn is legacy:
+                    legacy_cpu = min(legacy_cpu, elapsed)
+                else:
+                    single_parse_cpu = min(single_parse_cpu, elapsed)
+        reduction = 1 - single_parse_cpu / legacy_cpu
+
+        # The typical reduction is around 20%; require a quarter of it to allow for noise
+        assert reduction > 0.05, (
+            f"Single-parse conversion saved {reduction:.0%} CPU per page "
+            f"(legacy {legacy_cpu * 1000:.1f} ms, single-parse {single_parse_cpu * 1000:.1f} ms)"
+        )
@@ -0,0 +1,102 @@
+"""
+Unit tests for the packed docs bundle in workato_sdk_docs/bundle.py
+"""
+
+import hashlib
+
+import pytest
+
+from workato_sdk_docs.bundle import (
+    BUNDLE_FILE,
+    Bundle,
+    main,
+    read_table,
+    unpack,
+    write_bundle,
+)
+
+HEADER = "# Workato SDK Documentation\n\n> **Source**: https://example.com\n\n---\n\n"
+DOCS = {
+    "actions.md": HEADER + "# Actions [​](<#actions>)\n\nActions run an API request.\n",
+    "quickstart.md": HEADER + "# Using the SDK\n\nCafé ☕ and other UTF-8.\n",
+    "untitled.md": "No heading here.\n",
+}
+
+
+@pytest.fixture
+def docs_dir(temp_dir):
+    for filename, content in DOCS.items():
+        (temp_dir / filename).write_text(content, encoding="utf-8")
+    return temp_dir
+
+
+def hashes():
+    return {name: f"hash-{name}" for name in DOCS}
+
+
+class TestBundle:
+    """Test writing and reading the bundle."""
+
+    def test_table_lists_titles_sizes_and_hashes(self, docs_dir):
+        """Test the offset table built from the manifest hashes."""
+        write_bundle(docs_dir, {**hashes(), "untitled.md": None, "gone.md": "x"})
+
+        entries = read_table(docs_dir / BUNDLE_FILE)
+        assert list(entries) == ["actions", "quickstart", "untitled"]
+        assert entries["actions"].title == "Actions"
+        assert entries["quickstart"].title == "Using the SDK"
+        assert entries["untitled"].title == ""
+        assert entries["actions"].hash == "hash-actions.md"
+        assert entries["untitled"].hash == hashlib.sha256(b"No heading here.\n").hexdigest()
+        assert entries["quickstart"].size == len(DOCS["quickstart.md"].encode("utf-8"))
+
+    def test_offsets_point_at_each_document(self, docs_dir):
+        """Test that a seek to each offset reads the document back byte for byte."""
+        bundle_path = write_bundle(docs_dir, hashes())
+
+        data = bundle_path.read_bytes()
+        for topic, entry in read_table(bundle_path).items():
+            expected = (docs_dir / f"{topic}.md").read_bytes()
+            assert data[entry.offset : entry.offset + entry.size] == expected
+
+        with Bundle(bundle_path) as bundle:
+            assert bundle.read("quickstart.md") == DOCS["quickstart.md"]
+            with pytest.raises(KeyError):
+                bundle.read("missing")
+
+    def test_unpack_restores_the_docs_tree(self, docs_dir, temp_dir):
+        """Test that one bundle is enough to recreate docs/*.md."""
+        bundle_path = write_bundle(docs_dir, hashes())
+        dest = temp_dir / "restored"
+
+        assert unpack(bundle_path, dest) == 3
+        for filename, content in DOCS.items():
+            assert (dest / filename).read_text(encoding="utf-8") == content
+
+    def test_unreadable_bundles_are_rejected(self, docs_dir):
+        """Test that missing or foreign files are not mistaken for a bundle."""
+        assert read_table(docs_dir / BUNDLE_FILE) is None
+        (docs_dir / BUNDLE_FILE).write_text("WSDKBUNDLE 99 0\n")
+        assert read_table(docs_dir / BUNDLE_FILE) is None
+        (docs_dir / BUNDLE_FILE).write_bytes(b"\x89PNG\r\n")
+        assert read_table(docs_dir / BUNDLE_FILE) is None
+        with pytest.raises(ValueError):
+            Bundle(docs_dir / BUNDLE_FILE)
+
+
+class TestBundleCommand:
+    """Test the command-line entry point."""
+
+    def test_list_and_read(self, docs_dir, capfdbinary):
+        """Test listing topics and printing one document."""
+        assert main(["--docs-dir", str(docs_dir), "list"]) == 2
+        write_bundle(docs_dir, hashes())
+        capfdbinary.readouterr()
+
+        assert main(["--docs-dir", str(docs_dir), "list", "--titles"]) == 0
+        assert capfdbinary.readouterr().out.splitlines()[0] == b"actions\tActions"
+        assert main(["--docs-dir", str(docs_dir), "read", "missing"]) == 1
+
+        capfdbinary.readouterr()
+        assert main(["--docs-dir", str(docs_dir), "read", "quickstart"]) == 0
+        assert capfdbinary.readouterr().out == DOCS["quickstart.md"].encode("utf-8")
@@ -0,0 +1,121 @@
+"""
+Unit tests for the docs changelog in workato_sdk_docs/changelog.py
+"""
+
+from datetime import date
+
+from workato_sdk_docs.changelog import (
+    CHANGELOG_FILE,
+    format_runs,
+    load_changelog,
+    main,
+    make_run,
+    query_runs,
+    record_run,
+)
+
+UPDATE = {
+    "changed": True,
+    "change_ratio": 0.123456,
+    "changed_ranges": [("replace", 0, 1, 0, 1)],
+    "changed_headings": ["Execute", "Input fields", "Output fields", "A", "B", "C"],
+}
+
+
+def sample_changelog(docs_dir):
+    record_run(docs_dir, make_run(["quickstart.md"], {}, [], "2026-01-05T08:00:00"))
+    record_run(
+        docs_dir,
+        make_run([], {"sdk-reference__actions.md": UPDATE}, [], "2026-02-10T08:00:00"),
+    )
+    record_run(
+        docs_dir,
+        make_run(["cli__guides__cli__actions.md"], {}, ["old.md"], "2026-03-15T08:00:00"),
+    )
+    return load_changelog(docs_dir)
+
+
+class TestRecording:
+    """Test appending runs to the changelog."""
+
+    def test_run_keeps_ratios_and_headings(self):
+        """Test that only the summary of ChangeDetector results is stored."""
+        run = make_run(["b.md", "a.md"], {"c.md": UPDATE, "d.md": {}}, ["e.md"], "2026-01-01")
+
+        assert run["added"] == ["a.md", "b.md"]
+        assert run["updated"][0] == {
+            "file": "c.md",
+            "change_ratio": 0.1235,
+            "changed_headings": ["Execute", "Input fields", "Output fields", "A", "B"],
+        }
+        # Resumed runs may not know the details of an update
+        assert run["updated"][1] == {"file": "d.md", "change_ratio": None, "changed_headings": []}
+
+    def test_empty_runs_are_skipped_and_old_runs_dropped(self, temp_dir):
+        """Test that no-op fetches add nothing and the file stays bounded."""
+        assert record_run(temp_dir, make_run([], {}, [])) is None
+        assert not (temp_dir / CHANGELOG_FILE).exists()
+
+        for day in range(1, 6):
+            record_run(temp_dir, make_run([f"{day}.md"], {}, [], f"2026-01-0{day}"), keep=3)
+
+        runs = load_changelog(temp_dir)["runs"]
+        assert [run["added"] for run in runs] == [["3.md"], ["4.md"], ["5.md"]]
+
+    def test_unreadable_changelogs_are_ignored(self, temp_dir):
+        """Test that missing, corrupt or foreign files load as None."""
+        assert load_changelog(temp_dir) is None
+        (temp_dir / CHANGELOG_FILE).write_text("{not json")
+        assert load_changelog(temp_dir) is None
+        (temp_dir / CHANGELOG_FILE).write_text('{"version": 99, "runs": []}')
+        assert load_changelog(temp_dir) is None
+
+
+class TestQuerying:
+    """Test filtering runs by date and topic."""
+
+    def test_newest_first_with_limit(self, temp_dir):
+        changelog = sample_changelog(temp_dir)
+
+        runs = query_runs(changelog, limit=2)
+        assert [run["date"][:10] for run in runs] == ["2026-03-15", "2026-02-10"]
+
+    def test_date_range_is_inclusive(self, temp_dir):
+        changelog = sample_changelog(temp_dir)
+
+        runs = query_runs(changelog, since=date(2026, 2, 10), until=date(2026, 2, 10))
+        assert [run["date"][:10] for run in runs] == ["2026-02-10"]
+        assert query_runs(changelog, since=date(2026, 4, 1)) == []
+
+    def test_topic_filter_narrows_each_run(self, temp_dir):
+        """Test substring topic matches and that runs left empty are dropped."""
+        changelog = sample_changelog(temp_dir)
+
+        runs = query_runs(changelog, topic="ACTIONS")
+        assert [run["date"][:10] for run in runs] == ["2026-03-15", "2026-02-10"]
+        assert runs[0]["added"] == ["cli__guides__cli__actions.md"]
+        assert runs[0]["removed"] == []
+
+    def test_format_runs(self, temp_dir):
+        text = format_runs(query_runs(sample_changelog(temp_dir), limit=2))
+
+        assert text.splitlines()[0] == "• 2026-03-15 08:00:"
+        assert "  🆕 cli__guides__cli__actions" in text
+        assert "  🗑️  old" in text
+        assert (
+            "  📄 sdk-reference__actions (12.3% changed in Execute, Input fields, Output fields)"
+            in text
+        )
+
+
+class TestChangelogCommand:
+    """Test the command-line entry point."""
+
+    def test_filters_and_exit_codes(self, temp_dir, capsys):
+        args = ["--docs-dir", str(temp_dir)]
+        assert main(args) == 2
+        sample_changelog(temp_dir)
+
+        assert main(args + ["--topic", "quickstart"]) == 0
+        assert capsys.readouterr().out == "• 2026-01-05 08:00:\n  🆕 quickstart\n"
+        assert main(args + ["--until", "2025-12-31"]) == 1
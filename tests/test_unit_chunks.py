@@ -0,0 +1,171 @@
+"""
+Unit tests for the section-level chunk store in workato_sdk_docs/chunks.py
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import workato_sdk_docs.chunks as chunks_module
+from workato_sdk_docs.chunks import (
+    CHUNK_STORE_FILE,
+    empty_store,
+    file_chunks,
+    find_chunk,
+    load_store,
+    main,
+    parse_heading,
+    read_section,
+    split_chunks,
+    update_store,
+    write_store,
+)
+
+HEADER = (
+    "# Workato SDK Documentation\n\n"
+    "> **Source**: https://docs.workato.com/en/developing-connectors/sdk/actions.html\n\n---\n\n"
+)
+BODY = (
+    "Intro text before any heading.\n\n"
+    "# Actions [​](<#actions>)\n\n"
+    "Actions run an API request.\n\n"
+    "## Input fields [​](<#input-fields>)\n\n"
+    "```ruby\n# Not a heading\ninput_fields: lambda do end\n```\n\n"
+    "### Examples\n\n"
+    "Example one.\n\n"
+    "## Execute\n\nRuns the request.\n\n"
+    "## Examples\n\nExample two.\n"
+)
+DOCUMENT = HEADER + BODY
+
+
+@pytest.fixture
+def docs_dir(temp_dir):
+    (temp_dir / "actions.md").write_text(DOCUMENT, encoding="utf-8")
+    (temp_dir / "quickstart.md").write_text(HEADER + "# Quickstart\n\nHello.\n")
+    return temp_dir
+
+
+def by_id(chunks):
+    return {chunk["id"]: chunk for chunk in chunks}
+
+
+class TestSplitChunks:
+    """Test splitting documents into heading-delimited chunks."""
+
+    def test_heading_anchors(self):
+        """Test that site permalinks are used as anchors, with a slug fallback."""
+        assert parse_heading("## OAuth 2.0 [​](<#oauth-2-0>)") == (2, "OAuth 2.0", "oauth-2-0")
+        assert parse_heading("### Refresh tokens!") == (3, "Refresh tokens!", "refresh-tokens")
+        assert parse_heading("Not a heading") is None
+
+    def test_chunk_ids_and_offsets(self):
+        """Test IDs, byte ranges and that code fences and the fetch header are skipped."""
+        data = DOCUMENT.encode("utf-8")
+        chunks = split_chunks("actions", data)
+
+        assert [chunk["id"] for chunk in chunks] == [
+            "actions#_intro",
+            "actions#actions",
+            "actions#input-fields",
+            "actions#examples",
+            "actions#execute",
+            "actions#examples-1",
+        ]
+        assert data[chunks[0]["start"] :].lstrip().startswith(b"Intro text")
+        assert all(a["end"] == b["start"] for a, b in zip(chunks, chunks[1:]))
+        assert chunks[-1]["end"] == len(data)
+        section = data[chunks[2]["start"] : chunks[2]["end"]].decode("utf-8")
+        assert section.startswith("## Input fields") and "# Not a heading" in section
+
+    def test_section_end_covers_nested_subsections(self):
+        """Test that a section extends over deeper headings only."""
+        chunks = by_id(split_chunks("actions", DOCUMENT.encode("utf-8")))
+
+        assert chunks["actions#input-fields"]["section_end"] == chunks["actions#execute"]["start"]
+        assert chunks["actions#actions"]["section_end"] == len(DOCUMENT.encode("utf-8"))
+        assert chunks["actions#execute"]["section_end"] == chunks["actions#execute"]["end"]
+
+    def test_chunk_hashes_and_tokens(self):
+        """Test that hashes follow content and token counts are populated."""
+        before = by_id(split_chunks("actions", DOCUMENT.encode("utf-8")))
+        after = by_id(split_chunks("actions", DOCUMENT.replace("Runs", "Sends").encode("utf-8")))
+
+        assert before["actions#execute"]["hash"] != after["actions#execute"]["hash"]
+        assert before["actions#actions"]["hash"] == after["actions#actions"]["hash"]
+        assert all(chunk["tokens"] > 0 for chunk in before.values())
+
+
+class TestChunkStore:
+    """Test hash-driven maintenance of the chunk store."""
+
+    def test_unchanged_hashes_skip_chunking(self, docs_dir):
+        """Test that only files whose hash changed are chunked again."""
+        store = empty_store()
+        stats = update_store(store, docs_dir, {"actions.md": "a", "quickstart.md": "q"})
+        assert stats == {"chunked": 2, "removed": 0, "unchanged": 0}
+
+        with patch.object(chunks_module, "split_chunks", wraps=chunks_module.split_chunks) as split:
+            stats = update_store(store, docs_dir, {"actions.md": "a2", "gone.md": "g"})
+
+        assert split.call_count == 1
+        assert stats == {"chunked": 1, "removed": 1, "unchanged": 0}
+        assert sorted(store["files"]) == ["actions.md"]
+
+    def test_write_and_load_round_trip(self, docs_dir):
+        """Test atomic writes and rejection of incompatible stores."""
+        store = empty_store()
+        update_store(store, docs_dir, {"actions.md": "a"})
+        write_store(docs_dir, store)
+
+        assert load_store(docs_dir)["files"] == store["files"]
+        (docs_dir / CHUNK_STORE_FILE).write_text(json.dumps({**store, "version": 0}))
+        assert load_store(docs_dir) is None
+
+    def test_stale_store_falls_back_to_chunking_the_file(self, docs_dir):
+        """Test that a store built from another version of the file is not trusted."""
+        store = empty_store()
+        update_store(store, docs_dir, {"actions.md": "a"})
+        (docs_dir / "actions.md").write_text(HEADER + "# Renamed\n\nNew text.\n")
+
+        chunks = file_chunks(store, docs_dir, "actions")
+
+        assert [chunk["id"] for chunk in chunks] == ["actions#renamed"]
+        assert file_chunks(store, docs_dir, "missing") is None
+
+    def test_find_and_read_section(self, docs_dir):
+        """Test lookup by anchor or heading text and reading by byte range."""
+        chunks = file_chunks(None, docs_dir, "actions")
+
+        assert find_chunk(chunks, "input-fields")["heading"] == "Input fields"
+        assert find_chunk(chunks, "#Input Fields")["heading"] == "Input fields"
+        assert find_chunk(chunks, "execute")["id"] == "actions#execute"
+        assert find_chunk(chunks, "webhooks") is None
+
+        chunk = find_chunk(chunks, "input-fields")
+        nested = read_section(docs_dir, "actions", chunk)
+        assert nested.startswith("## Input fields") and "Example one." in nested
+        assert "Runs the request" not in nested
+        assert "Example one." not in read_section(docs_dir, "actions", chunk, nested=False)
+
+
+class TestChunksCommand:
+    """Test the command-line entry point used by the helper script."""
+
+    def test_prints_one_section(self, docs_dir, capsys):
+        """Test printing a section by ID."""
+        assert main(["--docs-dir", str(docs_dir), "actions#execute"]) == 0
+
+        assert capsys.readouterr().out == "## Execute\n\nRuns the request.\n\n"
+
+    def test_lists_sections_and_exit_codes(self, docs_dir, capsys):
+        """Test the outline and unknown topic/section exit codes."""
+        assert main(["--docs-dir", str(docs_dir), "actions#"]) == 0
+        outline = capsys.readouterr().out
+        assert "• Actions  (actions#actions" in outline
+        assert "  • Input fields  (actions#input-fields" in outline
+
+        assert main(["--docs-dir", str(docs_dir), "actions#webhooks"]) == 1
+        assert "No section 'webhooks' in actions" in capsys.readouterr().err
+        assert main(["--docs-dir", str(docs_dir), "missing#execute"]) == 2
@@ -0,0 +1,193 @@
+"""
+Unit tests for the workato-sdk console script in workato_sdk_docs/cli.py
+"""
+
+import json
+import subprocess
+
+import pytest
+
+from workato_sdk_docs.bundle import write_bundle
+from workato_sdk_docs.changelog import make_run, record_run
+from workato_sdk_docs.chunks import empty_store, update_store, write_store
+from workato_sdk_docs.cli import checked_ago, main, read_freshness, write_freshness
+from workato_sdk_docs.search import build_index, write_index
+
+HEADER = "# Workato SDK Documentation\n\n> **Source**: https://example.com\n\n---\n\n"
+DOCS = {
+    "actions.md": HEADER + "# Actions\n\nActions run an API request.\n\n"
+    "## Execute\n\nRuns the request.\n",
+    "quickstart.md": HEADER + "# Creating a custom connector\n\nStart here.\n",
+}
+
+
+@pytest.fixture
+def docs_dir(temp_dir):
+    docs_dir = temp_dir / "docs"
+    docs_dir.mkdir()
+    for filename, content in DOCS.items():
+        (docs_dir / filename).write_text(content, encoding="utf-8")
+    files = {name: f"hash-{name}" for name in DOCS}
+    manifest = {
+        "files": {
+            "actions.md": {"hash": files["actions.md"], "last_updated": "2026-01-02T00:00:00"},
+            "quickstart.md": {"hash": files["quickstart.md"], "last_updated": "2026-03-04T00:00"},
+        },
+        "fetch_metadata": {"last_fetch_completed": "2026-03-04T00:00:00"},
+    }
+    (docs_dir / "docs_manifest.json").write_text(json.dumps(manifest))
+    write_index(docs_dir, build_index(docs_dir))
+    store = empty_store()
+    update_store(store, docs_dir, files)
+    write_store(docs_dir, store)
+    return docs_dir
+
+
+def run(docs_dir, *args):
+    return main(["--docs-dir", str(docs_dir), *args])
+
+
+class TestReadCommands:
+    """Test list, read and search."""
+
+    def test_list_comes_from_the_manifest(self, docs_dir, capsys):
+        """Test that stray files are not listed and missing manifests are reported."""
+        (docs_dir / "stray.md").write_text("not in the manifest")
+
+        assert run(docs_dir, "list") == 0
+        assert capsys.readouterr().out == "actions\nquickstart\n"
+        assert run(docs_dir.parent, "list") == 2
+        assert "No docs manifest" in capsys.readouterr().err
+
+    def test_read_document_and_section(self, docs_dir, capsys):
+        """Test whole documents, single sections and unknown topics."""
+        assert run(docs_dir, "read", "quickstart") == 0
+        out = capsys.readouterr().out
+        assert out.startswith(DOCS["quickstart.md"])
+        assert "sdk/quickstart.html" in out
+
+        assert run(docs_dir, "read", "actions#execute") == 0
+        assert capsys.readouterr().out == "## Execute\n\nRuns the request.\n"
+        assert run(docs_dir, "read", "actions#nope") == 1
+        assert run(docs_dir, "read", "stray") == 2
+
+    def test_read_falls_back_to_the_bundle(self, docs_dir, capsys):
+        """Test a bundle-only install without the Markdown files."""
+        write_bundle(docs_dir, {name: None for name in DOCS})
+        (docs_dir / "quickstart.md").unlink()
+
+        assert run(docs_dir, "read", "quickstart") == 0
+        assert capsys.readouterr().out.startswith(DOCS["quickstart.md"])
+
+    def test_read_section_from_the_bundle(self, docs_dir, capsys):
+        """Test section reads and outlines on a bundle-only install."""
+        write_bundle(docs_dir, {name: None for name in DOCS})
+        for filename in DOCS:
+            (docs_dir / filename).unlink()
+        (docs_dir / "docs_chunks.json").unlink()
+
+        assert run(docs_dir, "read", "actions#execute") == 0
+        assert capsys.readouterr().out == "## Execute\n\nRuns the request.\n"
+        assert run(docs_dir, "read", "actions#") == 0
+        assert "actions#execute" in capsys.readouterr().out
+        assert run(docs_dir, "read", "actions#nope") == 1
+
+    def test_read_reports_missing_documents(self, docs_dir, capsys):
+        """Test a manifest topic with neither a Markdown file nor a bundle entry."""
+        (docs_dir / "quickstart.md").unlink()
+        assert run(docs_dir, "read", "quickstart") == 2
+        assert "No document for quickstart" in capsys.readouterr().err
+
+        write_bundle(docs_dir, {"actions.md": None})
+        assert run(docs_dir, "read", "quickstart") == 2
+        assert "No document for quickstart" in capsys.readouterr().err
+
+    def test_search(self, docs_dir, capsys):
+        """Test keyword search results and a query with no hits."""
+        assert run(docs_dir, "search", "custom", "connector") == 0
+        assert "1. quickstart — Creating a custom connector" in capsys.readouterr().out
+        assert run(docs_dir, "search", "kubernetes") == 1
+        assert "No results for: kubernetes" in capsys.readouterr().err
+
+    def test_search_without_numpy(self, docs_dir, mocker):
+        """Test that a vector index NumPy cannot load does not break keyword search."""
+        mocker.patch(
+            "workato_sdk_docs.semantic.load_vectors", side_effect=RuntimeError("needs NumPy")
+        )
+
+        assert run(docs_dir, "search", "kubernetes") == 1
+
+
+class TestFreshness:
+    """Test the freshness state shared with the helper script."""
+
+    def test_state_round_trip(self, temp_dir):
+        """Test the one-line format the helper reads and writes."""
+        assert read_freshness(temp_dir) == {}
+        state = {"last_attempt": 200, "last_success": 100, "branch": "main", "result": "offline"}
+        write_freshness(temp_dir, state)
+
+        assert (temp_dir / ".workato-sdk-freshness").read_text() == "200 100 main offline\n"
+        assert read_freshness(temp_dir) == state
+
+    def test_checked_ago(self):
+        """Test the wording of the last-check age."""
+        assert checked_ago(0) == "never checked"
+        assert checked_ago(1000, now=1030) == "last checked just now"
+        assert checked_ago(1000, now=1000 + 60) == "last checked 1 minute ago"
+        assert checked_ago(1000, now=1000 + 3 * 3600) == "last checked 3 hours ago"
+        assert checked_ago(1000, now=1000 + 3 * 86400) == "last checked 3 days ago"
+
+    def test_freshness_reports_the_last_fetch(self, docs_dir, capsys):
+        """Test the summary printed without a network check."""
+        write_freshness(
+            docs_dir.parent,
+            {"last_attempt": 1, "last_success": 0, "branch": "main", "result": "offline"},
+        )
+
+        assert run(docs_dir, "freshness") == 1
+        out = capsys.readouterr().out
+        assert "Could not reach GitHub" in out
+        assert "Last fetched: 2026-03-04T00:00:00" in out
+        assert "Topics: 2" in out
+
+
+class TestWhatsNew:
+    """Test the recent-changes summary."""
+
+    def test_reads_the_changelog(self, docs_dir, capsys):
+        """Test that a changelog answers with filters and no git history."""
+        record_run(docs_dir, make_run(["quickstart.md"], {}, [], "2026-01-05T08:00:00"))
+        record_run(docs_dir, make_run(["actions.md"], {}, [], "2026-03-10T08:00:00"))
+
+        assert run(docs_dir, "whats-new", "--since", "2026-02-01") == 0
+        out = capsys.readouterr().out
+        assert "🆕 actions" in out and "quickstart" not in out
+        assert run(docs_dir, "whats-new", "--topic", "quick") == 0
+        out = capsys.readouterr().out
+        assert "🆕 quickstart" in out and "actions" not in out
+        assert run(docs_dir, "whats-new", "--until", "2025-12-31") == 0
+        assert "No matching documentation updates" in capsys.readouterr().out
+
+    def test_manifest_fallback_outside_git(self, docs_dir, capsys, mocker):
+        """Test that per-page timestamps are used without a git checkout."""
+        mocker.patch("workato_sdk_docs.cli.recent_changes", return_value=None)
+
+        assert run(docs_dir, "whats-new", "--limit", "1") == 0
+        out = capsys.readouterr().out
+        assert "quickstart" in out and "actions" not in out
+
+    def test_git_log(self, docs_dir, capsys):
+        """Test commits that touched docs/*.md are listed with their topics."""
+        repo = docs_dir.parent
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        try:
+            subprocess.run(git + ["init", "-q"], cwd=repo, check=True)
+            subprocess.run(git + ["add", "docs/actions.md"], cwd=repo, check=True)
+            subprocess.run(git + ["commit", "-qm", "docs"], cwd=repo, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git is not available")
+
+        assert run(docs_dir, "whats-new") == 0
+        out = capsys.readouterr().out
+        assert "📄 actions" in out and "quickstart" not in out
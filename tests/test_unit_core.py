@@ -4,9 +4,14 @@ Unit tests for core functionality in fetch_workato_docs.py
 Tests the fundamental parsing, conversion, and utility functions.
 """
 
+import gzip
 import hashlib
+import io
 import json
+import random
+import sys
 import tempfile
+import types
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -15,13 +20,41 @@ import requests
 from bs4 import BeautifulSoup
 
 # Import the functions we want to test
+import scripts.fetch_workato_docs as fetch_docs
 from scripts.fetch_workato_docs import (
+    AdaptiveRateLimiter,
+    ContentError,
+    FetchCheckpoint,
+    HTMLCache,
     HTTPError,
+    HttpxSession,
+    ManifestStore,
     NetworkError,
+    RetryPolicy,
+    TokenBucket,
     WorkatoDocsConverter,
+    WorkatoSDKCrawler,
+    _init_converter_process,
+    _thread_converter,
+    body_hash,
+    conditional_headers,
+    convert_page,
+    create_session,
+    default_html_parser,
+    document_body,
+    download_page,
     fetch_page_content,
+    fetch_pages_concurrently,
+    iter_sitemap,
     load_manifest,
+    main,
+    make_downloader,
+    page_changed_since,
+    parse_args,
+    parse_retry_after,
+    render_document,
     save_manifest,
+    stored_validators,
     url_to_filename,
 )
 
@@ -380,6 +413,21 @@ class TestFetchPageContent:
         with pytest.raises(NetworkError):
             fetch_page_content(mock_session_class.return_value, converter, "https://example.com")
 
+    def test_fetch_page_content_shares_the_retry_policy(self):
+        """Test that retries are counted against the policy passed in."""
+        session = Mock()
+        session.get.side_effect = requests.ConnectionError("Connection failed")
+        policy = RetryPolicy(max_retries=2)
+
+        for _ in range(2):
+            with pytest.raises(NetworkError):
+                fetch_page_content(
+                    session, WorkatoDocsConverter(), "https://example.com", retry_policy=policy
+                )
+
+        assert session.get.call_count == 6
+        assert policy.retries == 4
+
     @patch("scripts.fetch_workato_docs.requests.Session")
     def test_fetch_page_content_timeout(self, mock_session_class):
         """Test handling of timeouts."""
@@ -434,3 +482,1248 @@ class TestErrorConditions:
 
         # Should handle gracefully
         assert isinstance(result, str)
+
+
+class TestTokenBucket:
+    """Test the global token-bucket rate limiter."""
+
+    def test_token_bucket_burst_does_not_wait(self):
+        """Test that requests within the bucket capacity are not delayed."""
+        bucket = TokenBucket(rate=2.0, capacity=3)
+        waits = [bucket.acquire() for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+
+    def test_token_bucket_waits_when_empty(self):
+        """Test that requests beyond capacity wait for the refill rate."""
+        with patch.object(fetch_docs.time, "monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=2.0, capacity=1)
+            assert bucket.acquire() == 0.0
+            assert bucket.acquire() == pytest.approx(0.5)
+            assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_token_bucket_rejects_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestAdaptiveRateLimiter:
+    """Test the AIMD rate limiter driven by server feedback."""
+
+    def test_fast_responses_ramp_up_to_max_rate(self):
+        """Test additive increase while latency stays under the target."""
+        limiter = AdaptiveRateLimiter(2.0, max_rate=3.0, increase=0.5, latency_target=1.0)
+
+        limiter.record_success(0.1)
+        assert limiter.rate == 2.5
+        limiter.record_success(5.0)
+        assert limiter.rate == 2.5
+        for _ in range(5):
+            limiter.record_success(0.1)
+        assert limiter.rate == 3.0
+
+    def test_throttling_backs_off_to_min_rate(self):
+        """Test multiplicative decrease on 429/503 responses and connection errors."""
+        limiter = AdaptiveRateLimiter(8.0, min_rate=1.5, decrease=0.5)
+
+        limiter.observe(429, 0.1)
+        assert limiter.rate == 4.0
+        limiter.observe(404, 0.1)
+        assert limiter.rate == 4.0
+        limiter.observe(503, 0.1)
+        limiter.record_failure()
+        assert limiter.rate == 1.5
+        assert limiter.state()["backoffs"] == 3
+        assert limiter.state()["peak_rate"] == 8.0
+
+    def test_retry_after_pauses_every_caller(self):
+        """Test that a Retry-After delay is applied to the next acquire."""
+        with (
+            patch.object(fetch_docs.time, "monotonic", return_value=100.0),
+            patch.object(fetch_docs.time, "sleep") as sleep,
+        ):
+            limiter = AdaptiveRateLimiter(10.0, capacity=5)
+            limiter.observe(429, 0.1, retry_after=7.0)
+            assert limiter.acquire() == pytest.approx(7.0)
+
+        sleep.assert_called_once_with(pytest.approx(7.0))
+        assert limiter.state()["retry_after_pauses"] == 1
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for delays, HTTP dates and junk."""
+        assert parse_retry_after("30") == 30.0
+        assert parse_retry_after("100000") == fetch_docs.MAX_RETRY_AFTER
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_download_feeds_limiter_and_reports_retry_after(self):
+        """Test that download_page reports throttling to the limiter and the caller."""
+        response = Mock(status_code=429, headers={"Retry-After": "3"})
+        response.raise_for_status.side_effect = requests.HTTPError("429")
+        session = Mock(get=Mock(return_value=response))
+        limiter = AdaptiveRateLimiter(1000.0, capacity=10)
+
+        with pytest.raises(HTTPError) as excinfo:
+            download_page(session, "https://docs.workato.com/a.html", rate_limiter=limiter)
+
+        assert excinfo.value.status_code == 429
+        assert excinfo.value.retry_after == 3.0
+        # Retries go through the same limiter, so every attempt backed it off
+        attempts = session.get.call_count
+        assert limiter.state()["backoffs"] == attempts
+        assert limiter.rate == 1000.0 * 0.5**attempts
+
+
+class TestRetryPolicy:
+    """Test retry rules, jittered delays, the retry budget and deferred retries."""
+
+    def _flaky(self, errors):
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return "ok"
+
+        return func, calls
+
+    def test_404_is_never_retried(self):
+        """Test that client errors other than 408/425/429 fail immediately."""
+        func, calls = self._flaky([HTTPError("Client error 404", 404)])
+
+        with pytest.raises(HTTPError):
+            RetryPolicy().call(func)
+        assert len(calls) == 1
+
+    def test_5xx_and_connection_errors_are_retried(self):
+        """Test that transient errors are retried until the call succeeds."""
+        errors = [HTTPError("Server error 503", 503), NetworkError("reset"), HTTPError("429", 429)]
+        func, calls = self._flaky(errors)
+        policy = RetryPolicy(max_retries=3)
+
+        assert policy.call(func) == "ok"
+        assert len(calls) == 4
+        assert policy.state()["retries"] == 3
+
+    def test_decorrelated_jitter_bounds(self):
+        """Test that delays stay within [base, min(cap, 3 * previous)] and honour Retry-After."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0, rng=random.Random(7))
+        previous = 1.0
+        delays = []
+        for _ in range(50):
+            delay = policy.next_delay(previous)
+            assert 1.0 <= delay <= min(10.0, previous * 3)
+            delays.append(delay)
+            previous = delay
+
+        assert len(set(delays)) > 1
+        assert policy.next_delay(1.0, retry_after=25.0) == 25.0
+
+    def test_budget_caps_total_retry_time(self):
+        """Test that retries stop once the run's retry budget is spent."""
+        policy = RetryPolicy(max_retries=10, base_delay=2.0, max_delay=2.0, budget=5.0)
+        func, calls = self._flaky([NetworkError("down")] * 10)
+
+        with pytest.raises(NetworkError):
+            policy.call(func)
+
+        assert len(calls) == 3
+        assert policy.state()["retry_seconds"] == 4.0
+        assert policy.state()["budget_exhausted"] == 1
+
+    def test_failing_pages_are_deferred_to_the_end(self, temp_dir):
+        """Test that main() retries transient failures after the other pages."""
+        urls = [
+            f"https://docs.workato.com/en/developing-connectors/sdk/p{i}.html" for i in range(4)
+        ]
+        failures = {urls[1]: 3, urls[2]: 99}
+        calls = []
+
+        def fake_download(session, url, validators=None, rate_limiter=None):
+            calls.append(url)
+            if url == urls[3]:
+                raise HTTPError(f"Client error 404 for {url}", 404)
+            if failures.get(url, 0) > 0:
+                failures[url] -= 1
+                raise NetworkError(f"Connection error for {url}")
+            html = f"<main><h1>Page</h1><p>{'Reference text. ' * 5}{url}</p></main>"
+            return {"url": url, "html": html, "validators": {}}
+
+        args = ["--docs-dir", str(temp_dir), "--workers", "1", "--rate", "1000", "--no-cache"]
+        with (
+            patch.object(fetch_docs, "SDK_URLS", urls),
+            patch.object(fetch_docs, "download_page", side_effect=fake_download),
+        ):
+            main(args + ["--max-retries", "3"])
+        metadata = json.loads((temp_dir / "docs_manifest.json").read_text())["fetch_metadata"]
+
+        # Two quick attempts in line, then the rest after p3, which is never retried
+        assert calls == [urls[0], urls[1], urls[1], urls[2], urls[2], urls[3]] + [
+            urls[1],
+            urls[1],
+            urls[2],
+            urls[2],
+            urls[2],
+            urls[2],
+        ]
+        assert metadata["new_files"] == 2
+        assert metadata["pages_failed"] == 2
+        assert metadata["retry_policy"]["deferred_pages"] == 2
+
+
+class TestConcurrentFetch:
+    """Test the concurrent fetch engine used by main()."""
+
+    def _fake_download(self, session, url, validators=None, rate_limiter=None):
+        html = f"<html><body><main><h1>Page</h1><p>Content for {url}</p></main></body></html>"
+        return {"url": url, "html": html, "validators": {}}
+
+    def test_fetch_pages_concurrently_preserves_order(self):
+        """Test that results are yielded in input order regardless of completion order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        urls = [
+            f"https://docs.workato.com/en/developing-connectors/sdk/p{i}.html" for i in range(20)
+        ]
+        with patch.object(fetch_docs, "download_page", side_effect=self._fake_download):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                download = make_downloader(Mock(), TokenBucket(rate=1000, capacity=20))
+                results = fetch_pages_concurrently(urls, executor, download)
+                fetched = [(url, future.result()["url"]) for url, future in results]
+
+        assert [url for url, _ in fetched] == urls
+        assert all(url == result_url for url, result_url in fetched)
+
+    def test_thread_converter_is_per_thread(self):
+        """Test that each worker thread gets its own converter instance."""
+        import threading
+
+        converters = []
+        thread = threading.Thread(target=lambda: converters.append(_thread_converter()))
+        thread.start()
+        thread.join()
+
+        assert _thread_converter() is _thread_converter()
+        assert converters[0] is not _thread_converter()
+
+    def test_main_concurrent_manifest_is_deterministic(self, temp_dir):
+        """Test that main() writes the same manifest for any worker count."""
+        urls = [
+            f"https://docs.workato.com/en/developing-connectors/sdk/p{i}.html" for i in range(12)
+        ]
+        manifests = []
+        for workers in ("1", "6"):
+            docs_dir = temp_dir / f"docs_{workers}"
+            with (
+                patch.object(fetch_docs, "SDK_URLS", urls),
+                patch.object(fetch_docs, "download_page", side_effect=self._fake_download),
+            ):
+                main(
+                    ["--docs-dir", str(docs_dir), "--workers", workers, "--rate", "1000"]
+                    + ["--no-cache"]
+                )
+            manifest = json.loads((docs_dir / "docs_manifest.json").read_text())
+            manifests.append(manifest)
+
+        assert list(manifests[0]["files"]) == list(manifests[1]["files"])
+        assert [e["original_url"] for e in manifests[0]["files"].values()] == urls
+        assert [e["original_url"] for e in manifests[1]["files"].values()] == urls
+        assert manifests[1]["fetch_metadata"]["new_files"] == 12
+        assert manifests[1]["fetch_metadata"]["fetch_workers"] == 6
+
+    def test_parse_args_rejects_zero_workers(self):
+        """Test that an invalid worker count is rejected."""
+        with pytest.raises(SystemExit):
+            parse_args(["--workers", "0"])
+
+
+class TestConditionalRevalidation:
+    """Test ETag / Last-Modified revalidation."""
+
+    URL = "https://docs.workato.com/en/developing-connectors/sdk/cli.html"
+
+    def test_conditional_headers(self):
+        """Test that stored validators become conditional request headers."""
+        headers = conditional_headers({"etag": '"abc"', "last_modified": "Mon, 01 Jan 2024"})
+        assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jan 2024"}
+        assert conditional_headers(None) == {}
+        assert conditional_headers({"etag": None}) == {}
+
+    def test_fetch_page_content_not_modified_skips_conversion(self):
+        """Test that a 304 response returns without converting anything."""
+        session = Mock()
+        session.get.return_value = Mock(status_code=304, headers={})
+        converter = Mock()
+
+        result = fetch_page_content(session, converter, self.URL, {"etag": '"abc"'})
+
+        assert result == {"url": self.URL, "not_modified": True}
+        assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        converter.html_to_markdown.assert_not_called()
+
+    def test_fetch_page_content_returns_validators(self, sample_workato_html):
+        """Test that validators from the response are returned with the page."""
+        session = Mock()
+        session.get.return_value = Mock(
+            status_code=200,
+            text=sample_workato_html,
+            headers={
+                "content-type": "text/html",
+                "ETag": '"v2"',
+                "Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT",
+            },
+        )
+
+        result = fetch_page_content(session, WorkatoDocsConverter(), self.URL)
+
+        assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+        assert result["validators"] == {
+            "etag": '"v2"',
+            "last_modified": "Tue, 02 Jan 2024 00:00:00 GMT",
+        }
+
+    def test_stored_validators_requires_file_on_disk(self, temp_dir):
+        """Test that validators are only used when the Markdown file still exists."""
+        manifest = {
+            "files": {
+                "cli.md": {"original_url": self.URL, "hash": "h", "etag": '"abc"'},
+                "gone.md": {"original_url": self.URL + "?gone", "hash": "h", "etag": '"x"'},
+            }
+        }
+        (temp_dir / "cli.md").write_text("# CLI")
+
+        assert stored_validators(manifest, temp_dir) == {
+            self.URL: {"etag": '"abc"', "last_modified": None}
+        }
+
+    def test_main_keeps_entry_on_not_modified(self, temp_dir):
+        """Test that a 304 keeps the existing manifest entry and counts as unchanged."""
+        html = "<main><h1>CLI</h1><p>" + "Command line reference. " * 10 + "</p></main>"
+
+        def fake_download(session, url, validators=None, rate_limiter=None):
+            if validators:
+                return {"url": url, "not_modified": True}
+            return {"url": url, "html": html, "validators": {"etag": '"v1"'}}
+
+        args = ["--docs-dir", str(temp_dir), "--rate", "1000", "--no-cache"]
+        with (
+            patch.object(fetch_docs, "SDK_URLS", [self.URL]),
+            patch.object(fetch_docs, "download_page", side_effect=fake_download),
+        ):
+            main(args)
+            first = json.loads((temp_dir / "docs_manifest.json").read_text())
+            main(args)
+            second = json.loads((temp_dir / "docs_manifest.json").read_text())
+
+        assert first["files"]["cli.md"]["etag"] == '"v1"'
+        assert second["files"]["cli.md"] == first["files"]["cli.md"]
+        assert second["fetch_metadata"]["not_modified_files"] == 1
+        assert second["fetch_metadata"]["unchanged_files"] == 1
+
+
+class TestConversionPipeline:
+    """Test the download / process-pool conversion split."""
+
+    URL = "https://docs.workato.com/en/developing-connectors/sdk/guides/authentication.html"
+
+    def test_convert_page(self, sample_workato_html):
+        """Test converting a downloaded page keeps its validators."""
+        page = {"url": self.URL, "html": sample_workato_html, "validators": {"etag": '"e"'}}
+        result = convert_page(WorkatoDocsConverter(), page)
+
+        assert "Authentication Guide" in result["content"]
+        assert result["content_hash"] == hashlib.sha256(result["content"].encode()).hexdigest()
+        assert result["validators"] == {"etag": '"e"'}
+
+    def test_convert_page_too_short(self):
+        """Test that near-empty conversions are rejected."""
+        with pytest.raises(ContentError):
+            convert_page(
+                Mock(html_to_markdown=Mock(return_value="tiny")), {"url": self.URL, "html": ""}
+            )
+
+    def test_process_pool_pipeline(self, sample_workato_html):
+        """Test that downloads on threads are converted in worker processes, in order."""
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        urls = [f"{self.URL}?page={i}" for i in range(6)]
+
+        def fake_download(session, url, validators=None, rate_limiter=None):
+            if url.endswith("=3"):
+                return {"url": url, "not_modified": True}
+            return {"url": url, "html": sample_workato_html, "validators": {}}
+
+        with (
+            patch.object(fetch_docs, "download_page", side_effect=fake_download),
+            ThreadPoolExecutor(max_workers=3) as executor,
+            ProcessPoolExecutor(max_workers=2, initializer=_init_converter_process) as pool,
+        ):
+            download = make_downloader(Mock(), TokenBucket(rate=1000, capacity=6))
+            results = fetch_pages_concurrently(urls, executor, download, None, pool)
+            pages = [(url, future.result()) for url, future in results]
+
+        assert [url for url, _ in pages] == urls
+        assert pages[3][1] == {"url": urls[3], "not_modified": True}
+        for url, page in pages[:3] + pages[4:]:
+            assert page["url"] == url
+            assert "Authentication Guide" in page["content"]
+
+    def test_pipeline_propagates_download_errors(self):
+        """Test that download failures surface on the chained future."""
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        with (
+            patch.object(fetch_docs, "download_page", side_effect=NetworkError("down")),
+            ThreadPoolExecutor(max_workers=1) as executor,
+            ProcessPoolExecutor(max_workers=1) as pool,
+        ):
+            download = make_downloader(Mock(), TokenBucket(rate=1000))
+            results = fetch_pages_concurrently([self.URL], executor, download, None, pool)
+            (_, future), *_ = list(results)
+            with pytest.raises(NetworkError):
+                future.result()
+
+
+class TestHTMLCache:
+    """Test the content-addressed raw HTML cache and offline replay."""
+
+    URL = "https://docs.workato.com/en/developing-connectors/sdk/cli.html"
+
+    def test_put_and_get_roundtrip(self, temp_dir):
+        """Test that bodies are stored compressed under their sha256."""
+        cache = HTMLCache(temp_dir)
+        html = "<html><body>" + "CLI docs " * 100 + "</body></html>"
+        digest = cache.put(self.URL, html, {"etag": '"e1"'})
+
+        object_path = temp_dir / "objects" / digest[:2] / f"{digest}.html.gz"
+        assert digest == hashlib.sha256(html.encode()).hexdigest()
+        assert object_path.stat().st_size < len(html)
+        assert cache.get(self.URL) == html
+        assert cache.load_page(self.URL)["validators"] == {"etag": '"e1"'}
+
+    def test_index_persists_after_flush(self, temp_dir):
+        """Test that a new cache instance sees flushed entries."""
+        cache = HTMLCache(temp_dir)
+        cache.put(self.URL, "<p>cached</p>")
+        cache.flush()
+
+        assert HTMLCache(temp_dir).get(self.URL) == "<p>cached</p>"
+
+    def test_corrupt_object_is_a_miss(self, temp_dir):
+        """Test that a tampered object is not returned."""
+        import gzip
+
+        cache = HTMLCache(temp_dir)
+        digest = cache.put(self.URL, "<p>original</p>")
+        (temp_dir / "objects" / digest[:2] / f"{digest}.html.gz").write_bytes(
+            gzip.compress(b"<p>tampered</p>")
+        )
+
+        assert cache.get(self.URL) is None
+        with pytest.raises(ContentError):
+            cache.load_page(self.URL)
+
+    def test_eviction_removes_orphans_then_oldest(self, temp_dir):
+        """Test size-based eviction order."""
+        import os
+
+        cache = HTMLCache(temp_dir, max_bytes=0)
+        old_digest = cache.put(self.URL, os.urandom(2000).hex())
+        cache.put(self.URL, os.urandom(2000).hex())  # orphans the first body
+        cache.put(self.URL + "?b", os.urandom(2000).hex())
+        sizes = {p.name: p.stat().st_size for p in (temp_dir / "objects").glob("*/*")}
+        cache.index[self.URL]["stored_at"] = "2000-01-01T00:00:00"
+        cache.max_bytes = sum(sizes.values()) - sizes[f"{old_digest}.html.gz"] - 1
+
+        assert cache.evict() == 2
+        assert cache.get(self.URL) is None
+        assert cache.get(self.URL + "?b") is not None
+
+    def test_main_replays_from_cache(self, temp_dir):
+        """Test that --from-cache re-converts cached HTML without any downloads."""
+        html = "<main><h1>CLI</h1><p>" + "Command line reference. " * 10 + "</p></main>"
+        cache_dir = temp_dir / "cache"
+        cache = HTMLCache(cache_dir)
+        cache.put(self.URL, html, {"etag": '"v1"'})
+        cache.flush()
+
+        docs_dir = temp_dir / "docs"
+        with (
+            patch.object(fetch_docs, "SDK_URLS", [self.URL]),
+            patch.object(fetch_docs, "download_page") as download_page,
+        ):
+            main(["--docs-dir", str(docs_dir), "--cache-dir", str(cache_dir), "--from-cache"])
+
+        download_page.assert_not_called()
+        manifest = json.loads((docs_dir / "docs_manifest.json").read_text())
+        assert manifest["files"]["cli.md"]["etag"] == '"v1"'
+        assert manifest["fetch_metadata"]["fetch_method"] == "cache_replay"
+        assert "Command line reference" in (docs_dir / "cli.md").read_text()
+
+    def test_main_replay_keeps_uncached_entries(self, temp_dir):
+        """Test that --from-cache leaves pages missing from a partial cache alone."""
+        html = "<main><h1>CLI</h1><p>" + "Command line reference. " * 10 + "</p></main>"
+        other_url = "https://docs.workato.com/en/developing-connectors/sdk/quickstart.html"
+        cache_dir = temp_dir / "cache"
+        cache = HTMLCache(cache_dir)
+        cache.put(self.URL, html)
+        cache.flush()
+
+        docs_dir = temp_dir / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "quickstart.md").write_text("# Quickstart\n")
+        entry = {"original_url": other_url, "hash": "h", "last_updated": "2026-01-01T00:00:00"}
+        (docs_dir / "docs_manifest.json").write_text(
+            json.dumps({"files": {"quickstart.md": entry}})
+        )
+        with (
+            patch.object(fetch_docs, "SDK_URLS", [self.URL, other_url]),
+            patch.object(fetch_docs, "download_page") as download_page,
+        ):
+            main(["--docs-dir", str(docs_dir), "--cache-dir", str(cache_dir), "--from-cache"])
+
+        download_page.assert_not_called()
+        manifest = json.loads((docs_dir / "docs_manifest.json").read_text())
+        assert manifest["files"]["quickstart.md"] == entry
+        assert "cli.md" in manifest["files"]
+        assert manifest["fetch_metadata"]["pages_processed"] == 1
+        assert manifest["fetch_metadata"]["pages_failed"] == 0
+
+    def test_main_stores_fetched_html(self, temp_dir):
+        """Test that fetched pages are written to the cache."""
+        html = "<main><h1>CLI</h1><p>" + "Command line reference. " * 10 + "</p></main>"
+        cache_dir = temp_dir / "cache"
+        with (
+            patch.object(fetch_docs, "SDK_URLS", [self.URL]),
+            patch.object(
+                fetch_docs,
+                "download_page",
+                return_value={"url": self.URL, "html": html, "validators": {}},
+            ),
+        ):
+            main(["--docs-dir", str(temp_dir / "docs"), "--cache-dir", str(cache_dir)])
+
+        assert HTMLCache(cache_dir).get(self.URL) == html
+
+
+class TestSingleParseConversion:
+    """Test tree-based conversion that skips the serialise / re-parse round trip."""
+
+    SNIPPETS = [
+        "<html><body><p>R&amp;D a &lt; b &gt; c &nbsp; x&copy;</p><!-- c --><p>x<!--y-->z</p>"
+        "</body></html>",
+        "<main class='content'><h1>T</h1><script>var a = 1 < 2 && b;</script><br>"
+        "<img src='a.png' alt='A &amp; B'><pre><code>if a < b &amp;&amp; c\n  x\n</code></pre>"
+        "<ul><li>1. item</li><li><em>e</em> <strong>s</strong>t</li></ul>"
+        "<a href='/x?a=1&amp;b=2' title='t'>link</a></main>",
+        "<html><body><p>Unclosed paragraph<h1>Title</p>",
+        "<div class='sidebar'>Nav</div><main><h1>Main</h1><p>1\\. here * _u_</p></main>",
+        "",
+    ]
+
+    def _legacy_markdown(self, html):
+        converter = WorkatoDocsConverter(parser="html.parser")
+        return converter.h2t.handle(converter.extract_main_content(html))
+
+    def _tree_markdown(self, html):
+        converter = WorkatoDocsConverter(parser="html.parser")
+        return converter.tree_to_markdown(converter.select_main_content(converter.parse_html(html)))
+
+    def test_tree_conversion_matches_string_conversion(self, test_fixtures_dir):
+        """Test that walking the tree produces byte-identical html2text output."""
+        pages = [p.read_text() for p in sorted((test_fixtures_dir / "sample_html").glob("*.html"))]
+        for html in self.SNIPPETS + pages:
+            assert self._tree_markdown(html) == self._legacy_markdown(html)
+
+    def test_default_parser_falls_back_without_lxml(self):
+        """Test that html.parser is used when lxml is not installed."""
+        import sys
+
+        with patch.dict(sys.modules, {"lxml": None}):
+            assert default_html_parser() == "html.parser"
+            assert WorkatoDocsConverter().parser == "html.parser"
+
+    def test_crawl_page_parses_once(self, sample_workato_html):
+        """Test that the crawler shares one parse between links and content."""
+        converter = WorkatoDocsConverter()
+        session = Mock()
+        session.get.return_value = Mock(
+            text=sample_workato_html.replace(
+                "<h1>", '<a href="/en/developing-connectors/sdk/cli.html">CLI</a><h1>'
+            )
+        )
+        crawler = WorkatoSDKCrawler(session, converter)
+
+        with patch.object(converter, "parse_html", wraps=converter.parse_html) as parse_html:
+            page = crawler.crawl_page("https://docs.workato.com/en/developing-connectors/sdk.html")
+
+        assert parse_html.call_count == 1
+        assert page["links"] == ["https://docs.workato.com/en/developing-connectors/sdk/cli.html"]
+        assert "Authentication Guide" in page["content"]
+
+
+class TestStreamingPostProcess:
+    """Test the single-pass markdown post-processor."""
+
+    SAMPLES = [
+        "",
+        "Intro\n\n\n\nBody\n   \n\t\nEnd\n\n\n",
+        "[code]\nputs 'hi'\n[/code]\n\n[code]$ gem install workato-connector-sdk[/code]",
+        "```ruby\nx = 1\n\n\n\ny = 2\n```\n\n\n",
+        "stray [/code] tag and [code] unclosed\n\n\nblock [code] nested",
+        "\n\n  \nLeading blanks\n[code]# comment\n\n\n[/code][/code]\n \n",
+    ]
+
+    @staticmethod
+    def _legacy_post_process(markdown, source_url, fetched):
+        """Reference copy of the original multi-pass implementation."""
+        import re
+
+        processed_lines = [
+            "# Workato SDK Documentation",
+            "",
+            f"> **Source**: {source_url}",
+            f"> **Fetched**: {fetched}",
+            "",
+            "---",
+            "",
+        ]
+        in_code_block = False
+        for line in markdown.split("\n"):
+            if line.strip().startswith("```"):
+                in_code_block = not in_code_block
+            if not in_code_block and line.strip() == "" and processed_lines[-1] == "":
+                continue
+            processed_lines.append(line)
+        markdown = "\n".join(processed_lines)
+        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        markdown = re.sub(r"^\s+$", "", markdown, flags=re.MULTILINE)
+
+        def replace_code_block(match):
+            content = match.group(1)
+            if content.strip().startswith("$") or content.strip().startswith("#"):
+                return f"```bash\n{content}\n```"
+            return f"```ruby\n{content}\n```"
+
+        markdown = re.sub(r"\[code\](.*?)\[/code\]", replace_code_block, markdown, flags=re.DOTALL)
+        return re.sub(r"\[/code\]", "", markdown)
+
+    def _post_process(self, markdown):
+        fixed_now = Mock()
+        fixed_now.now.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+        with patch.object(fetch_docs, "datetime", fixed_now):
+            return WorkatoDocsConverter().post_process_markdown(markdown, "https://example.com")
+
+    def test_output_matches_multi_pass_implementation(self, test_fixtures_dir):
+        """Test byte-identical output on samples, fixtures and random documents."""
+        import random
+
+        converter = WorkatoDocsConverter()
+        pages = [
+            converter.tree_to_markdown(
+                converter.select_main_content(converter.parse_html(p.read_text()))
+            )
+            for p in sorted((test_fixtures_dir / "sample_html").glob("*.html"))
+        ]
+        tokens = [
+            "\n",
+            "\n",
+            " ",
+            "\t",
+            "\xa0",
+            "```",
+            "[code]",
+            "[/code]",
+            "$",
+            "#",
+            "text",
+        ]
+        rng = random.Random(6)
+        generated = ["".join(rng.choices(tokens, k=rng.randint(0, 30))) for _ in range(2000)]
+
+        for markdown in self.SAMPLES + pages + generated:
+            expected = self._legacy_post_process(
+                markdown, "https://example.com", "2024-01-01T00:00:00"
+            )
+            assert self._post_process(markdown) == expected
+
+    def test_code_markers_become_fenced_blocks(self):
+        """Test language hints and handling of unpaired markers."""
+        result = self._post_process(
+            "[code]$ workato exec[/code]\n[code]\nget: ->() {}\n[/code]\na [/code] b [code] c"
+        )
+
+        assert "```bash\n$ workato exec\n```" in result
+        assert "```ruby\n\nget: ->() {}\n\n```" in result
+        assert result.endswith("a  b [code] c")
+
+    def test_blank_runs_collapse_to_single_line(self):
+        """Test that whitespace-only runs collapse, including inside fences."""
+        result = self._post_process("a\n \n\t\n\nb\n```\n\n\n\n```")
+
+        assert result.endswith("---\n\na\n\nb\n```\n\n```")
+
+
+class TestBodyHashing:
+    """Test that hashes ignore the volatile document header."""
+
+    URL = "https://docs.workato.com/en/developing-connectors/sdk/cli.html"
+    HTML = "<main><h1>CLI</h1><p>" + "Command line reference. " * 10 + "</p></main>"
+
+    def test_render_document_matches_post_processing(self, test_fixtures_dir):
+        """Test that body + rendered header equals the full post-processed document."""
+        converter = WorkatoDocsConverter()
+        fixed_now = Mock()
+        fixed_now.now.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+        for page in sorted((test_fixtures_dir / "sample_html").glob("*.html")):
+            html = page.read_text()
+            with patch.object(fetch_docs, "datetime", fixed_now):
+                document = converter.html_to_markdown(html, self.URL)
+            body = converter.html_to_markdown(html, self.URL, include_header=False)
+
+            assert render_document(body, self.URL, "2024-01-01T00:00:00") == document
+            assert document_body(document) == body
+            assert "Fetched" not in body
+
+    def test_document_body_leaves_headerless_content_alone(self):
+        """Test that content without the rendered header is returned unchanged."""
+        assert document_body("# Other\n\n---\n\nText") == "# Other\n\n---\n\nText"
+
+    def test_refresh_without_changes_writes_nothing(self, temp_dir):
+        """Test that a second identical fetch neither rewrites files nor bumps dates."""
+
+        def fake_download(session, url, validators=None, rate_limiter=None):
+            return {"url": url, "html": self.HTML, "validators": {}}
+
+        args = ["--docs-dir", str(temp_dir), "--rate", "1000", "--no-cache"]
+        with (
+            patch.object(fetch_docs, "SDK_URLS", [self.URL]),
+            patch.object(fetch_docs, "download_page", side_effect=fake_download),
+        ):
+            main(args)
+            first = json.loads((temp_dir / "docs_manifest.json").read_text())
+            with patch.object(
+                fetch_docs, "save_markdown_file", wraps=fetch_docs.save_markdown_file
+            ) as save:
+                main(args)
+            second = json.loads((temp_dir / "docs_manifest.json").read_text())
+
+        save.assert_not_called()
+        assert second["files"]["cli.md"] == first["files"]["cli.md"]
+        assert second["fetch_metadata"]["unchanged_files"] == 1
+        assert second["fetch_metadata"]["has_meaningful_changes"] is False
+
+    def test_whole_document_hash_is_migrated_without_rewrite(self, temp_dir):
+        """Test that files hashed with their header are recognised as unchanged."""
+        body = WorkatoDocsConverter().html_to_markdown(self.HTML, self.URL, include_header=False)
+        document = render_document(body, self.URL, "2024-01-01T00:00:00")
+        (temp_dir / "cli.md").write_text(document)
+        legacy_hash = hashlib.sha256(document.encode()).hexdigest()
+        save_manifest(
+            temp_dir,
+            {"files": {"cli.md": {"original_url": self.URL, "hash": legacy_hash}}},
+        )
+
+        def fake_download(session, url, validators=None, rate_limiter=None):
+            return {"url": url, "html": self.HTML, "validators": {}}
+
+        with (
+            patch.object(fetch_docs, "SDK_URLS", [self.URL]),
+            patch.object(fetch_docs, "download_page", side_effect=fake_download),
+        ):
+            main(["--docs-dir", str(temp_dir), "--rate", "1000", "--no-cache"])
+        manifest = json.loads((temp_dir / "docs_manifest.json").read_text())
+
+        assert (temp_dir / "cli.md").read_text() == document
+        assert manifest["files"]["cli.md"]["hash"] == body_hash(body)
+        assert manifest["fetch_metadata"]["unchanged_files"] == 1
+
+
+class TestManifestStore:
+    """Test the journaled manifest store."""
+
+    ENTRY = {"original_url": "https://example.com/a.html", "hash": "h1", "last_updated": "t"}
+
+    def test_updates_survive_without_compaction(self, temp_dir):
+        """Test that journaled updates are replayed after an interrupted run."""
+        save_manifest(temp_dir, {"files": {"old.md": self.ENTRY}})
+        store = ManifestStore(temp_dir)
+        store.load()
+        store.put("a.md", self.ENTRY)
+        store.delete("old.md")
+        store.close()  # simulate a crash: no compaction
+
+        snapshot = json.loads((temp_dir / "docs_manifest.json").read_text())
+        assert list(snapshot["files"]) == ["old.md"]
+        assert list(load_manifest(temp_dir)["files"]) == ["a.md"]
+
+    def test_torn_final_record_is_ignored(self, temp_dir):
+        """Test that a partially written journal line does not break loading."""
+        store = ManifestStore(temp_dir)
+        store.load()
+        store.put("a.md", self.ENTRY)
+        store.close()
+        with (temp_dir / "docs_manifest.journal.jsonl").open("a") as journal:
+            journal.write('{"op": "put", "file": "b.md", "en')
+
+        assert list(load_manifest(temp_dir)["files"]) == ["a.md"]
+
+    def test_appends_after_a_torn_record_survive(self, temp_dir):
+        """Test that the torn tail is cut before new records are appended."""
+        store = ManifestStore(temp_dir)
+        store.load()
+        store.put("a.md", self.ENTRY)
+        store.close()
+        with (temp_dir / "docs_manifest.journal.jsonl").open("a") as journal:
+            journal.write('{"op": "put", "file": "b.md", "en')
+
+        store = ManifestStore(temp_dir)
+        store.load()
+        store.put("c.md", self.ENTRY)
+        store.put("d.md", self.ENTRY)
+        store.close()
+
+        assert list(load_manifest(temp_dir)["files"]) == ["a.md", "c.md", "d.md"]
+
+    def test_record_without_op_is_corrupt(self, temp_dir):
+        """Test that a record missing its operation stops the replay cleanly."""
+        journal = temp_dir / "docs_manifest.journal.jsonl"
+        journal.write_text(
+            json.dumps({"op": "put", "file": "a.md", "entry": self.ENTRY})
+            + "\n"
+            + json.dumps({"file": "b.md"})
+            + "\n"
+        )
+        store = ManifestStore(temp_dir)
+
+        assert list(store.load()["files"]) == ["a.md"]
+        assert store.journal_records == 1
+        assert len(journal.read_text().splitlines()) == 1
+
+    def test_unchanged_entries_are_not_journaled(self, temp_dir):
+        """Test that re-recording an identical entry appends nothing."""
+        save_manifest(temp_dir, {"files": {"a.md": dict(self.ENTRY)}})
+        store = ManifestStore(temp_dir)
+        store.load()
+        store.put("a.md", dict(self.ENTRY))
+
+        assert store.journal_records == 0
+        assert not (temp_dir / "docs_manifest.journal.jsonl").exists()
+
+    def test_periodic_compaction(self, temp_dir):
+        """Test that the journal is folded into the snapshot every N records."""
+        store = ManifestStore(temp_dir, compact_every=3)
+        store.load()
+        for i in range(4):
+            store.put(f"p{i}.md", {**self.ENTRY, "hash": str(i)})
+        store.close()
+
+        snapshot = json.loads((temp_dir / "docs_manifest.json").read_text())
+        journal = (temp_dir / "docs_manifest.journal.jsonl").read_text().splitlines()
+        assert list(snapshot["files"]) == ["p0.md", "p1.md", "p2.md"]
+        assert [json.loads(line)["file"] for line in journal] == ["p3.md"]
+        assert len(load_manifest(temp_dir)["files"]) == 4
+
+    def test_save_manifest_discards_journal(self, temp_dir):
+        """Test that saving a full manifest supersedes pending journal records."""
+        store = ManifestStore(temp_dir)
+        store.load()
+        store.put("a.md", self.ENTRY)
+        store.close()
+        save_manifest(temp_dir, {"files": {}})
+
+        assert not (temp_dir / "docs_manifest.journal.jsonl").exists()
+        assert load_manifest(temp_dir)["files"] == {}
+
+
+class TestResumableRuns:
+    """Test checkpointing and --resume."""
+
+    URLS = [f"https://docs.workato.com/en/developing-connectors/sdk/p{i}.html" for i in range(12)]
+
+    class Preempted(BaseException):
+        """Stands in for the process being killed mid-run."""
+
+    def _download(self, calls, fail_url=None):
+        def fake_download(session, url, validators=None, rate_limiter=None):
+            calls.append(url)
+            if url == fail_url:
+                raise self.Preempted()
+            html = f"<main><h1>Page</h1><p>{'Reference text. ' * 5}{url}</p></main>"
+            return {"url": url, "html": html, "validators": {}}
+
+        return fake_download
+
+    def _run(self, temp_dir, download, *extra):
+        args = ["--docs-dir", str(temp_dir), "--workers", "1", "--rate", "1000", "--no-cache"]
+        with (
+            patch.object(fetch_docs, "SDK_URLS", self.URLS),
+            patch.object(fetch_docs, "download_page", side_effect=download),
+        ):
+            main(args + list(extra))
+
+    def test_resume_skips_checkpointed_pages(self, temp_dir):
+        """Test that a resumed run only fetches pages after the last checkpoint."""
+        with pytest.raises(self.Preempted):
+            self._run(temp_dir, self._download([], fail_url=self.URLS[11]))
+
+        checkpoint = json.loads((temp_dir / "docs_manifest.checkpoint.json").read_text())
+        assert list(checkpoint["completed"]) == self.URLS[:10]
+        assert len(load_manifest(temp_dir)["files"]) == 11
+
+        calls = []
+        self._run(temp_dir, self._download(calls), "--resume")
+        manifest = json.loads((temp_dir / "docs_manifest.json").read_text())
+
+        assert calls == self.URLS[10:]
+        assert len(manifest["files"]) == 12
+        assert manifest["fetch_metadata"]["rate_limiter"]["initial_rate"] == 1000
+        assert manifest["fetch_metadata"]["resumed_files"] == 10
+        # p10 finished after the last checkpoint; its journaled entry makes it unchanged
+        assert manifest["fetch_metadata"]["new_files"] == 11
+        assert manifest["fetch_metadata"]["unchanged_files"] == 1
+        assert not (temp_dir / "docs_manifest.checkpoint.json").exists()
+        assert not (temp_dir / "docs_manifest.journal.jsonl").exists()
+
+    def test_without_resume_everything_is_fetched(self, temp_dir):
+        """Test that a checkpoint is ignored unless --resume is given."""
+        with pytest.raises(self.Preempted):
+            self._run(temp_dir, self._download([], fail_url=self.URLS[11]))
+
+        calls = []
+        self._run(temp_dir, self._download(calls))
+
+        assert calls == self.URLS
+
+    def test_checkpoint_outside_window_is_ignored(self, temp_dir):
+        """Test that completed pages older than the freshness window are fetched again."""
+        store = ManifestStore(temp_dir)
+        store.load()
+        checkpoint = FetchCheckpoint(store)
+        checkpoint.mark(self.URLS[0], "new")
+        checkpoint.mark(self.URLS[1], "unchanged")
+        checkpoint.completed[self.URLS[0]]["at"] = "2000-01-01T00:00:00"
+        checkpoint.save()
+
+        assert list(FetchCheckpoint(store).load(window_hours=24)) == [self.URLS[1]]
+
+    def test_parse_args_rejects_non_positive_window(self):
+        """Test that the resume window must be positive."""
+        with pytest.raises(SystemExit):
+            parse_args(["--resume", "--resume-window", "0"])
+
+
+class TestFrontierCrawler:
+    """Test the concurrent frontier crawler."""
+
+    SDK = "https://docs.workato.com/en/developing-connectors/sdk"
+
+    def _session(self, graph):
+        def get(url, headers=None, timeout=None):
+            links = "".join(f'<a href="{self.SDK}/{name}.html">{name}</a>' for name in graph[url])
+            return Mock(text=f"<main><h1>{url}</h1><p>{'Docs. ' * 20}</p>{links}</main>")
+
+        return Mock(get=Mock(side_effect=get))
+
+    def test_crawl_follows_links_to_max_depth_once_each(self):
+        """Test per-URL depth limits and that shared links are fetched once."""
+        entry_points = [f"{self.SDK}/a.html", f"{self.SDK}/b.html"]
+        graph = {
+            entry_points[0]: ["c", "d"],
+            entry_points[1]: ["c", "a"],
+            f"{self.SDK}/c.html": ["e"],
+            f"{self.SDK}/d.html": ["c"],
+            f"{self.SDK}/e.html": ["f"],
+        }
+        session = self._session(graph)
+        crawler = WorkatoSDKCrawler(
+            session, WorkatoDocsConverter(), workers=4, requests_per_second=1000
+        )
+
+        with patch.object(fetch_docs, "SDK_ENTRY_POINTS", entry_points):
+            pages = crawler.crawl_sdk_docs(max_depth=3)
+
+        fetched = [call.args[0] for call in session.get.call_args_list]
+        assert sorted(fetched) == sorted(set(fetched))
+        assert [page["url"] for page in pages] == entry_points + [
+            f"{self.SDK}/c.html",
+            f"{self.SDK}/d.html",
+            f"{self.SDK}/e.html",
+        ]
+
+    def test_host_limiter_is_per_host(self):
+        """Test that each host gets its own politeness bucket."""
+        crawler = WorkatoSDKCrawler(Mock(), WorkatoDocsConverter(), requests_per_second=2)
+
+        first = crawler.host_limiter("https://docs.workato.com/a.html")
+        assert crawler.host_limiter("https://docs.workato.com/b.html") is first
+        assert crawler.host_limiter("https://example.com/a.html") is not first
+        assert first.rate == 2
+
+    def test_shared_limiter_paces_every_host(self):
+        """Test that a limiter passed in replaces the per-host buckets."""
+        limiter = AdaptiveRateLimiter(5)
+        crawler = WorkatoSDKCrawler(Mock(), WorkatoDocsConverter(), rate_limiter=limiter)
+
+        assert crawler.host_limiter("https://docs.workato.com/a.html") is limiter
+        assert crawler.host_limiter("https://example.com/a.html") is limiter
+
+
+class TestSitemapDiscovery:
+    """Test sitemap-driven discovery and lastmod-based refresh."""
+
+    SDK = "https://docs.workato.com/en/developing-connectors/sdk"
+    NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+    def _urlset(self, pages):
+        entries = "".join(
+            f"<url><loc>{loc}</loc>{f'<lastmod>{lastmod}</lastmod>' if lastmod else ''}</url>"
+            for loc, lastmod in pages
+        )
+        return f'<?xml version="1.0"?><urlset {self.NS}>{entries}</urlset>'.encode()
+
+    def _session(self, documents):
+        def get(url, headers=None, timeout=None, stream=False):
+            return Mock(raw=io.BytesIO(documents[url]))
+
+        return Mock(get=Mock(side_effect=get))
+
+    def test_iter_sitemap_streams_plain_and_gzipped(self):
+        """Test that plain and gzipped sitemaps yield the same entries."""
+        pages = [(f"{self.SDK}/a.html", "2025-08-01"), (f"{self.SDK}/b.html", None)]
+        body = self._urlset(pages)
+        session = self._session({"plain": body, "gz": gzip.compress(body)})
+
+        assert list(iter_sitemap(session, "plain")) == pages
+        assert list(iter_sitemap(session, "gz")) == pages
+
+    def test_sitemap_index_is_followed(self):
+        """Test that child sitemaps of a sitemap index are read in order."""
+        index = (
+            f"<sitemapindex {self.NS}><sitemap><loc>one</loc></sitemap>"
+            "<sitemap><loc>two</loc><lastmod>2025-01-01</lastmod></sitemap></sitemapindex>"
+        ).encode()
+        session = self._session(
+            {
+                "index": index,
+                "one": self._urlset([(f"{self.SDK}/a.html", "2025-08-01")]),
+                "two": gzip.compress(self._urlset([(f"{self.SDK}/b.html", "2025-08-02")])),
+            }
+        )
+
+        assert [loc for loc, _ in iter_sitemap(session, "index")] == [
+            f"{self.SDK}/a.html",
+            f"{self.SDK}/b.html",
+        ]
+
+    def test_discovery_keeps_only_sdk_pages(self):
+        """Test that the crawler filters sitemap entries down to normalized SDK pages."""
+        pages = [
+            (f"{self.SDK}/a.html?lang=en", "2025-08-01"),
+            ("https://docs.workato.com/en/recipes/intro.html", "2025-08-01"),
+            ("https://example.com/developing-connectors/sdk/x.html", None),
+            (f"{self.SDK}/b.html", None),
+        ]
+        session = self._session({"sitemap": self._urlset(pages)})
+        crawler = WorkatoSDKCrawler(session, WorkatoDocsConverter())
+
+        assert crawler.discover_from_sitemap("sitemap") == {
+            f"{self.SDK}/a.html": "2025-08-01",
+            f"{self.SDK}/b.html": None,
+        }
+
+    def test_main_paces_sitemap_with_its_limiter(self, temp_dir):
+        """Test that sitemap requests draw on the run's adaptive rate limiter."""
+        limiters = []
+
+        def sitemap(session, url, rate_limiter=None):
+            limiters.append(rate_limiter)
+            return iter([(f"{self.SDK}/a.html", "2025-08-01")])
+
+        self._run(temp_dir, sitemap, [])
+
+        assert isinstance(limiters[0], AdaptiveRateLimiter)
+        assert limiters[0].state()["initial_rate"] == 1000
+
+    def test_page_changed_since(self):
+        """Test lastmod comparison against stored lastmod and last_updated."""
+        entry = {"last_updated": "2025-08-10T12:00:00"}
+
+        assert page_changed_since(None, "2025-08-01")
+        assert page_changed_since(entry, None)
+        assert not page_changed_since(entry, "2025-08-01")
+        assert page_changed_since(entry, "2025-08-11")
+        assert not page_changed_since({**entry, "lastmod": "2025-08-11"}, "2025-08-11")
+        assert page_changed_since({**entry, "lastmod": "2025-08-11"}, "2025-08-12")
+        assert page_changed_since(entry, "not a date")
+
+    def _run(self, temp_dir, sitemap, calls, fail=()):
+        def fake_download(session, url, validators=None, rate_limiter=None):
+            calls.append(url)
+            if url in fail:
+                raise fetch_docs.HTTPError(f"Server error 503 for {url}", 503)
+            html = f"<main><h1>Page</h1><p>{'Reference text. ' * 5}{url}</p></main>"
+            return {"url": url, "html": html, "validators": {}}
+
+        args = ["--docs-dir", str(temp_dir), "--workers", "1", "--rate", "1000", "--no-cache"]
+        with (
+            patch.object(fetch_docs, "iter_sitemap", side_effect=sitemap),
+            patch.object(fetch_docs, "download_page", side_effect=fake_download),
+        ):
+            main(args + ["--sitemap"])
+        return json.loads((temp_dir / "docs_manifest.json").read_text())
+
+    def test_only_pages_with_new_lastmod_are_fetched(self, temp_dir):
+        """Test that a sitemap run skips pages whose lastmod has not moved."""
+        urls = [f"{self.SDK}/p{i}.html" for i in range(3)]
+        pages = [(url, "2025-08-01") for url in urls]
+
+        calls = []
+        manifest = self._run(temp_dir, lambda session, url, rate_limiter=None: iter(pages), calls)
+        assert calls == urls
+        assert manifest["fetch_metadata"]["fetch_method"] == "sitemap"
+        assert manifest["files"][url_to_filename(urls[0])]["lastmod"] == "2025-08-01"
+
+        pages[1] = (urls[1], "2025-08-15")
+        calls = []
+        manifest = self._run(temp_dir, lambda session, url, rate_limiter=None: iter(pages), calls)
+
+        assert calls == [urls[1]]
+        assert len(manifest["files"]) == 3
+        assert manifest["fetch_metadata"]["lastmod_skipped_files"] == 2
+        assert manifest["files"][url_to_filename(urls[1])]["lastmod"] == "2025-08-15"
+
+    def test_sitemap_failure_falls_back_to_hardcoded_urls(self, temp_dir):
+        """Test that an unreachable sitemap does not stop the fetch."""
+        urls = [f"{self.SDK}/p{i}.html" for i in range(2)]
+
+        def broken(session, url, rate_limiter=None):
+            raise requests.ConnectionError("down")
+
+        calls = []
+        with patch.object(fetch_docs, "SDK_URLS", urls):
+            manifest = self._run(temp_dir, broken, calls)
+
+        assert calls == urls
+        assert manifest["fetch_metadata"]["fetch_method"] == "hardcoded_urls"
+        index = json.loads((temp_dir / "docs_search_index.json").read_text())
+        assert [doc["file"] for doc in index["docs"]] == sorted(manifest["files"])
+        chunks = json.loads((temp_dir / "docs_chunks.json").read_text())
+        assert sorted(chunks["files"]) == sorted(manifest["files"])
+        bundle = (temp_dir / "docs_bundle.bin").read_bytes()
+        assert bundle.startswith(b"WSDKBUNDLE 1 ")
+        assert bundle.count(b"# Workato SDK Documentation") == len(manifest["files"])
+
+    def test_changelog_records_added_and_removed_pages(self, temp_dir):
+        """Test that each run with changes appends one changelog run."""
+        urls = [f"{self.SDK}/p{i}.html" for i in range(3)]
+        pages = [(url, "2025-08-01") for url in urls]
+        self._run(temp_dir, lambda session, url, rate_limiter=None: iter(pages), [])
+        # Nothing changed: no run is recorded
+        self._run(temp_dir, lambda session, url, rate_limiter=None: iter(pages), [])
+        manifest = self._run(temp_dir, lambda session, url, rate_limiter=None: iter(pages[:2]), [])
+
+        changelog = json.loads((temp_dir / "docs_changelog.json").read_text())
+        first, second = changelog["runs"]
+        assert first["added"] == sorted(url_to_filename(url) for url in urls)
+        assert first["updated"] == [] and first["removed"] == []
+        assert second["removed"] == [url_to_filename(urls[2])]
+        assert second["date"] == manifest["fetch_metadata"]["last_fetch_completed"]
+
+    def test_changelog_does_not_remove_failed_pages(self, temp_dir):
+        """Test that a failed page is neither removed nor re-added, unlike a deleted one."""
+        urls = [f"{self.SDK}/p{i}.html" for i in range(3)]
+        files = [url_to_filename(url) for url in urls]
+        first = [(url, "2025-08-01") for url in urls]
+        second = [(url, "2025-08-02") for url in urls]
+        self._run(temp_dir, lambda session, url, rate_limiter=None: iter(first), [])
+        (temp_dir / files[2]).unlink()
+        self._run(temp_dir, lambda session, url, rate_limiter=None: iter(second), [], fail=urls[1:])
+        manifest = self._run(temp_dir, lambda session, url, rate_limiter=None: iter(second), [])
+
+        changelog = json.loads((temp_dir / "docs_changelog.json").read_text())
+        added, failed, recovered = changelog["runs"]
+        assert added["added"] == files
+        assert failed["removed"] == [files[2]]
+        assert recovered["added"] == [files[2]]
+        assert sorted(manifest["files"]) == files
+
+    def test_failed_pages_stay_in_the_index_chunks_and_bundle(self, temp_dir):
+        """Test that a page failing to refresh keeps its entry and derived data."""
+        urls = [f"{self.SDK}/p{i}.html" for i in range(3)]
+        pages = [(url, f"2025-08-0{i + 1}") for i, url in enumerate(urls)]
+        self._run(temp_dir, lambda session, url, rate_limiter=None: iter(pages), [])
+        moved = [(url, "2025-09-01") for url, _ in pages]
+        manifest = self._run(
+            temp_dir, lambda session, url, rate_limiter=None: iter(moved), [], fail=urls[1:2]
+        )
+
+        files = sorted(url_to_filename(url) for url in urls)
+        assert manifest["fetch_metadata"]["pages_failed"] == 1
+        assert sorted(manifest["files"]) == files
+        index = json.loads((temp_dir / "docs_search_index.json").read_text())
+        assert [doc["file"] for doc in index["docs"]] == files
+        chunks = json.loads((temp_dir / "docs_chunks.json").read_text())
+        assert sorted(chunks["files"]) == files
+        bundle = (temp_dir / "docs_bundle.bin").read_bytes()
+        assert bundle.count(b"# Workato SDK Documentation") == len(files)
+
+
+class TestTransport:
+    """Test the HTTP session factory and the HTTP/2 transport."""
+
+    def _fake_httpx(self):
+        httpx = types.ModuleType("httpx")
+        httpx.TransportError = type("TransportError", (Exception,), {})
+        httpx.TimeoutException = type("TimeoutException", (httpx.TransportError,), {})
+        httpx.Limits = Mock()
+        httpx.Client = Mock()
+        return httpx
+
+    def test_pool_is_sized_to_workers(self):
+        """Test that every worker gets a pooled keep-alive connection."""
+        session = create_session(workers=16)
+
+        adapter = session.get_adapter("https://docs.workato.com/")
+        assert adapter._pool_maxsize == 16
+        assert adapter._pool_block
+        assert session.headers["Connection"] == "keep-alive"
+        assert "gzip" in session.headers["Accept-Encoding"]
+        session.close()
+
+    def test_http2_falls_back_without_httpx(self):
+        """Test that --http2 degrades to requests when httpx is not installed."""
+        with patch.dict(sys.modules, {"httpx": None}):
+            session = create_session(workers=2, http2=True)
+
+        assert isinstance(session, requests.Session)
+        session.close()
+
+    def test_httpx_session_mimics_requests(self):
+        """Test the requests-compatible surface of the httpx transport."""
+        httpx = self._fake_httpx()
+        response = Mock(status_code=404, headers={"etag": '"x"'}, text="<html/>", content=b"xml")
+        response.url = "https://docs.workato.com/missing.html"
+        httpx.Client.return_value.get.return_value = response
+
+        with patch.dict(sys.modules, {"httpx": httpx}):
+            session = create_session(workers=8, http2=True)
+
+        assert isinstance(session, HttpxSession)
+        assert httpx.Client.call_args.kwargs["http2"] is True
+        httpx.Limits.assert_called_once_with(max_connections=8, max_keepalive_connections=8)
+
+        result = session.get(response.url, headers={"Accept": "text/html"}, timeout=30)
+        assert result.text == "<html/>"
+        assert result.raw.read() == b"xml"
+        with pytest.raises(requests.HTTPError):
+            result.raise_for_status()
+
+        httpx.Client.return_value.get.side_effect = httpx.TimeoutException("slow")
+        with pytest.raises(requests.Timeout):
+            session.get(response.url)
+        httpx.Client.return_value.get.side_effect = httpx.TransportError("reset")
+        with pytest.raises(requests.ConnectionError):
+            session.get(response.url)
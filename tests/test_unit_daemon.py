@@ -0,0 +1,163 @@
+"""
+Unit tests for the query daemon in workato_sdk_docs/daemon.py
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from workato_sdk_docs.chunks import empty_store, update_store, write_store
+from workato_sdk_docs.daemon import DocsCache, handle_request, main, query, serve
+from workato_sdk_docs.search import build_index, write_index
+
+HEADER = "# Workato SDK Documentation\n\n> **Source**: https://example.com\n\n---\n\n"
+DOCS = {
+    "actions.md": HEADER + "# Actions\n\nActions run an API request.\n\n"
+    "## Execute\n\nRuns the request.\n",
+    "quickstart.md": HEADER + "# Creating a custom connector\n\nStart here.\n",
+}
+
+
+@pytest.fixture
+def docs_dir(temp_dir):
+    for filename, content in DOCS.items():
+        (temp_dir / filename).write_text(content, encoding="utf-8")
+    files = {name: f"hash-{name}" for name in DOCS}
+    (temp_dir / "docs_manifest.json").write_text(
+        json.dumps({"files": {name: {"hash": h} for name, h in files.items()}})
+    )
+    write_index(temp_dir, build_index(temp_dir))
+    store = empty_store()
+    update_store(store, temp_dir, files)
+    write_store(temp_dir, store)
+    return temp_dir
+
+
+class TestHandleRequest:
+    """Test answering requests from the in-memory cache."""
+
+    def test_list_read_and_search(self, docs_dir):
+        """Test the answers match the standalone commands."""
+        cache = DocsCache(docs_dir)
+
+        assert handle_request(cache, {"cmd": "list"}) == (0, "actions\nquickstart")
+        assert handle_request(cache, {"cmd": "read", "topic": "quickstart"}) == (
+            0,
+            DOCS["quickstart.md"],
+        )
+        assert handle_request(cache, {"cmd": "read", "topic": "actions#execute"}) == (
+            0,
+            "## Execute\n\nRuns the request.\n",
+        )
+        status, output = handle_request(cache, {"cmd": "read", "topic": "actions#nope"})
+        assert status == 1 and "• Execute  (actions#execute" in output
+        assert handle_request(cache, {"cmd": "read", "topic": "missing"})[0] == 2
+
+        status, output = handle_request(cache, {"cmd": "search", "query": "custom connector"})
+        assert status == 0 and "1. quickstart — Creating a custom connector" in output
+        assert handle_request(cache, {"cmd": "search", "query": "kubernetes"}) == (1, "")
+        assert handle_request(cache, {"cmd": "reboot"})[0] == 2
+
+    def test_read_rejects_paths_outside_the_manifest(self, docs_dir):
+        """Test that request topics cannot name files the manifest does not list."""
+        (docs_dir / "stray.md").write_text("not in the manifest")
+        (docs_dir / "private").mkdir()
+        (docs_dir / "private" / "secret.md").write_text("not a topic")
+        cache = DocsCache(docs_dir)
+
+        topics = ("stray", "private/secret", f"../{docs_dir.name}/actions", "..\\actions")
+        for topic in topics:
+            assert handle_request(cache, {"cmd": "read", "topic": topic}) == (
+                2,
+                f"Unknown topic: {topic}",
+            )
+
+    def test_changed_files_are_reloaded(self, docs_dir):
+        """Test that a fetch while the daemon runs is picked up."""
+        cache = DocsCache(docs_dir)
+        assert handle_request(cache, {"cmd": "read", "topic": "quickstart"})[1].endswith("here.\n")
+
+        path = docs_dir / "quickstart.md"
+        path.write_text(HEADER + "# Updated\n")
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        manifest = docs_dir / "docs_manifest.json"
+        manifest.write_text(json.dumps({"files": {"quickstart.md": {}}}))
+        os.utime(manifest, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+        assert handle_request(cache, {"cmd": "read", "topic": "quickstart"})[1].endswith(
+            "Updated\n"
+        )
+        assert handle_request(cache, {"cmd": "list"}) == (0, "quickstart")
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+class TestSocketServer:
+    """Test the daemon over a real Unix socket."""
+
+    @pytest.fixture
+    def socket_path(self):
+        # Unix socket paths are limited to ~100 bytes, so keep them short
+        with tempfile.TemporaryDirectory(prefix="wsdk") as short_dir:
+            yield Path(short_dir) / "d.sock"
+
+    def _serve(self, docs_dir, socket_path, idle_timeout=10.0):
+        thread = threading.Thread(
+            target=serve, args=(docs_dir, socket_path, idle_timeout), daemon=True
+        )
+        thread.start()
+        # time.sleep is patched out in tests, so poll against the clock
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not query(socket_path, {"cmd": "ping"}):
+            pass
+        return thread
+
+    def test_client_round_trip_and_stop(self, docs_dir, socket_path, capsys):
+        """Test the client commands, then a clean shutdown that removes the socket."""
+        thread = self._serve(docs_dir, socket_path)
+
+        args = ["--docs-dir", str(docs_dir), "--socket", str(socket_path)]
+        assert main(args + ["status"]) == 0
+        assert main(args + ["read", "actions#execute"]) == 0
+        assert capsys.readouterr().out.endswith("## Execute\n\nRuns the request.\n")
+        assert main(args + ["search", "custom", "connector"]) == 0
+        assert "quickstart" in capsys.readouterr().out
+        assert main(args + ["read", "actions#nope"]) == 1
+        assert "No section 'nope'" in capsys.readouterr().err
+
+        assert main(args + ["stop"]) == 0
+        thread.join(timeout=5)
+        assert not thread.is_alive() and not socket_path.exists()
+        assert main(args + ["list"]) == 3
+
+    def test_idle_daemon_exits(self, docs_dir, socket_path):
+        """Test that an unused daemon shuts itself down."""
+        thread = self._serve(docs_dir, socket_path, idle_timeout=0.2)
+
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert query(socket_path, {"cmd": "ping"}) is None
+
+    def test_requests_answer_in_milliseconds(self, docs_dir, socket_path):
+        """Test that cached answers stay well under the 10 ms budget."""
+        self._serve(docs_dir, socket_path)
+        requests = [
+            {"cmd": "list"},
+            {"cmd": "read", "topic": "actions"},
+            {"cmd": "read", "topic": "actions#execute"},
+            {"cmd": "search", "query": "custom connector"},
+        ]
+
+        start_time = time.time()
+        for _ in range(25):
+            for request in requests:
+                assert query(socket_path, request)["status"] == 0
+        elapsed = time.time() - start_time
+        query(socket_path, {"cmd": "stop"})
+
+        assert elapsed / 100 < 0.01, f"Daemon too slow: {elapsed / 100 * 1000:.2f} ms/request"
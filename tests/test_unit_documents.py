@@ -0,0 +1,30 @@
+"""
+Unit tests for the saved-document layout in workato_sdk_docs/documents.py
+"""
+
+from workato_sdk_docs.documents import body_offset, document_body, topic_name
+
+HEADER = "# Workato SDK Documentation\n\n> **Source**: https://example.com\n\n---\n\n"
+
+
+class TestDocuments:
+    """Test the helpers shared by the fetcher and the docs tools."""
+
+    def test_topic_name(self):
+        """Test that only a trailing .md is dropped."""
+        assert topic_name("actions.md") == "actions"
+        assert topic_name("actions") == "actions"
+        assert topic_name("guides__md_files.md") == "guides__md_files"
+
+    def test_body_offset_matches_document_body(self):
+        """Test that the byte offset and the text helper agree on where the body starts."""
+        for document in (HEADER + "# Actions\n\nText\n", HEADER, "# Other\n\n---\n\nText"):
+            data = document.encode()
+            assert data[body_offset(data) :].decode() == document_body(document)
+
+    def test_body_offset_counts_bytes(self):
+        """Test that the offset is a byte position in UTF-8 headers."""
+        document = HEADER.replace("example.com", "café.example") + "Body\n"
+        data = document.encode()
+
+        assert data[body_offset(data) :] == b"Body\n"
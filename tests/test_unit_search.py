@@ -0,0 +1,244 @@
+"""
+Unit tests for the full-text search index in workato_sdk_docs/search.py
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import workato_sdk_docs.search as search_module
+from workato_sdk_docs.search import (
+    INDEX_FILE,
+    build_index,
+    compact_index,
+    empty_index,
+    load_index,
+    main,
+    parse_document,
+    search,
+    snippets,
+    stem,
+    tokenize,
+    update_index,
+    write_index,
+)
+
+
+def document(url: str, body: str) -> str:
+    return (
+        "# Workato SDK Documentation\n\n"
+        f"> **Source**: {url}\n> **Fetched**: 2025-01-01T00:00:00\n\n---\n\n{body}"
+    )
+
+
+DOCS = {
+    "guides__authentication__oauth.md": document(
+        "https://docs.workato.com/en/developing-connectors/sdk/guides/authentication/oauth.html",
+        "# OAuth 2.0 [​](<#oauth-2-0>)\n\n"
+        "Refresh tokens are exchanged for new access tokens when a request fails.\n\n"
+        "## Refreshing tokens [​](<#refreshing-tokens>)\n\n"
+        "Define a `refresh` lambda to renew the access token.\n",
+    ),
+    "quickstart.md": document(
+        "https://docs.workato.com/en/developing-connectors/sdk/quickstart.html",
+        "# Creating a custom connector\n\n"
+        "Go to **Tools > Connector SDK** and click [Create connector](</en/tools.html>).\n\n"
+        "```ruby\n# Not a heading\n{ title: 'My connector' }\n```\n",
+    ),
+    "sdk-reference__actions.md": document(
+        "https://docs.workato.com/en/developing-connectors/sdk/sdk-reference/actions.html",
+        "# Actions\n\nActions run an API request. A custom connector may define many actions.\n"
+        "Tokens are mentioned here once.\n",
+    ),
+}
+
+
+@pytest.fixture
+def docs_dir(temp_dir):
+    for filename, content in DOCS.items():
+        (temp_dir / filename).write_text(content)
+    return temp_dir
+
+
+class TestTokenizer:
+    """Test stemming and tokenization."""
+
+    def test_porter_stems(self):
+        """Test that inflections collapse to one stem."""
+        assert {stem(w) for w in ["connect", "connected", "connecting", "connections"]} == {
+            "connect"
+        }
+        assert stem("authentication") == stem("authenticate")
+        assert stem("caresses") == "caress"
+        assert stem("ponies") == "poni"
+
+    def test_tokenize_drops_stopwords(self):
+        """Test that question words do not become search terms."""
+        assert tokenize("How do I create a custom connector?") == ["creat", "custom", "connector"]
+
+    def test_parse_document_separates_title_headings_and_body(self):
+        """Test title/heading extraction, ignoring the fetch header, anchors and code."""
+        title, headings, body = parse_document(DOCS["guides__authentication__oauth.md"])
+
+        assert title == "OAuth 2.0"
+        assert headings == ["Refreshing tokens"]
+        assert not any("Workato SDK Documentation" in line for line in body)
+
+        title, headings, body = parse_document(DOCS["quickstart.md"])
+        assert headings == []
+        assert "# Not a heading" in body
+        assert "click [Create connector]." in "\n".join(body)
+
+
+class TestSearchIndex:
+    """Test building, storing and querying the index."""
+
+    def test_natural_language_query_ranks_the_right_page(self, docs_dir):
+        """Test that a question finds the page whose title answers it."""
+        index = build_index(docs_dir)
+
+        hits = search(index, "how do I create a custom connector")
+        assert hits[0].file == "quickstart.md"
+        assert hits[0].title == "Creating a custom connector"
+
+    def test_heading_matches_outrank_body_matches(self, docs_dir):
+        """Test that heading-aware boosts rank topical pages first."""
+        hits = search(build_index(docs_dir), "refreshing tokens")
+
+        assert [hit.file for hit in hits] == [
+            "guides__authentication__oauth.md",
+            "sdk-reference__actions.md",
+        ]
+        assert hits[0].score > hits[1].score
+
+    def test_unknown_terms_return_nothing(self, docs_dir):
+        """Test that queries without indexed terms return no hits."""
+        assert search(build_index(docs_dir), "kubernetes") == []
+        assert search(build_index(docs_dir), "how do I") == []
+
+    def test_index_is_limited_to_given_files(self, docs_dir):
+        """Test that only manifest files are indexed and missing ones are skipped."""
+        index = build_index(docs_dir, ["quickstart.md", "gone.md"])
+
+        assert [doc["file"] for doc in index["docs"]] == ["quickstart.md"]
+
+    def test_write_and_load_round_trip(self, docs_dir):
+        """Test atomic writes and rejection of incompatible indexes."""
+        index = build_index(docs_dir)
+        write_index(docs_dir, index)
+
+        assert load_index(docs_dir)["terms"] == index["terms"]
+        (docs_dir / INDEX_FILE).write_text(json.dumps({**index, "version": 0}))
+        assert load_index(docs_dir) is None
+        (docs_dir / INDEX_FILE).unlink()
+        assert load_index(docs_dir) is None
+
+    def test_snippets_prefer_lines_matching_more_terms(self):
+        """Test snippet selection from the document body."""
+        found = snippets(DOCS["guides__authentication__oauth.md"], "refresh access token", limit=1)
+
+        assert found == ["Refresh tokens are exchanged for new access tokens when a request fails."]
+
+
+class TestSearchCommand:
+    """Test the command-line entry point used by the helper script."""
+
+    def test_prints_ranked_results_with_snippets(self, docs_dir, capsys):
+        """Test the helper output format."""
+        write_index(docs_dir, build_index(docs_dir))
+
+        assert main(["--docs-dir", str(docs_dir), "refresh", "token"]) == 0
+        output = capsys.readouterr().out
+        assert output.startswith('Top matches for "refresh token":')
+        assert "1. guides__authentication__oauth — OAuth 2.0" in output
+        assert "Define a `refresh` lambda" in output
+
+    def test_json_output_and_exit_codes(self, docs_dir, capsys):
+        """Test JSON output, no-match and missing-index exit codes."""
+        assert main(["--docs-dir", str(docs_dir), "actions"]) == 2
+        write_index(docs_dir, build_index(docs_dir))
+        capsys.readouterr()
+
+        assert main(["--docs-dir", str(docs_dir), "--json", "--limit", "1", "actions"]) == 0
+        assert json.loads(capsys.readouterr().out)[0]["file"] == "sdk-reference__actions.md"
+        assert main(["--docs-dir", str(docs_dir), "kubernetes"]) == 1
+
+
+class TestIncrementalIndex:
+    """Test hash-driven index maintenance."""
+
+    HASHES = {filename: f"hash-{i}" for i, filename in enumerate(sorted(DOCS))}
+
+    def _indexed(self, docs_dir):
+        index = empty_index()
+        update_index(index, docs_dir, dict(self.HASHES))
+        return index
+
+    def _results(self, index, query):
+        return [(hit.file, hit.score) for hit in search(index, query)]
+
+    def test_unchanged_hashes_skip_tokenising(self, docs_dir):
+        """Test that documents whose hash is unchanged are not re-read."""
+        index = self._indexed(docs_dir)
+
+        with patch.object(
+            search_module, "document_terms", wraps=search_module.document_terms
+        ) as terms:
+            stats = update_index(index, docs_dir, dict(self.HASHES))
+
+        terms.assert_not_called()
+        assert stats == {"added": 0, "updated": 0, "removed": 0, "unchanged": 3, "compacted": 0}
+
+    def test_changed_document_is_retokenised_and_old_version_tombstoned(self, docs_dir):
+        """Test that an update replaces a document's postings."""
+        index = self._indexed(docs_dir)
+        (docs_dir / "quickstart.md").write_text(
+            document("https://example.com", "# Webhooks\n\nStatic webhook triggers.\n")
+        )
+
+        with (
+            patch.object(search_module, "COMPACT_RATIO", 1.0),
+            patch.object(
+                search_module, "document_terms", wraps=search_module.document_terms
+            ) as terms,
+        ):
+            stats = update_index(index, docs_dir, {**self.HASHES, "quickstart.md": "new"})
+
+        assert terms.call_count == 1
+        assert stats["updated"] == 1 and stats["unchanged"] == 2
+        assert index["deleted"] == [1]
+        assert search(index, "create custom connector")[0].file != "quickstart.md"
+        assert search(index, "webhook")[0].file == "quickstart.md"
+
+    def test_incremental_scores_match_a_fresh_build(self, docs_dir):
+        """Test that tombstones do not skew BM25 statistics, before or after compaction."""
+        index = self._indexed(docs_dir)
+        (docs_dir / "sdk-reference__actions.md").unlink()
+        files = {k: v for k, v in self.HASHES.items() if k != "sdk-reference__actions.md"}
+        (docs_dir / "triggers.md").write_text(document("https://example.com", "# Triggers\n"))
+        files["triggers.md"] = "hash-t"
+
+        with patch.object(search_module, "COMPACT_RATIO", 1.0):
+            stats = update_index(index, docs_dir, files)
+        fresh = build_index(docs_dir)
+
+        assert stats["removed"] == 1 and stats["added"] == 1 and not stats["compacted"]
+        for query in ["refresh token", "custom connector actions", "triggers"]:
+            assert self._results(index, query) == self._results(fresh, query)
+
+        compacted = compact_index(index)
+        assert compacted["deleted"] == []
+        assert len(compacted["docs"]) == 3
+        for query in ["refresh token", "custom connector actions", "triggers"]:
+            assert self._results(compacted, query) == self._results(fresh, query)
+
+    def test_compacts_once_tombstones_pile_up(self, docs_dir):
+        """Test automatic compaction when the tombstone ratio is reached."""
+        index = self._indexed(docs_dir)
+
+        stats = update_index(index, docs_dir, {"quickstart.md": self.HASHES["quickstart.md"]})
+
+        assert stats["removed"] == 2 and stats["compacted"] == 1
+        assert [doc["file"] for doc in index["docs"]] == ["quickstart.md"]
+        assert all(entry.startswith("0:") for entry in index["terms"].values())
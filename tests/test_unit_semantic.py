@@ -0,0 +1,197 @@
+"""
+Unit tests for the optional semantic search in workato_sdk_docs/semantic.py
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import workato_sdk_docs.semantic as semantic_module  # noqa: E402
+from workato_sdk_docs.chunks import empty_store, update_store, write_store  # noqa: E402
+from workato_sdk_docs.semantic import (  # noqa: E402
+    VECTORS_FILE,
+    VECTORS_META_FILE,
+    HashingEmbedder,
+    get_embedder,
+    load_vectors,
+    main,
+    search_vectors,
+    update_vectors,
+)
+
+HEADER = "# Workato SDK Documentation\n\n> **Source**: https://example.com\n\n---\n\n"
+DOCS = {
+    "connection.md": HEADER
+    + "# Connection [​](<#connection>)\n\nThe connection hash configures how users connect.\n\n"
+    "## Fields\n\nConnection fields are shown when configuring a connection.\n\n"
+    "## Base URI\n\nSet the base URL used for every request.\n",
+    "oauth.md": HEADER
+    + "# OAuth 2.0\n\n## Refreshing tokens\n\nRefresh an expired access token with `refresh`.\n",
+    "streaming.md": HEADER
+    + "# Streaming\n\nDownload large files in chunks with streaming actions.\n",
+}
+
+
+@pytest.fixture
+def docs_dir(temp_dir):
+    for filename, content in DOCS.items():
+        (temp_dir / filename).write_text(content, encoding="utf-8")
+    return temp_dir
+
+
+def chunked(docs_dir, hashes=None):
+    store = empty_store()
+    update_store(store, docs_dir, hashes or {name: f"hash-{name}" for name in DOCS})
+    return store
+
+
+class TestHashingEmbedder:
+    """Test the dependency-free hashing-trick vectoriser."""
+
+    def test_embeddings_are_stable_and_share_subwords(self):
+        """Test that features hash deterministically and related words overlap."""
+        embedder = HashingEmbedder(dim=1024)
+        first, again, related, unrelated = embedder.embed(
+            ["configuring connections", "configuring connections", "connection config", "pizza"]
+        )
+
+        assert np.array_equal(first, again)
+        assert first.shape == (1024,)
+
+        def cosine(a, b):
+            return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+        assert cosine(first, related) > 0.5
+        assert abs(cosine(first, unrelated)) < 0.2
+
+    def test_embedder_is_chosen_from_index_or_environment(self, monkeypatch):
+        """Test that an index is queried with the embedder that built it."""
+        assert get_embedder("hashing-512").dim == 512
+        monkeypatch.delenv(semantic_module.EMBED_MODEL_ENV, raising=False)
+        assert get_embedder().name == f"hashing-{semantic_module.HASH_DIM}"
+        with pytest.raises(ValueError):
+            get_embedder("word2vec")
+
+
+class TestVectorIndex:
+    """Test building and querying the memory-mapped vector index."""
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_questions_find_the_matching_section(self, docs_dir, dtype):
+        """Test top-k cosine ranking for both storage types."""
+        update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder(), dtype=dtype)
+        index = load_vectors(docs_dir)
+
+        assert isinstance(index["matrix"], np.memmap)
+        assert index["matrix"].dtype == np.dtype(dtype)
+        hits = search_vectors(index, "how do I refresh an expired token")
+        assert hits[0].id == "oauth#refreshing-tokens"
+        assert search_vectors(index, "download big files")[0].id == "streaming#streaming"
+
+    def test_one_hit_per_topic_unless_asked(self, docs_dir):
+        """Test that results are collapsed to the best section of each document."""
+        update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder())
+        index = load_vectors(docs_dir)
+
+        topics = [hit.id.partition("#")[0] for hit in search_vectors(index, "connection fields")]
+        assert topics[0] == "connection" and len(topics) == len(set(topics))
+        hits = search_vectors(index, "connection fields", limit=2, per_topic=False)
+        assert [hit.id for hit in hits] == ["connection#fields", "connection#connection"]
+        assert search_vectors(index, "kubernetes") == []
+
+    def test_dominant_topic_does_not_hide_others(self, docs_dir):
+        """Test that the candidate pool grows past a topic with many matching sections."""
+        sections = "## Connection fields\n\nConnection fields.\n\n" * 40
+        (docs_dir / "fields.md").write_text(HEADER + "# Fields\n\n" + sections)
+        hashes = {name: f"hash-{name}" for name in [*DOCS, "fields.md"]}
+        update_vectors(docs_dir, chunked(docs_dir, hashes), HashingEmbedder())
+
+        hits = search_vectors(load_vectors(docs_dir), "connection fields", limit=2)
+        assert [hit.id.partition("#")[0] for hit in hits] == ["fields", "connection"]
+
+    def test_only_changed_chunks_are_embedded(self, docs_dir):
+        """Test that rows are reused by chunk hash across updates."""
+        embedder = HashingEmbedder()
+        stats = update_vectors(docs_dir, chunked(docs_dir), embedder)
+        assert stats == {"embedded": 6, "reused": 0, "removed": 0}
+        before = load_vectors(docs_dir, mmap=False)
+
+        (docs_dir / "streaming.md").write_text(HEADER + "# Streaming\n\nUpload in parts.\n")
+        with patch.object(embedder, "embed", wraps=embedder.embed) as embed:
+            stats = update_vectors(docs_dir, chunked(docs_dir), embedder)
+
+        assert stats == {"embedded": 1, "reused": 5, "removed": 1}
+        assert embed.call_args.args[0][0].endswith("Upload in parts.")
+        after = load_vectors(docs_dir, mmap=False)
+        assert np.array_equal(after["matrix"][:5], before["matrix"][:5])
+
+    def test_unchanged_chunks_rewrite_nothing(self, docs_dir):
+        """Test that an update with nothing to embed or remove leaves the index alone."""
+        update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder())
+        before = {path: path.read_bytes() for path in docs_dir.glob("docs_vectors*")}
+        with patch.object(semantic_module, "write_vectors") as write_vectors:
+            stats = update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder())
+
+        assert stats == {"embedded": 0, "reused": 6, "removed": 0}
+        write_vectors.assert_not_called()
+        assert {path: path.read_bytes() for path in docs_dir.glob("docs_vectors*")} == before
+
+    def test_created_survives_incremental_updates(self, docs_dir):
+        """Test that only a rebuild from scratch stamps a new creation time."""
+        update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder())
+        created = load_vectors(docs_dir)["meta"]["created"]
+        (docs_dir / "streaming.md").write_text(HEADER + "# Streaming\n\nUpload in parts.\n")
+        update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder())
+
+        assert load_vectors(docs_dir)["meta"]["created"] == created
+
+    def test_rows_are_not_reused_across_topics(self, docs_dir):
+        """Test that identical sections in another topic get their own embedding."""
+        embedder = HashingEmbedder()
+        update_vectors(docs_dir, chunked(docs_dir), embedder)
+        (docs_dir / "uploads.md").write_text(DOCS["streaming.md"], encoding="utf-8")
+        hashes = {name: f"hash-{name}" for name in [*DOCS, "uploads.md"]}
+        with patch.object(embedder, "embed", wraps=embedder.embed) as embed:
+            stats = update_vectors(docs_dir, chunked(docs_dir, hashes), embedder)
+
+        assert stats == {"embedded": 1, "reused": 6, "removed": 0}
+        assert "uploads" in embed.call_args.args[0][0]
+
+    def test_other_embedder_rebuilds_and_bad_files_are_ignored(self, docs_dir):
+        """Test rebuilds on embedder changes and rejection of mismatched files."""
+        update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder(dim=512))
+        stats = update_vectors(docs_dir, chunked(docs_dir), HashingEmbedder(dim=1024))
+        assert stats["embedded"] == 6 and stats["reused"] == 0
+
+        meta = json.loads((docs_dir / VECTORS_META_FILE).read_text())
+        (docs_dir / VECTORS_META_FILE).write_text(json.dumps({**meta, "rows": meta["rows"][:2]}))
+        assert load_vectors(docs_dir) is None
+        (docs_dir / VECTORS_FILE).unlink()
+        assert load_vectors(docs_dir) is None
+
+
+class TestSemanticCommand:
+    """Test the command-line entry point used by the helper script."""
+
+    def test_build_then_query(self, docs_dir, capsys, monkeypatch):
+        """Test --build from the chunk store and the result format."""
+        monkeypatch.delenv(semantic_module.EMBED_MODEL_ENV, raising=False)
+        assert main(["--docs-dir", str(docs_dir), "refresh token"]) == 2
+        assert main(["--docs-dir", str(docs_dir), "--build"]) == 2
+        write_store(docs_dir, chunked(docs_dir))
+        capsys.readouterr()
+
+        assert main(["--docs-dir", str(docs_dir), "--build", "--dtype", "int8"]) == 0
+        assert "6 embedded" in capsys.readouterr().out
+        assert main(["--docs-dir", str(docs_dir), "refresh", "expired", "token"]) == 0
+        output = capsys.readouterr().out
+        assert output.startswith('Closest sections for "refresh expired token":')
+        assert "1. oauth#refreshing-tokens — Refreshing tokens" in output
+        assert "Refresh an expired access token" in output
+
+        assert main(["--docs-dir", str(docs_dir), "--json", "--limit", "1", "streaming"]) == 0
+        assert json.loads(capsys.readouterr().out)[0]["id"] == "streaming#streaming"
+        assert main(["--docs-dir", str(docs_dir), "kubernetes"]) == 1
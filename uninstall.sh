@@ -42,6 +42,11 @@ if [[ -f ~/.claude/settings.json ]]; then
     echo "✓ Removed hooks (backup: ~/.claude/settings.json.backup)"
 fi
 
+# Stop the query daemon, if one is running
+if [[ -S "$HOME/.workato-sdk-docs/.workato-sdk-daemon.sock" ]] && command -v python3 >/dev/null 2>&1; then
+    (cd "$HOME/.workato-sdk-docs" && python3 -m workato_sdk_docs.daemon stop >/dev/null 2>&1) || true
+fi
+
 # Remove installation directory
 if [[ -d "$HOME/.workato-sdk-docs" ]]; then
     # Check if it has uncommitted changes
@@ -0,0 +1,217 @@
+"""Single-file bundle of the mirrored SDK docs.
+
+The fetcher packs every document into ``docs_bundle.bin`` next to
+``docs_manifest.json`` so the ``/workato-sdk`` helper can list topics and read
+a document with one open and one seek instead of walking ``docs/``.
+
+Layout (all text is UTF-8)::
+
+    WSDKBUNDLE <version> <table size>\\n
+    <topic>\\t<offset>\\t<size>\\t<sha256>\\t<title>\\n     one line per document
+    ...
+    <document bytes, concatenated>
+
+Offsets are absolute byte positions in the bundle, so plain shell tools can
+read a document too: ``tail -c +<offset + 1> docs_bundle.bin | head -c <size>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import mmap
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from workato_sdk_docs.documents import PERMALINK_RE, document_body, topic_name
+
+BUNDLE_FILE = "docs_bundle.bin"
+BUNDLE_MAGIC = "WSDKBUNDLE"
+BUNDLE_VERSION = 1
+DEFAULT_DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+
+
+class BundleEntry(NamedTuple):
+    topic: str
+    offset: int
+    size: int
+    hash: str
+    title: str
+
+
+def document_title(data: bytes) -> str:
+    """The first ``#`` heading after the fetch header, or an empty string."""
+    for line in document_body(data.decode("utf-8", errors="replace")).splitlines():
+        if line.startswith("# "):
+            title = PERMALINK_RE.sub("", line[2:])
+            return " ".join(title.split()).strip(" #")
+    return ""
+
+
+def write_bundle(docs_dir: Path, files: Dict[str, Optional[str]]) -> Path:
+    """
+    Pack ``files`` (filename to content hash) into the bundle, atomically.
+
+    Files that have disappeared are skipped; a missing hash is computed.
+    """
+    docs_dir = Path(docs_dir)
+    documents = []
+    for filename, content_hash in sorted(files.items()):
+        try:
+            data = (docs_dir / filename).read_bytes()
+        except OSError:
+            continue
+        documents.append((topic_name(filename), content_hash, data))
+
+    rows = []
+    for topic, content_hash, data in documents:
+        content_hash = content_hash or hashlib.sha256(data).hexdigest()
+        rows.append((topic, len(data), content_hash, document_title(data)))
+
+    # Offsets depend on the table size, which depends on the offsets' digits:
+    # iterate until the table length is stable (two passes in practice)
+    table = b""
+    while True:
+        start = len(_preamble(len(table))) + len(table)
+        lines = []
+        offset = start
+        for topic, size, content_hash, title in rows:
+            lines.append(f"{topic}\t{offset}\t{size}\t{content_hash}\t{title}\n")
+            offset += size
+        new_table = "".join(lines).encode("utf-8")
+        stable = len(new_table) == len(table)
+        table = new_table
+        if stable:
+            break
+
+    bundle_path = docs_dir / BUNDLE_FILE
+    temp_path = docs_dir / (BUNDLE_FILE + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_preamble(len(table)))
+        f.write(table)
+        for _, _, data in documents:
+            f.write(data)
+    temp_path.replace(bundle_path)
+    return bundle_path
+
+
+def _preamble(table_size: int) -> bytes:
+    return f"{BUNDLE_MAGIC} {BUNDLE_VERSION} {table_size}\n".encode("ascii")
+
+
+def read_table(bundle_path: Path) -> Optional[Dict[str, BundleEntry]]:
+    """
+    Read the offset table without touching the documents.
+
+    Returns:
+        Entries by topic, or None if the bundle is missing or not understood
+    """
+    try:
+        with open(bundle_path, "rb") as f:
+            preamble = f.readline().decode("ascii").split()
+            if len(preamble) != 3 or preamble[0] != BUNDLE_MAGIC:
+                return None
+            if int(preamble[1]) != BUNDLE_VERSION:
+                return None
+            table = f.read(int(preamble[2])).decode("utf-8")
+    except (OSError, ValueError):
+        return None
+
+    entries = {}
+    for line in table.splitlines():
+        topic, offset, size, content_hash, title = line.split("\t", 4)
+        entries[topic] = BundleEntry(topic, int(offset), int(size), content_hash, title)
+    return entries
+
+
+class Bundle:
+    """A memory-mapped bundle; documents are slices of the map."""
+
+    def __init__(self, bundle_path: Path):
+        self.path = Path(bundle_path)
+        entries = read_table(self.path)
+        if entries is None:
+            raise ValueError(f"Not a docs bundle: {self.path}")
+        self.entries = entries
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "Bundle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def topics(self) -> List[str]:
+        return list(self.entries)
+
+    def read_bytes(self, topic: str) -> bytes:
+        entry = self.entries[topic_name(topic)]
+        return self._map[entry.offset : entry.offset + entry.size]
+
+    def read(self, topic: str) -> str:
+        return self.read_bytes(topic).decode("utf-8")
+
+
+def unpack(bundle_path: Path, dest_dir: Path) -> int:
+    """Restore the Markdown files of a bundle into ``dest_dir``; returns the file count."""
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with Bundle(bundle_path) as bundle:
+        for topic in bundle.topics():
+            (dest_dir / f"{topic}.md").write_bytes(bundle.read_bytes(topic))
+        return len(bundle.entries)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m workato_sdk_docs.bundle",
+        description="List, read or unpack the packed SDK docs bundle",
+    )
+    p.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR, help="Docs directory")
+    sub = p.add_subparsers(dest="command", required=True)
+    list_p = sub.add_parser("list", help="List topics")
+    list_p.add_argument("--titles", action="store_true", help="Show document titles")
+    read_p = sub.add_parser("read", help="Print one document")
+    read_p.add_argument("topic")
+    unpack_p = sub.add_parser("unpack", help="Write the documents out as Markdown files")
+    unpack_p.add_argument("dest", type=Path)
+    args = p.parse_args(argv)
+
+    bundle_path = args.docs_dir / BUNDLE_FILE
+    if args.command == "unpack":
+        try:
+            count = unpack(bundle_path, args.dest)
+        except (OSError, ValueError) as e:
+            print(str(e), file=sys.stderr)
+            return 2
+        print(f"Unpacked {count} documents to {args.dest}")
+        return 0
+
+    entries = read_table(bundle_path)
+    if entries is None:
+        print(f"No docs bundle in {args.docs_dir}", file=sys.stderr)
+        return 2
+
+    if args.command == "list":
+        for entry in entries.values():
+            print(f"{entry.topic}\t{entry.title}" if args.titles else entry.topic)
+        return 0
+
+    entry = entries.get(topic_name(args.topic))
+    if entry is None:
+        print(f"Unknown topic: {args.topic}", file=sys.stderr)
+        return 1
+    with open(bundle_path, "rb") as f:
+        f.seek(entry.offset)
+        sys.stdout.buffer.write(f.read(entry.size))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,195 @@
+"""Structured changelog of the mirrored SDK docs.
+
+Each fetch that adds, updates or removes a document appends one run to
+``docs_changelog.json`` next to ``docs_manifest.json``: the added and removed
+files, and for updated files the change ratio and changed section headings
+reported by the fetcher's ``ChangeDetector``. The ``/workato-sdk`` helper
+answers "what's new" from this one file, filtered by date range and topic,
+instead of walking the git history on every call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from workato_sdk_docs.documents import topic_name
+
+CHANGELOG_FILE = "docs_changelog.json"
+CHANGELOG_VERSION = 1
+DEFAULT_DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+DEFAULT_LIMIT = 5
+# Runs kept in the file; a year of daily fetches
+KEEP_RUNS = 365
+HEADINGS_PER_FILE = 5
+
+
+def empty_changelog() -> Dict:
+    return {"version": CHANGELOG_VERSION, "runs": []}
+
+
+def load_changelog(docs_dir: Path) -> Optional[Dict]:
+    """Load the changelog, or return None if it is missing, unreadable or outdated."""
+    try:
+        changelog = json.loads((Path(docs_dir) / CHANGELOG_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return changelog if changelog.get("version") == CHANGELOG_VERSION else None
+
+
+def write_changelog(docs_dir: Path, changelog: Dict) -> Path:
+    """Write the changelog atomically next to the manifest."""
+    changelog_path = Path(docs_dir) / CHANGELOG_FILE
+    temp_path = changelog_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(changelog, indent=2) + "\n", encoding="utf-8")
+    temp_path.replace(changelog_path)
+    return changelog_path
+
+
+def make_run(
+    added: Iterable[str],
+    updated: Dict[str, Dict],
+    removed: Iterable[str],
+    completed: Optional[str] = None,
+) -> Dict:
+    """
+    Build one changelog run.
+
+    Args:
+        added: Filenames fetched for the first time
+        updated: Filename to ``ChangeDetector.detect_content_changes`` result
+            (only ``change_ratio`` and ``changed_headings`` are kept)
+        removed: Filenames dropped from the manifest
+        completed: ISO timestamp of the run, defaulting to now
+    """
+    return {
+        "date": completed or datetime.now().isoformat(timespec="seconds"),
+        "added": sorted(added),
+        "updated": [_updated_entry(name, changes) for name, changes in sorted(updated.items())],
+        "removed": sorted(removed),
+    }
+
+
+def _updated_entry(filename: str, changes: Dict) -> Dict:
+    ratio = changes.get("change_ratio")
+    return {
+        "file": filename,
+        "change_ratio": None if ratio is None else round(ratio, 4),
+        "changed_headings": list(changes.get("changed_headings") or [])[:HEADINGS_PER_FILE],
+    }
+
+
+def record_run(docs_dir: Path, run: Dict, keep: int = KEEP_RUNS) -> Optional[Path]:
+    """
+    Append ``run`` to the changelog, keeping the newest ``keep`` runs.
+
+    Runs that changed nothing are not recorded.
+
+    Returns:
+        The changelog path, or None if there was nothing to record
+    """
+    if not (run["added"] or run["updated"] or run["removed"]):
+        return None
+    changelog = load_changelog(docs_dir) or empty_changelog()
+    changelog["runs"] = (changelog["runs"] + [run])[-keep:]
+    return write_changelog(docs_dir, changelog)
+
+
+# --- Querying -------------------------------------------------------------
+
+
+def matches_topic(filename: str, topic: Optional[str]) -> bool:
+    """True if ``topic`` is unset or occurs in the file's topic name, ignoring case."""
+    return topic is None or topic.lower() in topic_name(filename).lower()
+
+
+def query_runs(
+    changelog: Dict,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    topic: Optional[str] = None,
+    limit: Optional[int] = DEFAULT_LIMIT,
+) -> List[Dict]:
+    """
+    Runs newest first, filtered by date range (inclusive) and topic.
+
+    ``topic`` matches any topic containing it, case-insensitively, so
+    ``actions`` covers every action guide; runs left empty are dropped.
+    """
+    runs = []
+    for run in reversed(changelog.get("runs", [])):
+        day = run["date"][:10]
+        if (since and day < since.isoformat()) or (until and day > until.isoformat()):
+            continue
+        if topic is not None:
+            run = {
+                **run,
+                "added": [name for name in run["added"] if matches_topic(name, topic)],
+                "updated": [
+                    entry for entry in run["updated"] if matches_topic(entry["file"], topic)
+                ],
+                "removed": [name for name in run["removed"] if matches_topic(name, topic)],
+            }
+            if not (run["added"] or run["updated"] or run["removed"]):
+                continue
+        runs.append(run)
+        if limit and len(runs) >= limit:
+            break
+    return runs
+
+
+def format_runs(runs: List[Dict]) -> str:
+    """Render runs for the helper script, one block per fetch."""
+    lines = []
+    for run in runs:
+        lines.append(f"• {run['date'][:16].replace('T', ' ')}:")
+        for filename in run["added"]:
+            lines.append(f"  🆕 {topic_name(filename)}")
+        for entry in run["updated"]:
+            details = []
+            if entry.get("change_ratio") is not None:
+                details.append(f"{entry['change_ratio']:.1%} changed")
+            if entry.get("changed_headings"):
+                details.append("in " + ", ".join(entry["changed_headings"][:3]))
+            suffix = f" ({' '.join(details)})" if details else ""
+            lines.append(f"  📄 {topic_name(entry['file'])}{suffix}")
+        for filename in run["removed"]:
+            lines.append(f"  🗑️  {topic_name(filename)}")
+        lines.append("")
+    return "\n".join(lines).rstrip("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m workato_sdk_docs.changelog",
+        description="Show recent changes to the mirrored SDK docs",
+    )
+    p.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR, help="Docs directory")
+    p.add_argument("--since", type=date.fromisoformat, help="First day, YYYY-MM-DD")
+    p.add_argument("--until", type=date.fromisoformat, help="Last day, YYYY-MM-DD")
+    p.add_argument("--topic", help="Only topics containing this text")
+    p.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Number of fetch runs")
+    p.add_argument("--json", action="store_true", help="Print runs as JSON")
+    args = p.parse_args(argv)
+
+    changelog = load_changelog(args.docs_dir)
+    if changelog is None:
+        print(f"No changelog in {args.docs_dir}", file=sys.stderr)
+        return 2
+    runs = query_runs(changelog, args.since, args.until, args.topic, args.limit)
+    if not runs:
+        return 1
+
+    if args.json:
+        print(json.dumps(runs, indent=2))
+    else:
+        print(format_runs(runs))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,267 @@
+"""Section-level chunk store for the mirrored SDK docs.
+
+Each document is split on its headings into chunks with stable IDs
+(``<topic>#<anchor>``, using the anchors docs.workato.com itself links to),
+byte offsets into the Markdown file, approximate token counts and content
+hashes. The store is written next to ``docs_manifest.json`` at fetch time so
+the ``/workato-sdk`` helper can print one section by seeking straight to its
+byte range instead of printing the whole document.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from workato_sdk_docs.documents import PERMALINK_RE, body_offset, topic_name
+
+CHUNK_STORE_FILE = "docs_chunks.json"
+CHUNK_STORE_VERSION = 1
+DEFAULT_DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+
+# ID of the text before a document's first heading
+INTRO_ANCHOR = "_intro"
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+_SLUG_DROP_RE = re.compile(r"[^\w\- ]")
+# Rough token count: words and individual punctuation marks
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def slugify(text: str) -> str:
+    """GitHub-style heading anchor: lowercase, punctuation dropped, spaces to dashes."""
+    return _SLUG_DROP_RE.sub("", text.strip().lower()).replace(" ", "-")
+
+
+def count_tokens(text: str) -> int:
+    """Approximate the number of LLM tokens in ``text``."""
+    return len(_TOKEN_RE.findall(text))
+
+
+def parse_heading(line: str):
+    """
+    Parse a Markdown heading line.
+
+    Returns:
+        ``(level, title, anchor)``, or None if the line is not a heading
+    """
+    match = _HEADING_RE.match(line)
+    if not match:
+        return None
+    text = match.group(2)
+    permalink = PERMALINK_RE.search(text)
+    title = PERMALINK_RE.sub("", text).strip(" #")
+    anchor = permalink.group(1) if permalink else slugify(title)
+    return len(match.group(1)), title, anchor
+
+
+def split_chunks(topic: str, data: bytes) -> List[Dict]:
+    """
+    Split a document into heading-delimited chunks.
+
+    Offsets are byte positions in ``data``. A chunk runs from its heading to
+    the next heading of any level; ``section_end`` extends it over the
+    subsections nested below it. The fetch header is never part of a chunk.
+    """
+    body_start = body_offset(data)
+    starts = [(body_start, 0, "", INTRO_ANCHOR)]
+    in_fence = False
+    offset = body_start
+    for raw in data[body_start:].splitlines(keepends=True):
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line.startswith("```"):
+            in_fence = not in_fence
+        heading = None if in_fence else parse_heading(line)
+        if heading:
+            starts.append((offset, *heading))
+        offset += len(raw)
+
+    chunks = []
+    seen: Dict[str, int] = {}
+    for i, (start, level, title, anchor) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(data)
+        text = data[start:end].decode("utf-8", errors="replace")
+        if level == 0 and not text.strip():
+            continue
+        section_end = end
+        if level:
+            section_end = next((s[0] for s in starts[i + 1 :] if s[1] <= level), len(data))
+
+        # Repeated headings get -1, -2 ... like the anchors on the site
+        count = seen.get(anchor, 0)
+        seen[anchor] = count + 1
+        if count:
+            anchor = f"{anchor}-{count}"
+
+        chunks.append(
+            {
+                "id": f"{topic}#{anchor}",
+                "heading": title,
+                "level": level,
+                "start": start,
+                "end": end,
+                "section_end": section_end,
+                "tokens": count_tokens(text),
+                "hash": hashlib.sha256(data[start:end]).hexdigest(),
+            }
+        )
+    return chunks
+
+
+def chunk_file(docs_dir: Path, filename: str, content_hash: Optional[str] = None) -> Dict:
+    """Chunk one document into its chunk store entry."""
+    data = (Path(docs_dir) / filename).read_bytes()
+    return {
+        "hash": content_hash,
+        "size": len(data),
+        "chunks": split_chunks(topic_name(filename), data),
+    }
+
+
+def empty_store() -> Dict:
+    return {"version": CHUNK_STORE_VERSION, "created": datetime.now().isoformat(), "files": {}}
+
+
+def update_store(store: Dict, docs_dir: Path, files: Dict[str, Optional[str]]) -> Dict[str, int]:
+    """
+    Bring the chunk store in line with ``files``, a map of filename to content hash.
+
+    Only files whose hash changed (or that have no hash) are chunked again.
+
+    Returns:
+        Counts of chunked, removed and unchanged files
+    """
+    stats = {"chunked": 0, "removed": 0, "unchanged": 0}
+    entries = store["files"]
+    for filename in [name for name in entries if name not in files]:
+        del entries[filename]
+        stats["removed"] += 1
+
+    for filename, content_hash in sorted(files.items()):
+        entry = entries.get(filename)
+        if entry and content_hash and entry["hash"] == content_hash:
+            stats["unchanged"] += 1
+            continue
+        try:
+            entries[filename] = chunk_file(docs_dir, filename, content_hash)
+        except OSError:
+            stats["removed"] += entries.pop(filename, None) is not None
+            continue
+        stats["chunked"] += 1
+    store["files"] = dict(sorted(entries.items()))
+    return stats
+
+
+def write_store(docs_dir: Path, store: Dict) -> Path:
+    """Write the chunk store atomically next to the manifest."""
+    store_path = Path(docs_dir) / CHUNK_STORE_FILE
+    temp_path = store_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(store, separators=(",", ":")), encoding="utf-8")
+    temp_path.replace(store_path)
+    return store_path
+
+
+def load_store(docs_dir: Path) -> Optional[Dict]:
+    """Load the chunk store, or return None if it is missing, unreadable or outdated."""
+    try:
+        store = json.loads((Path(docs_dir) / CHUNK_STORE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return store if store.get("version") == CHUNK_STORE_VERSION else None
+
+
+def file_chunks(store: Optional[Dict], docs_dir: Path, topic: str) -> Optional[List[Dict]]:
+    """
+    Return the chunks of ``topic``.
+
+    Falls back to chunking the file on the fly when the store is missing or
+    was built from a different version of the file.
+    """
+    filename = f"{topic}.md"
+    path = Path(docs_dir) / filename
+    if not path.is_file():
+        return None
+    entry = (store or {}).get("files", {}).get(filename)
+    if entry is None or entry["size"] != path.stat().st_size:
+        entry = chunk_file(docs_dir, filename)
+    return entry["chunks"]
+
+
+def document_chunks(store: Optional[Dict], topic: str, data: bytes) -> List[Dict]:
+    """Chunks of ``topic`` read as ``data``, from the store if it was built from the same bytes."""
+    entry = (store or {}).get("files", {}).get(f"{topic}.md")
+    if entry is not None and entry["size"] == len(data):
+        return entry["chunks"]
+    return split_chunks(topic, data)
+
+
+def find_chunk(chunks: List[Dict], section: str) -> Optional[Dict]:
+    """Find a chunk by anchor, then by slugified anchor, then by heading text."""
+    anchors = {chunk["id"].partition("#")[2]: chunk for chunk in chunks}
+    wanted = section.strip().lstrip("#")
+    if wanted in anchors:
+        return anchors[wanted]
+    slug = slugify(wanted.replace("-", " "))
+    if slug in anchors:
+        return anchors[slug]
+    lowered = wanted.replace("-", " ").lower()
+    return next((chunk for chunk in chunks if lowered in chunk["heading"].lower()), None)
+
+
+def read_section(docs_dir: Path, topic: str, chunk: Dict, nested: bool = True) -> str:
+    """Read a chunk (and by default its subsections) with a single seek."""
+    end = chunk["section_end"] if nested else chunk["end"]
+    with open(Path(docs_dir) / f"{topic}.md", "rb") as f:
+        f.seek(chunk["start"])
+        return f.read(end - chunk["start"]).decode("utf-8", errors="replace")
+
+
+def format_outline(chunks: List[Dict]) -> str:
+    """List a document's sections with their IDs and sizes."""
+    lines = []
+    for chunk in chunks:
+        if not chunk["level"]:
+            continue
+        indent = "  " * (chunk["level"] - 1)
+        lines.append(f"{indent}• {chunk['heading']}  ({chunk['id']}, ~{chunk['tokens']} tokens)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m workato_sdk_docs.chunks",
+        description="Print one section of a mirrored SDK doc, or list its sections",
+    )
+    p.add_argument("target", help="<topic>#<section>, or <topic># to list sections")
+    p.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR, help="Docs directory")
+    p.add_argument("--no-subsections", action="store_true", help="Stop at the next heading")
+    args = p.parse_args(argv)
+
+    topic, _, section = args.target.partition("#")
+    topic = topic_name(topic.strip())
+    chunks = file_chunks(load_store(args.docs_dir), args.docs_dir, topic)
+    if chunks is None:
+        print(f"Unknown topic: {topic}", file=sys.stderr)
+        return 2
+
+    chunk = find_chunk(chunks, section) if section.strip() else None
+    if chunk is None:
+        if section.strip():
+            print(f"No section '{section}' in {topic}. Sections:", file=sys.stderr)
+            print(format_outline(chunks), file=sys.stderr)
+            return 1
+        print(format_outline(chunks))
+        return 0
+
+    print(read_section(args.docs_dir, topic, chunk, nested=not args.no_subsections), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,348 @@
+"""``workato-sdk``: read, list and search the mirrored SDK docs from Python.
+
+The same operations as the ``/workato-sdk`` helper script, without its
+``ls | grep | sed`` pipelines: topics come from ``docs_manifest.json`` and
+every subcommand imports only what it needs, so read-only commands never load
+the fetcher's HTTP and HTML stack.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from workato_sdk_docs.documents import topic_name
+
+DOCS_DIR_ENV = "WORKATO_SDK_DOCS_DIR"
+INSTALL_DIR = Path.home() / ".workato-sdk-docs"
+MANIFEST_FILE = "docs_manifest.json"
+OFFICIAL_URL = "https://docs.workato.com/en/developing-connectors/sdk"
+REPOSITORY_URL = "https://github.com/kreitter/workato-sdk-docs"
+# Written by the helper script and by ``freshness --check``
+FRESHNESS_FILE = ".workato-sdk-freshness"
+WHATS_NEW_LIMIT = 5
+
+
+def default_docs_dir() -> Path:
+    """``$WORKATO_SDK_DOCS_DIR``, else the installed mirror, else this checkout's docs."""
+    override = os.environ.get(DOCS_DIR_ENV)
+    if override:
+        return Path(override)
+    installed = INSTALL_DIR / "docs"
+    if (installed / MANIFEST_FILE).is_file():
+        return installed
+    return Path(__file__).resolve().parent.parent / "docs"
+
+
+def load_manifest(docs_dir: Path) -> Optional[Dict]:
+    try:
+        return json.loads((Path(docs_dir) / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def manifest_topics(manifest: Dict) -> List[str]:
+    return sorted(topic_name(name) for name in manifest.get("files", {}) if name.endswith(".md"))
+
+
+def _require_manifest(docs_dir: Path) -> Optional[Dict]:
+    manifest = load_manifest(docs_dir)
+    if manifest is None:
+        print(f"No docs manifest in {docs_dir}; run the installer first", file=sys.stderr)
+    return manifest
+
+
+# --- Commands -------------------------------------------------------------
+
+
+def cmd_list(args) -> int:
+    manifest = _require_manifest(args.docs_dir)
+    if manifest is None:
+        return 2
+    for topic in manifest_topics(manifest):
+        print(topic)
+    return 0
+
+
+def cmd_read(args) -> int:
+    manifest = _require_manifest(args.docs_dir)
+    if manifest is None:
+        return 2
+    topic, has_section, section = args.topic.partition("#")
+    topic = topic_name(topic.strip())
+    if f"{topic}.md" not in manifest.get("files", {}):
+        print(f"Unknown topic: {topic}", file=sys.stderr)
+        return 2
+
+    path = Path(args.docs_dir) / f"{topic}.md"
+    try:
+        data = path.read_bytes()
+    except OSError:
+        # A bundle-only install has no .md files
+        from workato_sdk_docs import bundle
+
+        try:
+            with bundle.Bundle(Path(args.docs_dir) / bundle.BUNDLE_FILE) as packed:
+                data = packed.read_bytes(topic)
+        except (OSError, ValueError, KeyError):
+            print(f"No document for {topic} in {args.docs_dir}", file=sys.stderr)
+            return 2
+
+    if has_section:
+        return _read_section(args.docs_dir, topic, section, data)
+    sys.stdout.write(data.decode("utf-8", errors="replace"))
+    print(f"\n📖 Official page: {OFFICIAL_URL}/{topic}.html")
+    return 0
+
+
+def _read_section(docs_dir: Path, topic: str, section: str, data: bytes) -> int:
+    from workato_sdk_docs import chunks
+
+    found = chunks.document_chunks(chunks.load_store(docs_dir), topic, data)
+    chunk = chunks.find_chunk(found, section) if section.strip() else None
+    if chunk is None:
+        if section.strip():
+            print(f"No section '{section}' in {topic}. Sections:", file=sys.stderr)
+            print(chunks.format_outline(found), file=sys.stderr)
+            return 1
+        print(chunks.format_outline(found))
+        return 0
+    sys.stdout.write(data[chunk["start"] : chunk["section_end"]].decode("utf-8", errors="replace"))
+    return 0
+
+
+def cmd_search(args) -> int:
+    argv = ["--docs-dir", str(args.docs_dir), "--limit", str(args.limit)]
+    if args.json:
+        argv.append("--json")
+
+    if not args.semantic:
+        from workato_sdk_docs import search
+
+        status = search.main(argv + args.query)
+        if status != 1:
+            return status
+    # Semantic search is optional: it needs NumPy and a vector index
+    from workato_sdk_docs import semantic
+
+    available = args.semantic
+    if not available:
+        try:
+            available = semantic.load_vectors(args.docs_dir) is not None
+        except (RuntimeError, ImportError):
+            available = False
+    status = semantic.main(argv + args.query) if available else 1
+    if status == 1:
+        print(f"No results for: {' '.join(args.query)}", file=sys.stderr)
+    return status
+
+
+def read_freshness(install_dir: Path) -> Dict:
+    """Parse the freshness state the helper script keeps next to the docs."""
+    try:
+        fields = (Path(install_dir) / FRESHNESS_FILE).read_text().split()
+    except OSError:
+        return {}
+    keys = ("last_attempt", "last_success", "branch", "result")
+    state = dict(zip(keys, fields))
+    for key in ("last_attempt", "last_success"):
+        state[key] = int(state[key]) if state.get(key, "").isdigit() else 0
+    return state
+
+
+def write_freshness(install_dir: Path, state: Dict) -> None:
+    line = "{last_attempt} {last_success} {branch} {result}\n".format(**state)
+    path = Path(install_dir) / FRESHNESS_FILE
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(line)
+    temp_path.replace(path)
+
+
+def checked_ago(timestamp: int, now: Optional[float] = None) -> str:
+    """``last checked N minutes ago``, matching the helper script's wording."""
+    if not timestamp:
+        return "never checked"
+    minutes = int(((now or time.time()) - timestamp) // 60)
+    if minutes < 1:
+        return "last checked just now"
+    if minutes < 120:
+        return f"last checked {minutes} minute{'s' if minutes != 1 else ''} ago"
+    if minutes < 2880:
+        return f"last checked {minutes // 60} hours ago"
+    return f"last checked {minutes // 1440} days ago"
+
+
+def _git(install_dir: Path, *args: str) -> Optional[str]:
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=install_dir, capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def cmd_freshness(args) -> int:
+    manifest = _require_manifest(args.docs_dir)
+    if manifest is None:
+        return 2
+    install_dir = Path(args.docs_dir).resolve().parent
+    state = read_freshness(install_dir)
+
+    if args.check:
+        branch = _git(install_dir, "rev-parse", "--abbrev-ref", "HEAD") or "main"
+        now = int(time.time())
+        fetched = _git(install_dir, "fetch", "--quiet", "origin", branch) is not None
+        if not fetched and branch != "main":
+            branch = "main"
+            fetched = _git(install_dir, "fetch", "--quiet", "origin", branch) is not None
+        state = {
+            "last_attempt": now,
+            "last_success": now if fetched else state.get("last_success", 0),
+            "branch": branch if fetched else state.get("branch", branch),
+            "result": "ok" if fetched else "offline",
+        }
+        write_freshness(install_dir, state)
+
+    branch = state.get("branch") or "main"
+    behind = _git(install_dir, "rev-list", f"HEAD..origin/{branch}", "--count")
+    ahead = _git(install_dir, "rev-list", f"origin/{branch}..HEAD", "--count")
+    if state.get("result") == "offline":
+        print("⚠️  Could not reach GitHub (using local cache)")
+    elif behind and int(behind) > 0:
+        print(f"⚠️  Local docs are behind GitHub by {behind} commit(s)")
+    elif ahead and int(ahead) > 0:
+        print(f"⚠️  Local docs are ahead of GitHub by {ahead} commit(s)")
+    else:
+        print("✅ You have the latest SDK documentation")
+    print(f"🔎 GitHub: {checked_ago(state.get('last_success', 0))}")
+    last_fetch = manifest.get("fetch_metadata", {}).get("last_fetch_completed", "unknown")
+    print(f"🕒 Last fetched: {last_fetch}")
+    print(f"📄 Topics: {len(manifest_topics(manifest))}")
+    return 1 if state.get("result") == "offline" else 0
+
+
+def recent_changes(
+    install_dir: Path,
+    limit: int = WHATS_NEW_LIMIT,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    topic: Optional[str] = None,
+) -> Optional[List[Dict]]:
+    """Recent commits touching the docs, newest first; None outside a git checkout."""
+    log = _git(
+        install_dir,
+        "log",
+        "--no-merges",
+        f"-{limit}",
+        *([f"--since={since} 00:00"] if since else []),
+        *([f"--until={until} 23:59:59"] if until else []),
+        "--format=%x00%h%x09%cr",
+        "--name-only",
+        "--",
+        f"docs/*{topic}*.md" if topic else "docs/*.md",
+    )
+    if log is None:
+        return None
+    changes = []
+    for record in log.split("\0")[1:]:
+        header, _, names = record.partition("\n")
+        commit, _, when = header.partition("\t")
+        topics = [Path(name).stem for name in names.split() if name.endswith(".md")]
+        changes.append({"commit": commit, "when": when, "topics": topics})
+    return changes
+
+
+def cmd_whats_new(args) -> int:
+    manifest = _require_manifest(args.docs_dir)
+    if manifest is None:
+        return 2
+    print("📚 Recent SDK documentation updates:\n")
+
+    from workato_sdk_docs import changelog
+
+    log = changelog.load_changelog(args.docs_dir)
+    if log is not None:
+        runs = changelog.query_runs(log, args.since, args.until, args.topic, args.limit)
+        print(changelog.format_runs(runs) if runs else "No matching documentation updates found.")
+        print(f"\n📎 Full changelog: {REPOSITORY_URL}/commits/main/docs")
+        return 0
+
+    # Mirrors fetched before the changelog existed: the git history
+    changes = recent_changes(
+        Path(args.docs_dir).resolve().parent, args.limit, args.since, args.until, args.topic
+    )
+    if changes is None:
+        # Not a git checkout either: the manifest's per-page timestamps
+        files = {
+            name: entry
+            for name, entry in manifest.get("files", {}).items()
+            if changelog.matches_topic(name, args.topic)
+        }
+        latest = sorted(files, key=lambda name: files[name].get("last_updated", ""), reverse=True)
+        for name in latest[: args.limit]:
+            print(f"• {files[name].get('last_updated', 'unknown')[:16]}  📄 {topic_name(name)}")
+        return 0
+    if not changes:
+        print("No recent SDK documentation updates found.")
+    for change in changes:
+        print(f"• {change['when']}:")
+        print(f"  📎 {REPOSITORY_URL}/commit/{change['commit']}")
+        for topic in change["topics"][:5]:
+            print(f"  📄 {topic}")
+        print()
+    print(f"📎 Full changelog: {REPOSITORY_URL}/commits/main/docs")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="workato-sdk",
+        description="Read, list and search the local Workato SDK docs mirror",
+    )
+    p.add_argument("--docs-dir", type=Path, default=None, help="Docs directory")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="List documentation topics").set_defaults(func=cmd_list)
+
+    read_p = sub.add_parser("read", help="Print a document, or <topic>#<section>")
+    read_p.add_argument("topic")
+    read_p.set_defaults(func=cmd_read)
+
+    search_p = sub.add_parser("search", help="Search the docs")
+    search_p.add_argument("query", nargs="+")
+    search_p.add_argument("--limit", type=int, default=5, help="Number of results")
+    search_p.add_argument("--json", action="store_true", help="Print results as JSON")
+    search_p.add_argument("--semantic", action="store_true", help="Use semantic search")
+    search_p.set_defaults(func=cmd_search)
+
+    fresh_p = sub.add_parser("freshness", help="Show how up to date the docs are")
+    fresh_p.add_argument("--check", action="store_true", help="Check GitHub now")
+    fresh_p.set_defaults(func=cmd_freshness)
+
+    new_p = sub.add_parser("whats-new", help="Show recent documentation changes")
+    new_p.add_argument("--limit", type=int, default=WHATS_NEW_LIMIT, help="Number of updates")
+    new_p.add_argument("--since", type=date.fromisoformat, help="First day, YYYY-MM-DD")
+    new_p.add_argument("--until", type=date.fromisoformat, help="Last day, YYYY-MM-DD")
+    new_p.add_argument("--topic", help="Only topics containing this text")
+    new_p.set_defaults(func=cmd_whats_new)
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.docs_dir is None:
+        args.docs_dir = default_docs_dir()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
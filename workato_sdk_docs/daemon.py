@@ -0,0 +1,342 @@
+"""Optional query daemon for the ``/workato-sdk`` helper.
+
+Every helper call otherwise starts a fresh Python process that re-reads the
+manifest, the search index and the documents. The daemon keeps them in memory
+and answers ``list``, ``read`` and ``search`` requests over a Unix socket, so
+a call costs one connection instead of a cold start. Files are reloaded when
+their modification time changes, and the daemon exits after an idle period.
+
+Protocol: the client sends one JSON object per connection, terminated by a
+newline (``{"cmd": "read", "topic": "quickstart#before-you-begin"}``), and
+the daemon replies with one JSON line ``{"status": 0, "output": "..."}``;
+statuses follow the exit codes of the matching ``python -m`` commands.
+
+Only small standard-library modules are imported at module level so the
+client stays cheap to start; the server imports the index modules lazily.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from workato_sdk_docs.documents import topic_name
+
+DEFAULT_DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+SOCKET_ENV = "WORKATO_SDK_SOCKET"
+SOCKET_NAME = ".workato-sdk-daemon.sock"
+IDLE_TIMEOUT = 30 * 60.0
+CLIENT_TIMEOUT = 5.0
+MAX_REQUEST_SIZE = 64 * 1024
+
+
+def default_socket(docs_dir: Path = DEFAULT_DOCS_DIR) -> Path:
+    """Socket path: ``$WORKATO_SDK_SOCKET``, else next to the docs directory."""
+    override = os.environ.get(SOCKET_ENV)
+    return Path(override) if override else Path(docs_dir).resolve().parent / SOCKET_NAME
+
+
+# --- Server ---------------------------------------------------------------
+
+
+class DocsCache:
+    """
+    In-memory copies of the manifest, topic list, search index and chunk store.
+
+    Each is reloaded on first use after its file's modification time changes.
+    """
+
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = Path(docs_dir)
+        self._loaded: Dict[str, Tuple[Optional[int], object]] = {}
+        self._documents: Dict[str, Tuple[int, bytes]] = {}
+
+    def _mtime(self, filename: str) -> Optional[int]:
+        try:
+            return (self.docs_dir / filename).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _cached(self, filename: str, loader):
+        mtime = self._mtime(filename)
+        cached = self._loaded.get(filename)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, loader() if mtime is not None else None)
+            self._loaded[filename] = cached
+        return cached[1]
+
+    def manifest(self) -> Optional[Dict]:
+        def load():
+            try:
+                return json.loads((self.docs_dir / "docs_manifest.json").read_text("utf-8"))
+            except (OSError, ValueError):
+                return None
+
+        return self._cached("docs_manifest.json", load)
+
+    def search_index(self) -> Optional[Dict]:
+        from workato_sdk_docs import search
+
+        return self._cached(search.INDEX_FILE, lambda: search.load_index(self.docs_dir))
+
+    def chunk_store(self) -> Optional[Dict]:
+        from workato_sdk_docs import chunks
+
+        return self._cached(chunks.CHUNK_STORE_FILE, lambda: chunks.load_store(self.docs_dir))
+
+    def topics(self) -> List[str]:
+        """Topic names from the manifest, or from the ``.md`` files without one."""
+        manifest = self.manifest()
+        if manifest and manifest.get("files"):
+            names = manifest["files"]
+        else:
+            names = [path.name for path in self.docs_dir.glob("*.md")]
+        return sorted(topic_name(name) for name in names if name.endswith(".md"))
+
+    def document(self, topic: str) -> Optional[bytes]:
+        """Document bytes, re-read only when the file changed; None for unknown topics."""
+        # Topics arrive over the socket: read only names the manifest lists
+        if "/" in topic or "\\" in topic or ".." in topic or topic not in self.topics():
+            return None
+        filename = f"{topic}.md"
+        mtime = self._mtime(filename)
+        if mtime is None:
+            self._documents.pop(topic, None)
+            return None
+        cached = self._documents.get(topic)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, (self.docs_dir / filename).read_bytes())
+            self._documents[topic] = cached
+        return cached[1]
+
+
+def handle_request(cache: DocsCache, request: Dict) -> Tuple[int, str]:
+    """Answer one request; returns ``(status, output)``."""
+    cmd = request.get("cmd")
+    if cmd == "ping":
+        return 0, "pong"
+    if cmd == "list":
+        return 0, "\n".join(cache.topics())
+    if cmd == "read":
+        return _read(cache, str(request.get("topic", "")))
+    if cmd == "search":
+        return _search(cache, str(request.get("query", "")), int(request.get("limit", 5)))
+    return 2, f"Unknown command: {cmd}"
+
+
+def _read(cache: DocsCache, target: str) -> Tuple[int, str]:
+    from workato_sdk_docs import chunks
+
+    topic, has_section, section = target.partition("#")
+    topic = topic_name(topic.strip())
+    data = cache.document(topic)
+    if data is None:
+        return 2, f"Unknown topic: {topic}"
+    if not has_section:
+        return 0, data.decode("utf-8", errors="replace")
+
+    found = chunks.document_chunks(cache.chunk_store(), topic, data)
+    chunk = chunks.find_chunk(found, section) if section.strip() else None
+    if chunk is None:
+        outline = chunks.format_outline(found)
+        if section.strip():
+            return 1, f"No section '{section}' in {topic}. Sections:\n{outline}"
+        return 0, outline
+    return 0, data[chunk["start"] : chunk["section_end"]].decode("utf-8", errors="replace")
+
+
+def _search(cache: DocsCache, query: str, limit: int) -> Tuple[int, str]:
+    from workato_sdk_docs import search
+
+    index = cache.search_index()
+    if index is None:
+        return 2, f"No search index in {cache.docs_dir}"
+    hits = search.search(index, query, limit)
+    if not hits:
+        return 1, ""
+    return 0, search.format_results(cache.docs_dir, query, hits)
+
+
+def serve(docs_dir: Path, socket_path: Path, idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """Serve requests until stopped or idle for ``idle_timeout`` seconds."""
+    socket_path = Path(socket_path)
+    cache = DocsCache(docs_dir)
+    # Warm the caches so the first request is as fast as the rest
+    cache.topics()
+    cache.search_index()
+    cache.chunk_store()
+
+    if socket_path.exists():
+        socket_path.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(socket_path))
+        os.chmod(socket_path, 0o600)
+        server.listen(16)
+        server.settimeout(idle_timeout)
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                if not _serve_connection(cache, conn):
+                    break
+    finally:
+        server.close()
+        try:
+            socket_path.unlink()
+        except OSError:
+            pass
+
+
+def _serve_connection(cache: DocsCache, conn: socket.socket) -> bool:
+    """Answer one connection; returns False when asked to stop."""
+    conn.settimeout(CLIENT_TIMEOUT)
+    try:
+        request = json.loads(_read_line(conn))
+    except (OSError, ValueError):
+        return True
+    if request.get("cmd") == "stop":
+        _send(conn, 0, "stopping")
+        return False
+    try:
+        status, output = handle_request(cache, request)
+    except Exception as e:
+        status, output = 2, f"Error: {e}"
+    _send(conn, status, output)
+    return True
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    data = b""
+    while not data.endswith(b"\n"):
+        part = conn.recv(65536)
+        if not part:
+            break
+        data += part
+        if len(data) > MAX_REQUEST_SIZE:
+            raise ValueError("request too large")
+    return data
+
+
+def _send(conn: socket.socket, status: int, output: str) -> None:
+    try:
+        conn.sendall(json.dumps({"status": status, "output": output}).encode("utf-8") + b"\n")
+    except OSError:
+        pass
+
+
+def start(docs_dir: Path, socket_path: Path, idle_timeout: float = IDLE_TIMEOUT) -> bool:
+    """
+    Start the daemon in the background unless one is already answering.
+
+    Returns:
+        True if a daemon is running when this returns
+    """
+    if query(socket_path, {"cmd": "ping"}) is not None:
+        return True
+    if os.fork():
+        # Parent: wait briefly for the socket to come up
+        for _ in range(50):
+            if query(socket_path, {"cmd": "ping"}, timeout=0.1) is not None:
+                return True
+            time.sleep(0.05)
+        return False
+
+    # Child: detach from the terminal and serve
+    os.setsid()
+    if os.fork():
+        os._exit(0)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    try:
+        serve(docs_dir, socket_path, idle_timeout)
+    finally:
+        os._exit(0)
+
+
+# --- Client ---------------------------------------------------------------
+
+
+def query(socket_path: Path, request: Dict, timeout: float = CLIENT_TIMEOUT) -> Optional[Dict]:
+    """Send one request; returns the reply, or None if no daemon answers."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        return json.loads(_read_line(client))
+    except (OSError, ValueError):
+        return None
+    finally:
+        client.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m workato_sdk_docs.daemon",
+        description="Serve /workato-sdk queries from memory over a Unix socket",
+    )
+    p.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR, help="Docs directory")
+    p.add_argument("--socket", type=Path, help="Socket path")
+    p.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT, help="Seconds idle")
+    sub = p.add_subparsers(dest="command", required=True)
+    sub.add_parser("start", help="Start the daemon in the background")
+    sub.add_parser("serve", help="Run the daemon in the foreground")
+    sub.add_parser("stop", help="Stop the daemon")
+    sub.add_parser("status", help="Check whether the daemon is running")
+    sub.add_parser("list", help="List topics")
+    read_p = sub.add_parser("read", help="Print a document or <topic>#<section>")
+    read_p.add_argument("topic")
+    search_p = sub.add_parser("search", help="Full-text search")
+    search_p.add_argument("query", nargs="+")
+    search_p.add_argument("--limit", type=int, default=5)
+    args = p.parse_args(argv)
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("The query daemon needs Unix domain sockets", file=sys.stderr)
+        return 3
+    socket_path = args.socket or default_socket(args.docs_dir)
+
+    if args.command == "serve":
+        serve(args.docs_dir, socket_path, args.idle_timeout)
+        return 0
+    if args.command == "start":
+        running = start(args.docs_dir, socket_path, args.idle_timeout)
+        print(f"Daemon {'running' if running else 'failed to start'} on {socket_path}")
+        return 0 if running else 3
+
+    if args.command == "status":
+        request = {"cmd": "ping"}
+    elif args.command == "stop":
+        request = {"cmd": "stop"}
+    elif args.command == "list":
+        request = {"cmd": "list"}
+    elif args.command == "read":
+        request = {"cmd": "read", "topic": args.topic}
+    else:
+        request = {"cmd": "search", "query": " ".join(args.query), "limit": args.limit}
+
+    reply = query(socket_path, request)
+    if reply is None:
+        # Status 3: no daemon; the helper falls back to its own pipeline
+        if args.command in ("status", "stop"):
+            print("Daemon not running", file=sys.stderr)
+        return 3
+    output = reply["output"]
+    if output:
+        stream = sys.stdout if reply["status"] == 0 else sys.stderr
+        print(output, end="" if output.endswith("\n") else "\n", file=stream)
+    return reply["status"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
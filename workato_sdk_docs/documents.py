@@ -0,0 +1,46 @@
+"""Layout of the Markdown documents the fetcher saves.
+
+Every document opens with a header: the ``DOCUMENT_TITLE`` line, the page's
+Source and Fetched fields and a horizontal rule, then a blank line and the
+converted page body. The fetcher hashes only the body, and the search index,
+chunk store, bundle and CLI all find it with these helpers.
+"""
+
+import re
+
+# Title line that opens every saved document
+DOCUMENT_TITLE = "# Workato SDK Documentation"
+# Ends the header
+HEADER_RULE = "\n---\n"
+# docs.workato.com headings end with a permalink such as ``[​](<#oauth-2-0>)``
+PERMALINK_RE = re.compile(r"\[[^\]]*\]\(<?#([^)>\s]+)>?\)")
+
+_TITLE_LINE = (DOCUMENT_TITLE + "\n").encode()
+_RULE = HEADER_RULE.encode()
+
+
+def topic_name(filename: str) -> str:
+    """The topic a document is read by: its filename without ``.md``."""
+    return filename[:-3] if filename.endswith(".md") else filename
+
+
+def body_offset(data: bytes) -> int:
+    """Byte offset of the body in an encoded document, 0 if it has no header."""
+    if not data.startswith(_TITLE_LINE):
+        return 0
+    rule = data.find(_RULE)
+    if rule == -1:
+        return 0
+    start = rule + len(_RULE)
+    return start + 1 if data[start : start + 1] == b"\n" else start
+
+
+def document_body(document: str) -> str:
+    """Strip the header (and its volatile Fetched field) from a saved document."""
+    if not document.startswith(DOCUMENT_TITLE + "\n"):
+        return document
+    rule = document.find(HEADER_RULE)
+    if rule == -1:
+        return document
+    body = document[rule + len(HEADER_RULE) :]
+    return body[1:] if body.startswith("\n") else body
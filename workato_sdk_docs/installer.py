@@ -66,9 +66,11 @@ def write_claude_command() -> None:
         "Usage:\n"
         "- /workato-sdk - List all available SDK documentation topics\n"
         "- /workato-sdk <topic> - Read specific SDK documentation\n"
+        "- /workato-sdk <topic>#<section> - Read one section (<topic># lists sections)\n"
         "- /workato-sdk -t - Check sync status without reading a doc\n"
         "- /workato-sdk -t <topic> - Check freshness then read documentation\n"
-        "- /workato-sdk whats new - Show recent documentation changes\n\n"
+        "- /workato-sdk whats new - Show recent documentation changes\n"
+        "- /workato-sdk daemon start|stop|status - Serve queries from memory\n\n"
         "Examples:\n"
         "/workato-sdk sdk-reference\n"
         "/workato-sdk platform-quickstart\n"
@@ -0,0 +1,509 @@
+"""Full-text search over the mirrored SDK docs.
+
+The fetcher builds a BM25 inverted index next to ``docs_manifest.json``; the
+``/workato-sdk`` helper queries it through ``python3 -m workato_sdk_docs.search``
+so natural-language questions are answered without scanning every document.
+Only the standard library is used, keeping the query path fast to start.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from workato_sdk_docs.documents import document_body, topic_name
+
+INDEX_FILE = "docs_search_index.json"
+INDEX_VERSION = 2
+DEFAULT_DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+DEFAULT_LIMIT = 5
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Term frequency multipliers for where a term appears in a document
+TITLE_WEIGHT = 3
+HEADING_WEIGHT = 2
+FILENAME_WEIGHT = 2
+BODY_WEIGHT = 1
+
+# Compact once tombstoned documents make up this share of the index
+COMPACT_RATIO = 0.25
+
+SNIPPET_WIDTH = 160
+SNIPPETS_PER_HIT = 2
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+# Markdown link targets, e.g. the ``(<#anchor>)`` after every heading
+_LINK_TARGET_RE = re.compile(r"\]\(<?[^)\s]*>?\)")
+
+STOPWORDS = frozenset("""
+    a about an and are as at be by can do does explain find for from how i in
+    is it me my of on or show search should tell that the this to use using
+    want what when where which who why will with you your
+    """.split())
+
+
+# --- Porter stemmer -------------------------------------------------------
+
+_VOWELS = frozenset("aeiou")
+
+
+def _is_consonant(word: str, i: int) -> bool:
+    if word[i] in _VOWELS:
+        return False
+    if word[i] == "y":
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(stem: str) -> int:
+    """Number of vowel-consonant sequences in ``stem`` (Porter's *m*)."""
+    m = 0
+    previous_vowel = False
+    for i in range(len(stem)):
+        vowel = not _is_consonant(stem, i)
+        if previous_vowel and not vowel:
+            m += 1
+        previous_vowel = vowel
+    return m
+
+
+def _has_vowel(stem: str) -> bool:
+    return any(not _is_consonant(stem, i) for i in range(len(stem)))
+
+
+def _ends_double_consonant(word: str) -> bool:
+    return len(word) > 1 and word[-1] == word[-2] and _is_consonant(word, len(word) - 1)
+
+
+def _ends_cvc(word: str) -> bool:
+    return (
+        len(word) > 2
+        and _is_consonant(word, len(word) - 3)
+        and not _is_consonant(word, len(word) - 2)
+        and _is_consonant(word, len(word) - 1)
+        and word[-1] not in "wxy"
+    )
+
+
+_STEP2 = (
+    ("ational", "ate"),
+    ("tional", "tion"),
+    ("enci", "ence"),
+    ("anci", "ance"),
+    ("izer", "ize"),
+    ("abli", "able"),
+    ("alli", "al"),
+    ("entli", "ent"),
+    ("eli", "e"),
+    ("ousli", "ous"),
+    ("ization", "ize"),
+    ("ation", "ate"),
+    ("ator", "ate"),
+    ("alism", "al"),
+    ("iveness", "ive"),
+    ("fulness", "ful"),
+    ("ousness", "ous"),
+    ("aliti", "al"),
+    ("iviti", "ive"),
+    ("biliti", "ble"),
+)
+_STEP3 = (
+    ("icate", "ic"),
+    ("ative", ""),
+    ("alize", "al"),
+    ("iciti", "ic"),
+    ("ical", "ic"),
+    ("ful", ""),
+    ("ness", ""),
+)
+_STEP4 = ("al ance ence er ic able ible ant ement ment ent ion ou ism ate iti ous ive ize").split()
+
+
+def _replace(word: str, rules, min_measure: int) -> str:
+    for suffix, replacement in rules:
+        if word.endswith(suffix):
+            stem = word[: -len(suffix)]
+            return stem + replacement if _measure(stem) > min_measure else word
+    return word
+
+
+@lru_cache(maxsize=None)
+def stem(word: str) -> str:
+    """Reduce an English word to its Porter stem (``connections`` -> ``connect``)."""
+    if len(word) <= 2 or not word.isalpha():
+        return word
+
+    # Step 1a: plurals
+    if word.endswith("sses") or word.endswith("ies"):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+
+    # Step 1b: -ed / -ing
+    if word.endswith("eed"):
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ("ed", "ing"):
+            if word.endswith(suffix) and _has_vowel(word[: -len(suffix)]):
+                word = word[: -len(suffix)]
+                if word.endswith(("at", "bl", "iz")):
+                    word += "e"
+                elif _ends_double_consonant(word) and word[-1] not in "lsz":
+                    word = word[:-1]
+                elif _measure(word) == 1 and _ends_cvc(word):
+                    word += "e"
+                break
+
+    # Step 1c: terminal y
+    if word.endswith("y") and _has_vowel(word[:-1]):
+        word = word[:-1] + "i"
+
+    word = _replace(word, _STEP2, 0)
+    word = _replace(word, _STEP3, 0)
+
+    # Step 4: drop suffixes from long stems
+    for suffix in sorted(_STEP4, key=len, reverse=True):
+        if word.endswith(suffix):
+            stem_ = word[: -len(suffix)]
+            if _measure(stem_) > 1 and (suffix != "ion" or stem_.endswith(("s", "t"))):
+                word = stem_
+            break
+
+    # Step 5: final e and double l
+    if word.endswith("e"):
+        stem_ = word[:-1]
+        m = _measure(stem_)
+        if m > 1 or (m == 1 and not _ends_cvc(stem_)):
+            word = stem_
+    if word.endswith("ll") and _measure(word) > 1:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split into words and stem, dropping stopwords."""
+    return [stem(word) for word in _WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+# --- Index building -------------------------------------------------------
+
+
+def clean_line(line: str) -> str:
+    """Drop Markdown link targets so URLs do not count as words."""
+    return _LINK_TARGET_RE.sub("]", line)
+
+
+def parse_document(document: str):
+    """
+    Split a document into its title, headings and body lines.
+
+    Returns:
+        ``(title, headings, body_lines)``; the title is the first ``#`` heading
+    """
+    title = ""
+    headings = []
+    body = []
+    in_fence = False
+    for line in document_body(document).splitlines():
+        if line.startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            text = clean_line(match.group(2)).replace("[​]", "").strip(" #[]")
+            if not title and match.group(1) == "#":
+                title = text
+            else:
+                headings.append(text)
+        else:
+            body.append(clean_line(line))
+    return title, headings, body
+
+
+def document_terms(filename: str, document: str) -> Dict[str, int]:
+    """Weighted term frequencies of one document, boosting titles and headings."""
+    title, headings, body = parse_document(document)
+    counts: Dict[str, int] = {}
+    fields = (
+        (topic_name(filename).replace("__", " "), FILENAME_WEIGHT),
+        (title, TITLE_WEIGHT),
+        ("\n".join(headings), HEADING_WEIGHT),
+        ("\n".join(body), BODY_WEIGHT),
+    )
+    for text, weight in fields:
+        for term in tokenize(text):
+            counts[term] = counts.get(term, 0) + weight
+    return counts
+
+
+def empty_index() -> Dict:
+    """
+    Return an index without documents.
+
+    Postings are stored per term as ``"doc:tf doc:tf ..."`` strings so a query
+    only has to split the lists of its own terms, and an update only appends
+    to the lists of the terms it touches.
+    """
+    return {
+        "version": INDEX_VERSION,
+        "created": datetime.now().isoformat(),
+        "k1": K1,
+        "b": B,
+        "docs": [],
+        "deleted": [],
+        "total_length": 0,
+        "terms": {},
+    }
+
+
+def add_document(
+    index: Dict, filename: str, document: str, content_hash: Optional[str] = None
+) -> int:
+    """Tokenise ``document`` and append it to the index, returning its doc id."""
+    counts = document_terms(filename, document)
+    doc_id = len(index["docs"])
+    length = sum(counts.values())
+    index["docs"].append(
+        {
+            "file": filename,
+            "title": parse_document(document)[0] or topic_name(filename),
+            "length": length,
+            "hash": content_hash,
+        }
+    )
+    index["total_length"] += length
+    terms = index["terms"]
+    for term, tf in counts.items():
+        entry = f"{doc_id}:{tf}"
+        terms[term] = f"{terms[term]} {entry}" if term in terms else entry
+    return doc_id
+
+
+def remove_document(index: Dict, doc_id: int) -> None:
+    """Tombstone a document; its postings are dropped at the next compaction."""
+    doc = index["docs"][doc_id]
+    if not doc.get("deleted"):
+        doc["deleted"] = True
+        index["total_length"] -= doc["length"]
+        index["deleted"].append(doc_id)
+
+
+def compact_index(index: Dict) -> Dict:
+    """Return a copy of ``index`` without tombstoned documents, renumbering the rest."""
+    dead = set(index["deleted"])
+    renumber = {}
+    docs = []
+    for doc_id, doc in enumerate(index["docs"]):
+        if doc_id not in dead:
+            renumber[str(doc_id)] = str(len(docs))
+            docs.append(doc)
+
+    terms = {}
+    for term, entries in index["terms"].items():
+        live = []
+        for entry in entries.split():
+            doc_id, tf = entry.split(":")
+            if doc_id in renumber:
+                live.append(f"{renumber[doc_id]}:{tf}")
+        if live:
+            terms[term] = " ".join(live)
+    return {
+        **index,
+        "docs": docs,
+        "deleted": [],
+        "total_length": sum(doc["length"] for doc in docs),
+        "terms": dict(sorted(terms.items())),
+    }
+
+
+def build_index(docs_dir: Path, filenames: Optional[Iterable[str]] = None) -> Dict:
+    """Build the index for ``filenames`` (default: every ``.md`` in ``docs_dir``)."""
+    docs_dir = Path(docs_dir)
+    if filenames is None:
+        filenames = [path.name for path in docs_dir.glob("*.md")]
+    index = empty_index()
+    update_index(index, docs_dir, dict.fromkeys(filenames))
+    return index
+
+
+def update_index(index: Dict, docs_dir: Path, files: Dict[str, Optional[str]]) -> Dict[str, int]:
+    """
+    Bring ``index`` in line with ``files``, a map of filename to content hash.
+
+    Only documents whose hash differs from the indexed one (or that have no
+    hash) are re-tokenised; documents no longer listed are tombstoned. Once
+    tombstones make up COMPACT_RATIO of the index it is compacted in place.
+
+    Returns:
+        Counts of added, updated, removed and unchanged documents, and whether
+        the index was compacted
+    """
+    docs_dir = Path(docs_dir)
+    live = {
+        doc["file"]: doc_id for doc_id, doc in enumerate(index["docs"]) if not doc.get("deleted")
+    }
+    stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "compacted": 0}
+
+    for filename in sorted(set(live) - set(files)):
+        remove_document(index, live.pop(filename))
+        stats["removed"] += 1
+
+    for filename in sorted(files):
+        content_hash = files[filename]
+        doc_id = live.get(filename)
+        if doc_id is not None and content_hash and index["docs"][doc_id]["hash"] == content_hash:
+            stats["unchanged"] += 1
+            continue
+        try:
+            document = (docs_dir / filename).read_text(encoding="utf-8")
+        except OSError:
+            document = None
+        if doc_id is not None:
+            remove_document(index, doc_id)
+        if document is None:
+            # Listed but missing on disk: nothing to index
+            stats["removed"] += doc_id is not None
+            continue
+        add_document(index, filename, document, content_hash)
+        stats["updated" if doc_id is not None else "added"] += 1
+
+    if index["deleted"] and len(index["deleted"]) >= COMPACT_RATIO * len(index["docs"]):
+        index.update(compact_index(index))
+        stats["compacted"] = 1
+    return stats
+
+
+def write_index(docs_dir: Path, index: Dict) -> Path:
+    """Write the index atomically next to the manifest."""
+    index_path = Path(docs_dir) / INDEX_FILE
+    temp_path = index_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    temp_path.replace(index_path)
+    return index_path
+
+
+def load_index(docs_dir: Path) -> Optional[Dict]:
+    """Load the index, or return None if it is missing, unreadable or outdated."""
+    try:
+        index = json.loads((Path(docs_dir) / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == INDEX_VERSION else None
+
+
+# --- Querying -------------------------------------------------------------
+
+
+class SearchHit(NamedTuple):
+    file: str
+    title: str
+    score: float
+
+
+def search(index: Dict, query: str, limit: int = DEFAULT_LIMIT) -> List[SearchHit]:
+    """Rank documents for ``query`` with BM25, skipping tombstoned documents."""
+    docs = index["docs"]
+    dead = set(index["deleted"])
+    n = len(docs) - len(dead)
+    k1, b = index["k1"], index["b"]
+    avg_length = index["total_length"] / n if n else 1.0
+    scores: Dict[int, float] = {}
+    for term in dict.fromkeys(tokenize(query)):
+        entries = index["terms"].get(term)
+        if not entries:
+            continue
+        postings = []
+        for entry in entries.split():
+            doc_id, tf = entry.split(":")
+            doc_id = int(doc_id)
+            if doc_id not in dead:
+                postings.append((doc_id, int(tf)))
+        idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+        for doc_id, tf in postings:
+            norm = k1 * (1 - b + b * docs[doc_id]["length"] / avg_length)
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], docs[item[0]]["file"]))
+    return [
+        SearchHit(docs[doc_id]["file"], docs[doc_id]["title"], round(score, 3))
+        for doc_id, score in ranked[:limit]
+    ]
+
+
+def snippets(document: str, query: str, limit: int = SNIPPETS_PER_HIT) -> List[str]:
+    """Return the body lines of ``document`` that match the most query terms."""
+    terms = set(tokenize(query))
+    if not terms:
+        return []
+    scored = []
+    for position, line in enumerate(parse_document(document)[2]):
+        text = line.strip()
+        if not text or text.startswith(("```", "|", "[")):
+            continue
+        matched = terms.intersection(tokenize(text))
+        if matched:
+            scored.append((-len(matched), position, text))
+    scored.sort()
+    return [_trim(text) for _, _, text in sorted(scored[:limit], key=lambda item: item[1])]
+
+
+def _trim(text: str) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= SNIPPET_WIDTH else text[: SNIPPET_WIDTH - 1].rstrip() + "…"
+
+
+def format_results(docs_dir: Path, query: str, hits: List[SearchHit]) -> str:
+    """Render ranked hits with snippets for the helper script."""
+    lines = [f'Top matches for "{query}":', ""]
+    for rank, hit in enumerate(hits, 1):
+        lines.append(f"  {rank}. {topic_name(hit.file)} — {hit.title}")
+        try:
+            document = (Path(docs_dir) / hit.file).read_text(encoding="utf-8")
+        except OSError:
+            document = ""
+        for snippet in snippets(document, query):
+            lines.append(f"     {snippet}")
+        lines.append("")
+    return "\n".join(lines).rstrip("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m workato_sdk_docs.search",
+        description="Search the mirrored Workato SDK docs",
+    )
+    p.add_argument("query", nargs="+", help="Search terms or a natural-language question")
+    p.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR, help="Docs directory")
+    p.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Number of results")
+    p.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = p.parse_args(argv)
+    query = " ".join(args.query)
+
+    index = load_index(args.docs_dir)
+    if index is None:
+        print(f"No search index in {args.docs_dir}", file=sys.stderr)
+        return 2
+    hits = search(index, query, args.limit)
+    if not hits:
+        return 1
+
+    if args.json:
+        print(json.dumps([hit._asdict() for hit in hits], indent=2))
+    else:
+        print(format_results(args.docs_dir, query, hits))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
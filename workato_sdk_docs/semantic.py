@@ -0,0 +1,439 @@
+"""Optional semantic search over the sections of the mirrored SDK docs.
+
+Every chunk in the chunk store (see ``chunks.py``) is embedded into a vector
+and the vectors are kept in a NumPy matrix (``docs_vectors.npy``) next to
+``docs_manifest.json``, with row metadata in ``docs_vectors.json``. Queries
+memory-map the matrix and rank all sections with one matrix-vector product.
+
+Embeddings come from a small local sentence-transformers model when one is
+named in ``WORKATO_SDK_EMBED_MODEL`` and installed, and otherwise from a
+hashing-trick TF-IDF vectoriser that needs nothing but NumPy. Rows are keyed
+by chunk hash, so a fetch only embeds the sections whose text changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from workato_sdk_docs import chunks as chunk_store
+from workato_sdk_docs.documents import topic_name
+from workato_sdk_docs.search import clean_line, tokenize
+
+VECTORS_FILE = "docs_vectors.npy"
+VECTORS_META_FILE = "docs_vectors.json"
+VECTORS_VERSION = 1
+DEFAULT_DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+DEFAULT_LIMIT = 5
+DEFAULT_DTYPE = "float16"
+DTYPES = ("float16", "int8")
+
+# Name of a sentence-transformers model to embed with instead of hashing
+EMBED_MODEL_ENV = "WORKATO_SDK_EMBED_MODEL"
+
+# Hashing-trick vectoriser: buckets (a power of two) and sub-word features
+HASH_DIM = 4096
+CHAR_NGRAM = 4
+CHAR_NGRAM_WEIGHT = 0.5
+
+SNIPPET_WIDTH = 160
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("Semantic search needs NumPy: pip install 'workato-sdk-docs[semantic]'")
+    return numpy
+
+
+# --- Embedders ------------------------------------------------------------
+
+
+class HashingEmbedder:
+    """
+    TF-IDF vectoriser using the hashing trick.
+
+    Stemmed words and their character n-grams are hashed into ``dim`` signed
+    buckets with sublinear term frequency. Document vectors hold raw term
+    weights; IDF is applied at query time from the bucket document frequencies,
+    so adding a section never forces the others to be embedded again.
+    """
+
+    uses_idf = True
+
+    def __init__(self, dim: int = HASH_DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def features(self, text: str) -> Dict[str, float]:
+        counts: Dict[str, float] = {}
+        for term in tokenize(text):
+            counts[term] = counts.get(term, 0.0) + 1.0
+            padded = f"<{term}>"
+            for i in range(len(padded) - CHAR_NGRAM + 1):
+                gram = "#" + padded[i : i + CHAR_NGRAM]
+                counts[gram] = counts.get(gram, 0.0) + CHAR_NGRAM_WEIGHT
+        return counts
+
+    def embed(self, texts: List[str]):
+        np = _numpy()
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        mask = self.dim - 1
+        for row, text in enumerate(texts):
+            for feature, count in self.features(text).items():
+                # crc32 rather than hash(): it must be stable across processes
+                digest = zlib.crc32(feature.encode("utf-8"))
+                sign = -1.0 if digest & 0x80000000 else 1.0
+                vectors[row, digest & mask] += sign * (1.0 + math.log(count))
+        return vectors
+
+
+class ModelEmbedder:
+    """Dense embeddings from a local sentence-transformers model, run on the CPU."""
+
+    uses_idf = False
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f"model:{model_name}"
+
+    def embed(self, texts: List[str]):
+        np = _numpy()
+        vectors = self.model.encode(texts, batch_size=32, normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def get_embedder(name: Optional[str] = None):
+    """
+    Return the embedder recorded as ``name`` in an index, or the default one.
+
+    The default is the model named in ``WORKATO_SDK_EMBED_MODEL`` when
+    sentence-transformers can load it, and the hashing vectoriser otherwise.
+    """
+    if name is None:
+        model_name = os.environ.get(EMBED_MODEL_ENV)
+        if model_name:
+            try:
+                return ModelEmbedder(model_name)
+            except Exception as e:
+                print(f"Embedding model unavailable ({e}); using hashing", file=sys.stderr)
+        return HashingEmbedder()
+    if name.startswith("model:"):
+        return ModelEmbedder(name.partition(":")[2])
+    if name.startswith("hashing-"):
+        return HashingEmbedder(int(name.partition("-")[2]))
+    raise ValueError(f"Unknown embedder: {name}")
+
+
+# --- Index building -------------------------------------------------------
+
+
+def chunk_text(topic: str, chunk: Dict, data: bytes) -> str:
+    """Text embedded for a chunk: its topic name, then its Markdown without link targets."""
+    text = data[chunk["start"] : chunk["end"]].decode("utf-8", errors="replace")
+    lines = [clean_line(line).replace("[​]", "") for line in text.splitlines()]
+    return topic.replace("__", " ") + "\n" + "\n".join(lines)
+
+
+def quantize(vectors, dtype: str):
+    """Convert float32 rows to the stored dtype; int8 rows are scaled to use the full range."""
+    np = _numpy()
+    if dtype == "int8":
+        peak = np.abs(vectors).max(axis=1, keepdims=True)
+        peak[peak == 0] = 1.0
+        return np.rint(vectors * (127.0 / peak)).astype(np.int8)
+    return vectors.astype(np.float16)
+
+
+def row_weights(matrix, uses_idf: bool):
+    """
+    Per-dimension query weights (squared IDF) and weighted row norms.
+
+    Cosine similarity is invariant to each row's scale, so int8 rows need no
+    stored scale factors once their norms are taken under the same weights.
+    """
+    np = _numpy()
+    rows, dim = matrix.shape
+    if uses_idf:
+        df = np.count_nonzero(matrix, axis=0)
+        idf = np.log((1.0 + rows) / (1.0 + df)) + 1.0
+    else:
+        idf = np.ones(dim)
+    weights = (idf * idf).astype(np.float32)
+    norms = np.sqrt(np.square(matrix, dtype=np.float32) @ weights)
+    norms[norms == 0] = 1.0
+    return weights, norms.astype(np.float32)
+
+
+def load_vectors(docs_dir: Path, mmap: bool = True) -> Optional[Dict]:
+    """
+    Load the vector index, memory-mapping the matrix.
+
+    Returns:
+        ``{"meta": ..., "matrix": ...}``, or None if missing or incompatible
+    """
+    docs_dir = Path(docs_dir)
+    try:
+        meta = json.loads((docs_dir / VECTORS_META_FILE).read_text(encoding="utf-8"))
+        if meta.get("version") != VECTORS_VERSION:
+            return None
+        matrix = _numpy().load(docs_dir / VECTORS_FILE, mmap_mode="r" if mmap else None)
+    except (OSError, ValueError):
+        return None
+    if matrix.shape != (len(meta["rows"]), meta["dim"]):
+        return None
+    return {"meta": meta, "matrix": matrix}
+
+
+def write_vectors(docs_dir: Path, meta: Dict, matrix) -> Path:
+    """Write the matrix and its metadata atomically next to the manifest."""
+    np = _numpy()
+    docs_dir = Path(docs_dir)
+    weights, norms = row_weights(matrix, meta["uses_idf"])
+    meta = {**meta, "weights": weights.tolist(), "norms": norms.tolist()}
+
+    matrix_path = docs_dir / VECTORS_FILE
+    temp_path = docs_dir / (VECTORS_FILE + ".tmp")
+    with open(temp_path, "wb") as f:
+        np.save(f, matrix)
+    temp_path.replace(matrix_path)
+
+    meta_path = docs_dir / VECTORS_META_FILE
+    temp_path = meta_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(meta, separators=(",", ":")), encoding="utf-8")
+    temp_path.replace(meta_path)
+    return matrix_path
+
+
+def update_vectors(
+    docs_dir: Path, store: Dict, embedder=None, dtype: str = DEFAULT_DTYPE
+) -> Dict[str, int]:
+    """
+    Embed the chunks of ``store`` and write the vector index.
+
+    Rows of the existing index are reused for chunks of the same topic whose
+    hash is unchanged (the topic is part of the embedded text); an index built
+    with another embedder or dtype is rebuilt from scratch. Nothing is written
+    when every row was reused unchanged.
+
+    Returns:
+        Counts of embedded, reused and removed chunks
+    """
+    np = _numpy()
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    embedder = embedder or get_embedder()
+    docs_dir = Path(docs_dir)
+
+    old = load_vectors(docs_dir, mmap=False)
+    reusable = (
+        old is not None
+        and old["meta"]["embedder"] == embedder.name
+        and old["meta"]["dtype"] == dtype
+    )
+    old_rows: Dict[Tuple[str, str], int] = {}
+    if reusable:
+        old_rows = {_row_key(row): i for i, row in enumerate(old["meta"]["rows"])}
+
+    rows = []
+    reused = []
+    pending: Dict[str, List[Dict]] = {}
+    for filename, entry in sorted(store["files"].items()):
+        for chunk in entry["chunks"]:
+            rows.append([chunk["id"], chunk["hash"], chunk["heading"]])
+            key = _row_key(rows[-1])
+            if key in old_rows:
+                reused.append((len(rows) - 1, old_rows[key]))
+            else:
+                pending.setdefault(filename, []).append({**chunk, "row": len(rows) - 1})
+
+    new_rows = []
+    texts = []
+    for filename, file_chunks in pending.items():
+        data = (docs_dir / filename).read_bytes()
+        topic = topic_name(filename)
+        for chunk in file_chunks:
+            new_rows.append(chunk["row"])
+            texts.append(chunk_text(topic, chunk, data))
+
+    old_keys = {_row_key(row) for row in old["meta"]["rows"]} if old else set()
+    stats = {
+        "embedded": len(texts),
+        "reused": len(reused),
+        "removed": len(old_keys - {_row_key(row) for row in rows}),
+    }
+    if reusable and not texts and rows == old["meta"]["rows"]:
+        return stats
+
+    matrix = np.zeros((len(rows), embedder.dim), dtype=dtype)
+    if reused:
+        targets, sources = zip(*reused)
+        matrix[list(targets)] = old["matrix"][list(sources)]
+    if texts:
+        matrix[new_rows] = quantize(embedder.embed(texts), dtype)
+
+    meta = {
+        "version": VECTORS_VERSION,
+        "created": old["meta"]["created"] if reusable else datetime.now().isoformat(),
+        "embedder": embedder.name,
+        "uses_idf": embedder.uses_idf,
+        "dim": embedder.dim,
+        "dtype": dtype,
+        "rows": rows,
+    }
+    write_vectors(docs_dir, meta, matrix)
+    return stats
+
+
+def _row_key(row: List) -> Tuple[str, str]:
+    """``(topic, chunk hash)`` of an index row ``[id, hash, heading]``."""
+    return row[0].partition("#")[0], row[1]
+
+
+# --- Querying -------------------------------------------------------------
+
+
+class SemanticHit(NamedTuple):
+    id: str
+    heading: str
+    score: float
+
+
+def search_vectors(
+    index: Dict, query: str, limit: int = DEFAULT_LIMIT, embedder=None, per_topic: bool = True
+) -> List[SemanticHit]:
+    """
+    Rank sections by cosine similarity to ``query``.
+
+    With ``per_topic`` only the best section of each document is returned.
+    """
+    np = _numpy()
+    meta, matrix = index["meta"], index["matrix"]
+    if not meta["rows"]:
+        return []
+    embedder = embedder or get_embedder(meta["embedder"])
+    weights = np.asarray(meta["weights"], dtype=np.float32)
+    query_vector = embedder.embed([query])[0]
+    query_norm = math.sqrt(float(np.square(query_vector) @ weights))
+    if query_norm == 0:
+        return []
+
+    scores = matrix @ (query_vector * weights)
+    scores = scores / (np.asarray(meta["norms"], dtype=np.float32) * query_norm)
+
+    # Partial sort: only the candidates that can make the top ``limit`` are ordered.
+    # One topic can fill the pool with its sections, so it grows until ``limit``
+    # topics are found or the positive scores run out
+    candidates = min(len(scores), limit * 8 if per_topic else limit)
+    while True:
+        top = np.argpartition(-scores, candidates - 1)[:candidates]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        hits = []
+        seen = set()
+        for row in top:
+            score = float(scores[row])
+            if score <= 0:
+                break
+            chunk_id, _, heading = meta["rows"][row]
+            topic = chunk_id.partition("#")[0]
+            if per_topic and topic in seen:
+                continue
+            seen.add(topic)
+            hits.append(SemanticHit(chunk_id, heading, round(score, 3)))
+            if len(hits) == limit:
+                break
+        if len(hits) == limit or candidates == len(scores) or scores[top[-1]] <= 0:
+            return hits
+        candidates = min(len(scores), candidates * 4)
+
+
+def _preview(docs_dir: Path, store: Optional[Dict], chunk_id: str) -> str:
+    """First prose line of a section, trimmed for display."""
+    topic, _, section = chunk_id.partition("#")
+    found = chunk_store.file_chunks(store, docs_dir, topic)
+    chunk = found and chunk_store.find_chunk(found, section)
+    if not chunk:
+        return ""
+    text = chunk_store.read_section(docs_dir, topic, chunk, nested=False)
+    for line in text.splitlines():
+        line = clean_line(line).strip()
+        if line and not line.startswith(("#", "```", "|", ">")):
+            return line if len(line) <= SNIPPET_WIDTH else line[: SNIPPET_WIDTH - 1] + "…"
+    return ""
+
+
+def format_results(docs_dir: Path, query: str, hits: List[SemanticHit]) -> str:
+    """Render ranked sections for the helper script."""
+    store = chunk_store.load_store(docs_dir)
+    lines = [f'Closest sections for "{query}":', ""]
+    for rank, hit in enumerate(hits, 1):
+        lines.append(f"  {rank}. {hit.id} — {hit.heading or 'Introduction'}")
+        preview = _preview(docs_dir, store, hit.id)
+        if preview:
+            lines.append(f"     {preview}")
+        lines.append("")
+    return "\n".join(lines).rstrip("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m workato_sdk_docs.semantic",
+        description="Find the doc sections closest in meaning to a question",
+    )
+    p.add_argument("query", nargs="*", help="A natural-language question")
+    p.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR, help="Docs directory")
+    p.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Number of results")
+    p.add_argument("--json", action="store_true", help="Print results as JSON")
+    p.add_argument("--all-sections", action="store_true", help="Allow several hits per doc")
+    p.add_argument("--build", action="store_true", help="Update the vector index and exit")
+    p.add_argument("--dtype", choices=DTYPES, default=DEFAULT_DTYPE, help="Stored vector type")
+    args = p.parse_args(argv)
+
+    try:
+        if args.build:
+            store = chunk_store.load_store(args.docs_dir)
+            if store is None:
+                print(f"No chunk store in {args.docs_dir}", file=sys.stderr)
+                return 2
+            stats = update_vectors(args.docs_dir, store, dtype=args.dtype)
+            print(
+                f"Vectors: {stats['embedded']} embedded, {stats['reused']} reused, "
+                f"{stats['removed']} removed"
+            )
+            return 0
+
+        query = " ".join(args.query)
+        if not query:
+            p.error("a query is required unless --build is given")
+        index = load_vectors(args.docs_dir)
+        if index is None:
+            print(f"No vector index in {args.docs_dir}", file=sys.stderr)
+            return 2
+        hits = search_vectors(index, query, args.limit, per_topic=not args.all_sections)
+    except (RuntimeError, ImportError) as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    if not hits:
+        return 1
+
+    if args.json:
+        print(json.dumps([hit._asdict() for hit in hits], indent=2))
+    else:
+        print(format_results(args.docs_dir, query, hits))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())